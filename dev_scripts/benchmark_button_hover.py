@@ -0,0 +1,101 @@
+"""
+Benchmark painting of buttons while the mouse hovers rapidly over a menu.
+
+The script shows a menu with 50 LeftMenuButtons and 50 TitleButtons, moves
+the mouse pointer up and down across the buttons several times and reports
+the number of paint events together with the time spent in the buttons'
+paintEvent and the time of a full repaint of the menu.
+
+$ python dev_scripts/benchmark_button_hover.py
+"""
+
+from __future__ import annotations
+
+from PySide6.QtCore import QPoint
+from PySide6.QtTest import QTest
+from PySide6.QtWidgets import QApplication, QHBoxLayout, QVBoxLayout, QWidget
+
+from qute_style.dev.benchmark import (
+    PaintTimer,
+    best_of,
+    create_application,
+    print_results,
+)
+from qute_style.style import get_style
+from qute_style.widgets.left_menu_button import LeftMenuButton
+from qute_style.widgets.title_button import TitleButton
+
+BUTTONS = 50
+SWEEPS = 10
+STEP = 5
+
+
+def create_menu() -> QWidget:
+    """Create a menu with a column of LeftMenuButtons and TitleButtons."""
+    menu = QWidget()
+    menu.setStyleSheet(get_style())
+    layout = QHBoxLayout(menu)
+    left_column = QVBoxLayout()
+    right_column = QVBoxLayout()
+    layout.addLayout(left_column)
+    layout.addLayout(right_column)
+    for index in range(BUTTONS):
+        left_column.addWidget(
+            LeftMenuButton(
+                menu,
+                f"Menu entry {index}",
+                f"Tooltip {index}",
+                ":/svg_icons/home.svg",
+                None,
+            )
+        )
+        right_column.addWidget(
+            TitleButton(menu, f"Tooltip {index}", ":/svg_icons/close.svg")
+        )
+    left_column.itemAt(0).widget().set_active(True)
+    left_column.itemAt(1).widget().set_active_tab(True)
+    menu.show()
+    return menu
+
+
+def sweep(menu: QWidget, pos_x: int) -> int:
+    """Move the mouse down and up across the menu, return the moves."""
+    moves = 0
+    positions = range(0, menu.height(), STEP)
+    for _ in range(SWEEPS):
+        for pos_y in [*positions, *reversed(positions)]:
+            QTest.mouseMove(menu, QPoint(pos_x, pos_y))
+            QApplication.processEvents()
+            moves += 1
+    return moves
+
+
+def main() -> None:
+    """Run the benchmark."""
+    app = create_application()
+    menu = create_menu()
+    for _ in range(10):
+        app.processEvents()
+    left_x = menu.layout().itemAt(0).geometry().center().x()
+    right_x = menu.layout().itemAt(1).geometry().center().x()
+
+    results = []
+    for name, pos_x in (("LeftMenuButton", left_x), ("TitleButton", right_x)):
+        with PaintTimer(LeftMenuButton, TitleButton) as timer:
+            moves = sweep(menu, pos_x)
+        results += [
+            (f"{name} mouse moves", str(moves)),
+            (f"{name} paint events", str(timer.counts[name])),
+            (f"{name} paint time", f"{timer.durations[name] * 1000:.0f} ms"),
+            (f"{name} per paint", f"{timer.per_paint(name) * 1e6:.0f} µs"),
+        ]
+    repaint = best_of(menu.grab, repeat=20)
+    results.append(("full repaint", f"{repaint * 1000:.2f} ms"))
+    print_results(
+        f"Hovering over {BUTTONS} LeftMenuButtons and {BUTTONS} TitleButtons",
+        results,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark a CheckableComboBox and a SelectAllComboBox with many items.
+
+The script fills both combo boxes with 50.000 items, toggles single items and
+reports the time needed for filling (with addItem and with add_items),
+toggling an item (with a listener of selection_changed and of dataChanged),
+checking half of the items with set_item_ids and reading the checked item
+ids.
+
+$ python dev_scripts/benchmark_checkable_combobox.py
+"""
+
+from __future__ import annotations
+
+import time
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QStandardItemModel
+
+from qute_style.dev.benchmark import best_of, create_application, print_results
+from qute_style.widgets.styled_combobox import (
+    CheckableComboBox,
+    SelectAllComboBox,
+)
+
+ITEMS = 50_000
+TOGGLES = 20
+
+
+def benchmark(
+    combo_box_class: type[CheckableComboBox[int]],
+) -> list[tuple[str, str]]:
+    """Fill the combo box, toggle items and return the results."""
+    combo_box = combo_box_class()
+    start = time.perf_counter()
+    for idx in range(ITEMS):
+        combo_box.addItem(f"Item {idx}", idx)
+    add_item_time = time.perf_counter() - start
+
+    combo_box = combo_box_class()
+    start = time.perf_counter()
+    combo_box.add_items((f"Item {idx}", idx) for idx in range(ITEMS))
+    add_items_time = time.perf_counter() - start
+    combo_box.show()
+
+    model = combo_box.model()
+    assert isinstance(model, QStandardItemModel)
+    rows = range(model.rowCount() // 2, model.rowCount() // 2 + TOGGLES)
+    combo_box.selection_changed.connect(lambda added, removed: None)
+    start = time.perf_counter()
+    for row in rows:
+        model.item(row).setCheckState(Qt.CheckState.Checked)
+    toggle_time = (time.perf_counter() - start) / TOGGLES
+    combo_box.dataChanged.connect(lambda state: None)
+    start = time.perf_counter()
+    for row in rows:
+        model.item(row).setCheckState(Qt.CheckState.Unchecked)
+    full_state_time = (time.perf_counter() - start) / TOGGLES
+    ids_time = best_of(lambda: combo_box.item_ids)
+    start = time.perf_counter()
+    combo_box.set_item_ids(range(0, ITEMS, 2))
+    set_ids_time = time.perf_counter() - start
+    combo_box.close()
+    return [
+        ("fill with addItem", f"{add_item_time * 1000:.0f} ms"),
+        ("fill with add_items", f"{add_items_time * 1000:.0f} ms"),
+        ("toggle an item", f"{toggle_time * 1000:.2f} ms"),
+        ("toggle with dataChanged", f"{full_state_time * 1000:.2f} ms"),
+        ("set_item_ids (half)", f"{set_ids_time * 1000:.0f} ms"),
+        ("item_ids", f"{ids_time * 1000:.2f} ms"),
+    ]
+
+
+def main() -> None:
+    """Run the benchmark."""
+    create_application()
+    for combo_box_class in (CheckableComboBox, SelectAllComboBox):
+        print_results(
+            f"{combo_box_class.__name__} with {ITEMS} items",
+            benchmark(combo_box_class),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark the models of the CheckableComboBox with 100.000 items.
+
+The script fills a CheckableComboBox with 100.000 items, once with the
+QStandardItemModel and once with the compact CheckableListModel, and reports
+the memory used by the items (on Linux) and the time needed to open the popup
+and to toggle an item. Each model is measured in a separate process, so that
+the memory of one model does not distort the other.
+
+$ python dev_scripts/benchmark_checkable_list_model.py
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import time
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication
+
+from qute_style.dev.benchmark import (
+    create_application,
+    memory_usage,
+    print_results,
+)
+from qute_style.widgets.styled_combobox import CheckableComboBox
+
+ITEMS = 100_000
+ICON = ":/svg_icons/home.svg"
+
+
+def benchmark(compact: bool) -> list[tuple[str, str]]:
+    """Fill a combo box, open its popup and return the results."""
+    app = create_application()
+    combo_box_class = type(
+        "BenchmarkComboBox", (CheckableComboBox,), {"COMPACT_MODEL": compact}
+    )
+    combo_box = combo_box_class()
+    combo_box.resize(300, 30)
+    combo_box.show()
+    app.processEvents()
+
+    memory = memory_usage()
+    start = time.perf_counter()
+    combo_box.add_items(((f"Item {idx}", idx) for idx in range(ITEMS)), ICON)
+    fill_time = time.perf_counter() - start
+    items_memory = (
+        f"{(memory_usage() - memory) / 2**20:.1f} MiB"  # type: ignore
+        if memory is not None
+        else "n/a"
+    )
+
+    start = time.perf_counter()
+    combo_box.showPopup()
+    app.processEvents()
+    popup_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    combo_box.set_item_ids([ITEMS // 2])
+    app.processEvents()
+    toggle_time = time.perf_counter() - start
+    combo_box.hidePopup()
+    QApplication.processEvents()
+    assert combo_box.item_ids == [ITEMS // 2]
+    assert (
+        combo_box.model().flags(combo_box.model().index(0, 0))
+        & Qt.ItemFlag.ItemIsUserCheckable
+    )
+    return [
+        ("fill with add_items", f"{fill_time * 1000:.0f} ms"),
+        ("memory of the items", items_memory),
+        ("open the popup", f"{popup_time * 1000:.0f} ms"),
+        ("check an item (popup open)", f"{toggle_time * 1000:.0f} ms"),
+    ]
+
+
+def main() -> None:
+    """Run the benchmark, each model in its own process."""
+    if len(sys.argv) > 1:
+        compact = sys.argv[1] == "compact"
+        print_results(
+            f"CheckableComboBox with {ITEMS} items "
+            f"({'CheckableListModel' if compact else 'QStandardItemModel'})",
+            benchmark(compact),
+        )
+        return
+    for model in ("standard", "compact"):
+        subprocess.run([sys.executable, __file__, model], check=True)
+
+
+if __name__ == "__main__":
+    main()
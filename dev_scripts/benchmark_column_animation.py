@@ -0,0 +1,118 @@
+"""
+Benchmark the column animations of QuteStyleMainWindow.
+
+The script shows a QuteStyleMainWindow with a QTableView of 100.000 rows in
+the content area, opens and closes the left column a few times and reports
+the frame times of the animation together with the time spent painting the
+table. It runs once with the animation of the live frames and once with
+SNAPSHOT_ANIMATIONS.
+
+$ python dev_scripts/benchmark_column_animation.py
+"""
+
+from __future__ import annotations
+
+from benchmark_item_views import BenchmarkModel
+from PySide6.QtCore import QEventLoop
+from PySide6.QtGui import QPaintEvent
+from PySide6.QtWidgets import QTableView, QVBoxLayout
+
+from qute_style.dev.benchmark import (
+    FrameTimer,
+    PaintTimer,
+    create_application,
+    print_results,
+)
+from qute_style.qs_main_window import AppData, QuteStyleMainWindow
+from qute_style.widgets.base_widgets import BaseWidget, MainWidget
+
+TOGGLES = 6
+
+
+class BenchmarkTable(QTableView):
+    """QTableView whose paint events are timed."""
+
+    def paintEvent(self, event: QPaintEvent) -> None:  # noqa: N802
+        """Paint the table (overridden to be wrapped by the PaintTimer)."""
+        super().paintEvent(event)
+
+
+class TableWidget(MainWidget):
+    """MainWidget with a large table."""
+
+    NAME = "Table"
+    ICON = ":/svg_icons/home.svg"
+
+    def __init__(self) -> None:
+        """Create a new TableWidget."""
+        super().__init__()
+        view = BenchmarkTable()
+        view.setModel(BenchmarkModel(view))
+        view.setAlternatingRowColors(True)
+        QVBoxLayout(self).addWidget(view)
+
+
+class ColumnWidget(BaseWidget):
+    """Empty widget for the left column."""
+
+    NAME = "Column"
+    ICON = ":/svg_icons/home.svg"
+
+
+def toggle_column(snapshot: bool) -> list[tuple[str, str]]:
+    """Open and close the left column and return the results."""
+    window_class = type(
+        "BenchmarkWindow",
+        (QuteStyleMainWindow,),
+        {
+            "MAIN_WIDGET_CLASSES": [TableWidget],
+            "LEFT_WIDGET_CLASSES": [ColumnWidget],
+            "RIGHT_WIDGET_CLASSES": [],
+            "SNAPSHOT_ANIMATIONS": snapshot,
+        },
+    )
+    window = window_class(
+        AppData("Benchmark", "1.0.0", ":/svg_icons/no_icon.svg")
+    )
+    window.resize(1400, 900)
+    window.show()
+    create_application().processEvents()
+
+    # pylint: disable=protected-access
+    frame_timer = FrameTimer()
+    loop = QEventLoop()
+    window._group.finished.connect(loop.quit)
+    frame_times: list[float] = []
+    with PaintTimer(BenchmarkTable) as timer:
+        for _ in range(TOGGLES):
+            frame_timer.start()
+            window.on_left_column(ColumnWidget)
+            window._group.animationAt(0).valueChanged.connect(frame_timer.tick)
+            loop.exec()
+            frame_times += frame_timer.frame_times
+    window.close()
+    frame_timer.frame_times = frame_times
+    frames = max(len(frame_times), 1)
+    return [
+        *frame_timer.summary(),
+        ("table paint events", str(timer.counts["BenchmarkTable"])),
+        (
+            "table paint time per frame",
+            f"{timer.durations['BenchmarkTable'] * 1000 / frames:.2f} ms",
+        ),
+    ]
+
+
+def main() -> None:
+    """Run the benchmark."""
+    create_application()
+    for snapshot in (False, True):
+        print_results(
+            f"Opening and closing the left column {TOGGLES // 2} times next "
+            f"to a table ({'snapshot' if snapshot else 'live'} animation)",
+            toggle_column(snapshot),
+        )
+
+
+if __name__ == "__main__":
+    main()
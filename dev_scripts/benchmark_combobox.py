@@ -0,0 +1,80 @@
+"""
+Benchmark painting of a form with many combo boxes.
+
+The script repaints a form with 200 combo boxes that uses the QuteStyle style
+sheet and reports the time per repaint, once for plain QComboBoxes that are
+painted by the style sheet and once for StyledComboBoxes.
+
+$ python dev_scripts/benchmark_combobox.py
+"""
+
+from __future__ import annotations
+
+from PySide6.QtWidgets import QComboBox, QFormLayout, QWidget
+
+from qute_style.dev.benchmark import (
+    PaintCounter,
+    best_of,
+    create_application,
+    print_results,
+)
+from qute_style.style import get_style
+from qute_style.widgets.styled_combobox import StyledComboBox
+
+COMBO_BOXES = 200
+REPAINTS = 20
+
+
+def create_form(combo_box_class: type[QComboBox]) -> QWidget:
+    """Create a form with COMBO_BOXES combo boxes of the given class."""
+    form = QWidget()
+    form.setStyleSheet(get_style())
+    layout = QFormLayout(form)
+    for row in range(COMBO_BOXES):
+        combo_box = combo_box_class()
+        combo_box.addItems([f"Option {row}", "Other option"])
+        if row % 10 == 0:
+            combo_box.setEnabled(False)
+        layout.addRow(f"Row {row}", combo_box)
+    form.resize(600, COMBO_BOXES * 34)
+    form.show()
+    return form
+
+
+def repaint_time(combo_box_class: type[QComboBox]) -> float:
+    """Return the time in milliseconds to repaint the whole form."""
+    form = create_form(combo_box_class)
+
+    def repaint() -> None:
+        for _ in range(REPAINTS):
+            form.grab()
+
+    form.grab()
+    duration = best_of(repaint) * 1000 / REPAINTS
+    form.close()
+    return duration
+
+
+def main() -> None:
+    """Run the benchmark."""
+    create_application()
+    with PaintCounter() as counter:
+        create_form(StyledComboBox).grab()
+    style_sheet = repaint_time(QComboBox)
+    styled = repaint_time(StyledComboBox)
+    print_results(
+        f"Repainting a form with {COMBO_BOXES} combo boxes",
+        [
+            ("QComboBox (style sheet)", f"{style_sheet:.2f} ms"),
+            ("StyledComboBox", f"{styled:.2f} ms"),
+            ("speedup", f"{style_sheet / styled:.2f}x"),
+            (
+                "StyledComboBox paints per repaint",
+                str(counter.counts["StyledComboBox"]),
+            ),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark the search of a SelectAllComboBox with many items.
+
+The script fills a searchable SelectAllComboBox with 100.000 items, opens the
+popup and types queries into the search field. It reports the time needed
+for building the search index and for filtering per keystroke, including
+processing the events until the matches are shown. Then it renames and
+removes an item while the last query is shown, which updates the index.
+
+$ python dev_scripts/benchmark_combobox_search.py
+"""
+
+from __future__ import annotations
+
+import time
+
+from PySide6.QtWidgets import QApplication
+
+from qute_style.dev.benchmark import create_application, print_results
+from qute_style.widgets.styled_combobox import SelectAllComboBox
+
+ITEMS = 100_000
+QUERIES = ("I", "It", "Item", "Item 1", "Item 12", "Item 123", "Item 1234")
+
+
+class SearchComboBox(SelectAllComboBox[int]):
+    """SelectAllComboBox with a search field."""
+
+    SEARCHABLE = True
+
+
+def benchmark(app: QApplication) -> list[tuple[str, str]]:
+    """Type the queries into the search field and return the results."""
+    combo_box = SearchComboBox()
+    combo_box.add_items((f"Item {idx}", idx) for idx in range(ITEMS))
+    combo_box.show()
+    start = time.perf_counter()
+    combo_box._update_search_index()  # pylint: disable=protected-access
+    results = [
+        ("build index", f"{(time.perf_counter() - start) * 1000:.0f} ms")
+    ]
+    combo_box.showPopup()
+    app.processEvents()
+    search_field = combo_box._search_field  # pylint: disable=protected-access
+    assert search_field is not None
+    for query in QUERIES:
+        start = time.perf_counter()
+        search_field.setText(query)
+        app.processEvents()
+        rows = combo_box._filtered_rows()  # pylint: disable=protected-access
+        assert rows is not None
+        results.append(
+            (
+                f"search {query!r} ({len(rows) - 1} matches)",
+                f"{(time.perf_counter() - start) * 1000:.1f} ms",
+            )
+        )
+    for name, change in (
+        ("rename", lambda: combo_box.setItemText(2, "Renamed")),
+        ("remove", lambda: combo_box.removeItem(3)),
+    ):
+        start = time.perf_counter()
+        change()
+        app.processEvents()
+        results.append(
+            (
+                f"{name} an item while searching",
+                f"{(time.perf_counter() - start) * 1000:.1f} ms",
+            )
+        )
+    combo_box.hidePopup()
+    combo_box.close()
+    return results
+
+
+def main() -> None:
+    """Run the benchmark."""
+    app = create_application()
+    print_results(
+        f"Searching a SelectAllComboBox with {ITEMS} items", benchmark(app)
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark the repaints caused by moving the mouse over the main window.
+
+The script shows the example QuteStyleMainWindow, sweeps the mouse pointer
+line by line across the whole window and reports the number of paint events
+per widget class together with the time needed to process the mouse moves
+(which is dominated by painting).
+
+$ python dev_scripts/benchmark_hover.py
+"""
+
+from __future__ import annotations
+
+import time
+
+from PySide6.QtCore import QPoint
+from PySide6.QtTest import QTest
+from PySide6.QtWidgets import QApplication, QWidget
+
+from qute_style.dev.benchmark import (
+    PaintCounter,
+    create_application,
+    print_results,
+)
+from qute_style.qs_main_window import AppData
+from qute_style_examples.sample_main_window import StyledMainWindow
+from qute_style_examples.sample_widgets import TestWidget
+
+# Distance between two mouse positions on a line and between two lines.
+STEP = 8
+LINE_DISTANCE = 24
+
+
+def sweep(window: QWidget) -> int:
+    """Move the mouse across the window line by line, return the moves."""
+    moves = 0
+    for line, pos_y in enumerate(range(0, window.height(), LINE_DISTANCE)):
+        positions = range(0, window.width(), STEP)
+        for pos_x in positions if line % 2 == 0 else reversed(positions):
+            QTest.mouseMove(window, QPoint(pos_x, pos_y))
+            QApplication.processEvents()
+            moves += 1
+    return moves
+
+
+def main() -> None:
+    """Run the benchmark."""
+    app = create_application()
+    window = StyledMainWindow(
+        AppData("Benchmark", "1.0.0", ":/svg_icons/no_icon.svg")
+    )
+    window.resize(1400, 900)
+    window.show()
+    window.on_main_widget(TestWidget)
+    for _ in range(20):
+        app.processEvents()
+
+    with PaintCounter() as counter:
+        start = time.perf_counter()
+        moves = sweep(window)
+        duration = time.perf_counter() - start
+
+    print_results(
+        f"Sweeping the mouse across a {window.width()}x{window.height()} "
+        f"main window",
+        [
+            ("mouse moves", str(moves)),
+            ("paint events", str(counter.total)),
+            ("processing time", f"{duration * 1000:.0f} ms"),
+            ("per mouse move", f"{duration / moves * 1e6:.0f} µs"),
+        ],
+    )
+    print_results(
+        "Paint events per widget class",
+        [(name, str(count)) for name, count in counter.counts.most_common()],
+    )
+
+
+if __name__ == "__main__":
+    main()
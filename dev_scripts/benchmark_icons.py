@@ -0,0 +1,51 @@
+"""
+Benchmark repainting many Icons.
+
+The script shows 500 Icons in a grid, like the version history of the
+HomePage, and reports the time needed to repaint all of them and the time
+spent in the paintEvent of an Icon.
+
+$ python dev_scripts/benchmark_icons.py
+"""
+
+from __future__ import annotations
+
+from PySide6.QtWidgets import QGridLayout, QWidget
+
+from qute_style.dev.benchmark import (
+    PaintTimer,
+    best_of,
+    create_application,
+    print_results,
+)
+from qute_style.widgets.icon import Icon
+
+ICONS = 500
+COLUMNS = 25
+
+
+def main() -> None:
+    """Run the benchmark."""
+    app = create_application()
+    widget = QWidget()
+    layout = QGridLayout(widget)
+    for idx in range(ICONS):
+        icon = Icon(radius=18)
+        icon.set_icon(":/svg_icons/home.svg")
+        layout.addWidget(icon, idx // COLUMNS, idx % COLUMNS)
+    widget.show()
+    app.processEvents()
+    widget.grab()
+    with PaintTimer(Icon) as timer:
+        repaint_time = best_of(widget.grab, repeat=20)
+    print_results(
+        f"Repainting {ICONS} Icons",
+        [
+            ("repaint", f"{repaint_time * 1000:.2f} ms"),
+            ("Icon.paintEvent", f"{timer.per_paint('Icon') * 1e6:.1f} µs"),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Benchmark painting of large item views with and without the fast path.
+
+The script scrolls a QTableView with 100.000 rows page by page through a
+window that uses the QuteStyle style sheet and reports the rows painted per
+second, once with the default rendering and once with `set_fast_path`.
+
+$ python dev_scripts/benchmark_item_views.py
+"""
+
+from __future__ import annotations
+
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QPersistentModelIndex,
+    Qt,
+)
+from PySide6.QtWidgets import QTableView, QVBoxLayout, QWidget
+
+from qute_style.dev.benchmark import best_of, create_application, print_results
+from qute_style.style import get_style
+from qute_style.widgets.item_delegate import set_fast_path
+
+ROWS = 100_000
+COLUMNS = 5
+PAGES = 50
+
+
+class BenchmarkModel(QAbstractTableModel):
+    """Table model with a checkable first column."""
+
+    def rowCount(  # noqa: N802
+        self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()
+    ) -> int:
+        """Return the number of rows."""
+        return 0 if parent.isValid() else ROWS
+
+    def columnCount(  # noqa: N802
+        self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()
+    ) -> int:
+        """Return the number of columns."""
+        return 0 if parent.isValid() else COLUMNS
+
+    def data(
+        self,
+        index: QModelIndex | QPersistentModelIndex,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> str | Qt.CheckState | None:
+        """Return the data for the given index."""
+        if role == Qt.ItemDataRole.DisplayRole:
+            return f"Row {index.row()} column {index.column()}"
+        if role == Qt.ItemDataRole.CheckStateRole and index.column() == 0:
+            return (
+                Qt.CheckState.Checked
+                if index.row() % 3
+                else Qt.CheckState.Unchecked
+            )
+        return None
+
+
+def scroll_pages(view: QTableView) -> None:
+    """Scroll through the view page by page and paint every page."""
+    scroll_bar = view.verticalScrollBar()
+    for page in range(PAGES):
+        scroll_bar.setValue(page * scroll_bar.pageStep())
+        view.viewport().repaint()
+
+
+def rows_per_second(view: QTableView) -> float:
+    """Return the number of rows painted per second while scrolling."""
+    visible_rows = view.rowAt(view.viewport().height() - 1) - view.rowAt(0)
+    return visible_rows * PAGES / best_of(lambda: scroll_pages(view))
+
+
+def main() -> None:
+    """Run the benchmark."""
+    app = create_application()
+    window = QWidget()
+    window.setStyleSheet(get_style())
+    view = QTableView()
+    view.setModel(BenchmarkModel(view))
+    view.setAlternatingRowColors(True)
+    QVBoxLayout(window).addWidget(view)
+    window.resize(1000, 900)
+    window.show()
+    app.processEvents()
+
+    default = rows_per_second(view)
+    set_fast_path(view)
+    fast = rows_per_second(view)
+    print_results(
+        f"Painting a {ROWS} row table ({COLUMNS} columns)",
+        [
+            ("style sheet rendering", f"{default:.0f} rows/s"),
+            ("fast path", f"{fast:.0f} rows/s"),
+            ("speedup", f"{fast / default:.2f}x"),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark maximizing and restoring a QuteStyleMainWindow.
+
+The script shows the example QuteStyleMainWindow with its widget gallery,
+maximizes and restores it a few times and reports the time needed for a
+round trip (including processing the events until the window is painted)
+together with the number of widgets whose style changed.
+
+$ python dev_scripts/benchmark_maximize.py
+"""
+
+from __future__ import annotations
+
+import statistics
+import time
+
+from PySide6.QtCore import QEvent
+from PySide6.QtWidgets import QApplication, QWidget
+
+from qute_style.dev.benchmark import (
+    EventCounter,
+    create_application,
+    print_results,
+)
+from qute_style.qs_main_window import AppData
+from qute_style_examples.sample_main_window import StyledMainWindow
+from qute_style_examples.sample_widgets import TestWidget
+
+ROUND_TRIPS = 10
+
+
+def round_trip(app: QApplication, window: QWidget) -> float:
+    """Maximize and restore the window, return the duration in seconds."""
+    start = time.perf_counter()
+    window.showMaximized()
+    app.processEvents()
+    window.showNormal()
+    app.processEvents()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark."""
+    app = create_application()
+    window = StyledMainWindow(
+        AppData("Benchmark", "1.0.0", ":/svg_icons/no_icon.svg")
+    )
+    window.resize(1400, 900)
+    window.show()
+    window.on_main_widget(TestWidget)
+    for _ in range(20):
+        app.processEvents()
+
+    with EventCounter(QEvent.Type.StyleChange) as counter:
+        durations = [round_trip(app, window) for _ in range(ROUND_TRIPS)]
+
+    print_results(
+        f"Maximizing and restoring a main window with "
+        f"{len(window.findChildren(QWidget))} widgets",
+        [
+            (
+                "round trip (median)",
+                f"{statistics.median(durations) * 1000:.1f} ms",
+            ),
+            ("round trip (max)", f"{max(durations) * 1000:.1f} ms"),
+            (
+                "restyled widgets per round trip",
+                f"{counter.total / ROUND_TRIPS:.0f}",
+            ),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark the expand and collapse animation of a LeftMenu with 60 buttons.
+
+The script shows a LeftMenu with 60 main widget buttons next to an empty
+content area, expands and collapses the menu a few times and reports the
+frame times of the animation together with the time spent in the
+LeftMenuButtons' paintEvent.
+
+$ python dev_scripts/benchmark_menu_animation.py
+"""
+
+from __future__ import annotations
+
+from PySide6.QtCore import QEventLoop
+from PySide6.QtWidgets import QFrame, QHBoxLayout, QWidget
+
+from qute_style.dev.benchmark import (
+    FrameTimer,
+    PaintTimer,
+    create_application,
+    print_results,
+)
+from qute_style.style import get_style
+from qute_style.widgets.base_widgets import MainWidget
+from qute_style.widgets.left_menu import LeftMenu
+from qute_style.widgets.left_menu_button import LeftMenuButton
+
+BUTTONS = 60
+TOGGLES = 4
+
+
+def create_window() -> tuple[QWidget, LeftMenu]:
+    """Create a window with a LeftMenu like QuteStyleMainWindow does."""
+    window = QWidget()
+    window.setStyleSheet(get_style())
+    layout = QHBoxLayout(window)
+    left_menu_frame = QFrame()
+    left_menu_layout = QHBoxLayout(left_menu_frame)
+    left_menu_layout.setContentsMargins(3, 3, 3, 3)
+    widgets: list[type[MainWidget]] = [
+        type(
+            f"Widget{index}",
+            (MainWidget,),
+            {"NAME": f"Main widget {index}", "ICON": ":/svg_icons/home.svg"},
+        )
+        for index in range(BUTTONS)
+    ]
+    left_menu = LeftMenu(left_menu_frame, window, widgets, [])
+    left_menu_layout.addWidget(left_menu)
+    left_menu_frame.setFixedWidth(left_menu.minimumWidth() + 6)
+    layout.addWidget(left_menu_frame)
+    layout.addWidget(QWidget(), 1)
+    window.resize(1200, BUTTONS * 51 + 100)
+    window.show()
+    return window, left_menu
+
+
+def main() -> None:
+    """Run the benchmark."""
+    app = create_application()
+    _, left_menu = create_window()
+    for _ in range(10):
+        app.processEvents()
+    # pylint: disable=protected-access
+    animation = left_menu._animation
+    frame_timer = FrameTimer()
+    animation.valueChanged.connect(frame_timer.tick)
+    loop = QEventLoop()
+    animation.finished.connect(loop.quit)
+
+    frame_times: list[float] = []
+    with PaintTimer(LeftMenuButton) as timer:
+        for _ in range(TOGGLES):
+            frame_timer.start()
+            left_menu.toggle_animation()
+            loop.exec()
+            frame_times += frame_timer.frame_times
+    frame_timer.frame_times = frame_times
+    frames = len(frame_times)
+    print_results(
+        f"Expanding and collapsing a LeftMenu with {BUTTONS} buttons "
+        f"{TOGGLES // 2} times",
+        [
+            *frame_timer.summary(),
+            ("button paint events", str(timer.counts["LeftMenuButton"])),
+            (
+                "button paint time per frame",
+                f"{timer.durations['LeftMenuButton'] * 1000 / frames:.2f} ms",
+            ),
+            (
+                "per paint",
+                f"{timer.per_paint('LeftMenuButton') * 1e6:.0f} µs",
+            ),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+Benchmark resizing a QuteStyleMainWindow with its grips.
+
+The script shows the example QuteStyleMainWindow and drags its bottom right
+CornerGrip with a mouse that reports its position every 2 ms (like a 500 Hz
+mouse) for two seconds at 500 pixels per second. It reports how often the
+window geometry was set and the frame times of the window for each
+ResizeMode. SYSTEM needs a window system that supports it and falls back to
+COALESCED otherwise. With OUTLINE, the window isn't repainted until the mouse
+is released.
+
+$ python dev_scripts/benchmark_resize.py
+"""
+
+from __future__ import annotations
+
+import time
+
+from PySide6.QtCore import QEvent, QObject, QPoint, QPointF, Qt
+from PySide6.QtGui import QMouseEvent
+from PySide6.QtWidgets import QApplication, QWidget
+
+from qute_style.dev.benchmark import (
+    EventCounter,
+    FrameTimer,
+    create_application,
+    print_results,
+)
+from qute_style.qs_main_window import AppData
+from qute_style.widgets.grips import CornerGrip, ResizeMode
+from qute_style_examples.sample_main_window import StyledMainWindow
+from qute_style_examples.sample_widgets import TestWidget
+
+# Interval between two mouse moves in ms, duration of the drag in s and the
+# speed of the mouse in pixels per second.
+MOVE_INTERVAL = 2
+DURATION = 2
+SPEED = 500
+
+
+class PaintTicker(QObject):
+    """Tick a FrameTimer whenever the watched widget is painted."""
+
+    def __init__(self, frame_timer: FrameTimer) -> None:
+        """Create a new PaintTicker."""
+        super().__init__()
+        self._frame_timer = frame_timer
+
+    def eventFilter(self, _: QObject, event: QEvent) -> bool:  # noqa: N802
+        """Tick the frame timer on paint events."""
+        if event.type() == QEvent.Type.Paint:
+            self._frame_timer.tick()
+        return False
+
+
+def send_mouse(grip: QWidget, kind: QEvent.Type, global_pos: QPoint) -> None:
+    """Send a mouse event at the global position to the grip."""
+    buttons = (
+        Qt.MouseButton.NoButton
+        if kind == QEvent.Type.MouseButtonRelease
+        else Qt.MouseButton.LeftButton
+    )
+    QApplication.sendEvent(
+        grip,
+        QMouseEvent(
+            kind,
+            QPointF(grip.mapFromGlobal(global_pos)),
+            QPointF(global_pos),
+            Qt.MouseButton.LeftButton,
+            buttons,
+            Qt.KeyboardModifier.NoModifier,
+        ),
+    )
+
+
+def drag(app: QApplication, mode: ResizeMode) -> list[tuple[str, str]]:
+    """Drag the bottom right grip of a new window and return the results."""
+    window_class = type(
+        "BenchmarkWindow", (StyledMainWindow,), {"RESIZE_MODE": mode}
+    )
+    window = window_class(
+        AppData("Benchmark", "1.0.0", ":/svg_icons/no_icon.svg")
+    )
+    window.resize(1000, 700)
+    window.show()
+    window.on_main_widget(TestWidget)
+    for _ in range(20):
+        app.processEvents()
+    # The bottom right grip
+    grip = max(
+        window.findChildren(CornerGrip), key=lambda grip: grip.x() + grip.y()
+    )
+    start_pos = grip.mapToGlobal(QPoint(5, 5))
+
+    frame_timer = FrameTimer()
+    ticker = PaintTicker(frame_timer)
+    window.installEventFilter(ticker)
+    updates = []
+    grip.window_geometry_changed.connect(updates.append)
+    moves = 0
+    with EventCounter(QEvent.Type.Resize) as counter:
+        frame_timer.start()
+        start = time.perf_counter()
+        send_mouse(grip, QEvent.Type.MouseButtonPress, start_pos)
+        while (elapsed := time.perf_counter() - start) < DURATION:
+            moves += 1
+            offset = int(elapsed * SPEED)
+            send_mouse(
+                grip,
+                QEvent.Type.MouseMove,
+                start_pos + QPoint(offset, offset // 2),
+            )
+            # Process events until the next mouse move is due
+            while (time.perf_counter() - start) * 1000 < moves * MOVE_INTERVAL:
+                app.processEvents()
+        send_mouse(
+            grip,
+            QEvent.Type.MouseButtonRelease,
+            start_pos + QPoint(DURATION * SPEED, DURATION * SPEED // 2),
+        )
+        app.processEvents()
+        duration = time.perf_counter() - start
+    window.removeEventFilter(ticker)
+    window.close()
+    results = [
+        ("mouse moves", str(moves)),
+        ("geometry updates", str(len(updates))),
+        ("updates per second", f"{len(updates) / duration:.0f}"),
+        ("resize events", str(counter.counts[window_class.__name__])),
+    ]
+    if mode != ResizeMode.OUTLINE:
+        results += frame_timer.summary()
+    return results
+
+
+def main() -> None:
+    """Run the benchmark."""
+    app = create_application()
+    for mode in ResizeMode:
+        print_results(f"Resizing with ResizeMode.{mode.name}", drag(app, mode))
+
+
+if __name__ == "__main__":
+    main()
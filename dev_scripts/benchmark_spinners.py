@@ -0,0 +1,84 @@
+"""
+Benchmark the idle CPU usage of many WaitingSpinners.
+
+The script shows 50 spinning WaitingSpinners spread across the tabs of a
+QTabWidget and lets the event loop idle for a few seconds. It reports the CPU
+time used together with the paint events of the spinners, once with the
+window shown and once with the window hidden.
+
+$ python dev_scripts/benchmark_spinners.py
+"""
+
+from __future__ import annotations
+
+import time
+
+from PySide6.QtCore import QEventLoop, QTimer
+from PySide6.QtWidgets import QGridLayout, QTabWidget, QWidget
+
+from qute_style.dev.benchmark import (
+    PaintCounter,
+    create_application,
+    print_results,
+)
+from qute_style.helper import create_waiting_spinner
+from qute_style.widgets.spinner import SpinnerClock
+
+SPINNERS = 50
+TABS = 10
+IDLE_SECONDS = 3
+
+
+def create_tabs() -> QTabWidget:
+    """Create the tab widget with the spinning spinners."""
+    tabs = QTabWidget()
+    per_tab = SPINNERS // TABS
+    for tab in range(TABS):
+        page = QWidget()
+        layout = QGridLayout(page)
+        for column in range(per_tab):
+            cell = QWidget()
+            cell.setFixedSize(80, 80)
+            layout.addWidget(cell, 0, column)
+            create_waiting_spinner(cell).start()
+        tabs.addTab(page, f"Tab {tab + 1}")
+    return tabs
+
+
+def idle() -> list[tuple[str, str]]:
+    """Let the event loop idle and return the results."""
+    loop = QEventLoop()
+    QTimer.singleShot(IDLE_SECONDS * 1000, loop.quit)
+    with PaintCounter() as counter:
+        start = time.process_time()
+        loop.exec()
+        cpu_time = time.process_time() - start
+    return [
+        ("cpu time", f"{cpu_time * 1000:.0f} ms"),
+        ("cpu usage", f"{cpu_time / IDLE_SECONDS * 100:.1f} %"),
+        ("spinner paint events", str(counter.counts["StyledWaitingSpinner"])),
+        ("clock ticking", str(SpinnerClock.inst().is_ticking)),
+    ]
+
+
+def main() -> None:
+    """Run the benchmark."""
+    app = create_application()
+    tabs = create_tabs()
+    tabs.show()
+    app.processEvents()
+    print_results(
+        f"Idling {IDLE_SECONDS} s with {SPINNERS} spinners on {TABS} tabs",
+        idle(),
+    )
+    tabs.hide()
+    app.processEvents()
+    print_results(
+        f"Idling {IDLE_SECONDS} s with {SPINNERS} spinners in a hidden "
+        f"window",
+        idle(),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark creating the tooltips of a menu with many buttons.
+
+The script creates a window with a LeftMenu-like column of 60
+LeftMenuButtons and reports the time needed to create the buttons, the
+number of widgets and graphics effects of the window and the time needed to
+show the tooltip of a button when it's hovered.
+
+$ python dev_scripts/benchmark_tooltips.py
+"""
+
+from __future__ import annotations
+
+from PySide6.QtCore import QEvent, QPointF
+from PySide6.QtGui import QEnterEvent
+from PySide6.QtWidgets import QGraphicsEffect, QVBoxLayout, QWidget
+
+from qute_style.dev.benchmark import best_of, create_application, print_results
+from qute_style.widgets.left_menu_button import LeftMenuButton
+
+BUTTONS = 60
+
+
+def create_menu(app_parent: QWidget) -> list[LeftMenuButton[None]]:
+    """Create the buttons of the menu in the given window."""
+    menu = QWidget(app_parent)
+    # A collapsed menu, the buttons show their tooltips
+    menu.setFixedWidth(LeftMenuButton.FIXED_HEIGHT)
+    layout = QVBoxLayout(menu)
+    layout.setContentsMargins(0, 0, 0, 0)
+    buttons = []
+    for idx in range(BUTTONS):
+        button: LeftMenuButton[None] = LeftMenuButton(
+            app_parent,
+            f"Entry {idx}",
+            f"Tooltip of entry {idx}",
+            ":/svg_icons/home.svg",
+            None,
+        )
+        layout.addWidget(button)
+        buttons.append(button)
+    return buttons
+
+
+def hover(button: LeftMenuButton[None]) -> None:
+    """Enter and leave the button."""
+    button.enterEvent(QEnterEvent(QPointF(), QPointF(), QPointF()))
+    button.leaveEvent(QEvent(QEvent.Type.Leave))
+
+
+def main() -> None:
+    """Run the benchmark."""
+    app = create_application()
+    create_time = best_of(lambda: create_menu(QWidget()))
+    app_parent = QWidget()
+    buttons = create_menu(app_parent)
+    app_parent.resize(400, BUTTONS * LeftMenuButton.FIXED_HEIGHT + 100)
+    app_parent.show()
+    app.processEvents()
+    results = [
+        ("create buttons", f"{create_time * 1000:.1f} ms"),
+        ("widgets", str(len(app_parent.findChildren(QWidget)))),
+        (
+            "graphics effects",
+            str(len(app_parent.findChildren(QGraphicsEffect))),
+        ),
+    ]
+    hover_time = best_of(lambda: hover(buttons[BUTTONS // 2]), repeat=20)
+    results += [
+        ("hover a button", f"{hover_time * 1000:.2f} ms"),
+        ("widgets after hovering", str(len(app_parent.findChildren(QWidget)))),
+    ]
+    print_results(f"Menu with {BUTTONS} LeftMenuButtons", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Benchmark repainting a window with a shadowed BackgroundFrame.
+
+The script creates a frameless, translucent window like QuteStyleMainWindow
+with a BackgroundFrame that contains a grid of widgets and a WaitingSpinner.
+It reports the time needed to repaint the spinner (one frame of its
+animation) and to repaint the whole window, once with the nine-patch shadow
+of the BackgroundFrame and once with a QGraphicsDropShadowEffect instead.
+
+$ python dev_scripts/benchmark_window_shadow.py
+"""
+
+from __future__ import annotations
+
+import statistics
+import time
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QColor
+from PySide6.QtWidgets import (
+    QApplication,
+    QGraphicsDropShadowEffect,
+    QGridLayout,
+    QLabel,
+    QLineEdit,
+    QPushButton,
+    QVBoxLayout,
+    QWidget,
+)
+
+from qute_style.dev.benchmark import (
+    PaintCounter,
+    create_application,
+    print_results,
+)
+from qute_style.helper import create_waiting_spinner
+from qute_style.style import get_style
+from qute_style.widgets.background_frame import BackgroundFrame
+
+ROWS = 20
+FRAMES = 200
+
+
+def create_window() -> tuple[QWidget, QWidget]:
+    """Create the window and return it together with the spinner."""
+    window = QWidget()
+    window.setWindowFlag(Qt.WindowType.FramelessWindowHint)
+    window.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+    window.setStyleSheet(get_style())
+    layout = QVBoxLayout(window)
+    layout.setContentsMargins(10, 10, 10, 10)
+    background = BackgroundFrame()
+    layout.addWidget(background)
+    content = QWidget()
+    grid = QGridLayout(content)
+    for row in range(ROWS):
+        grid.addWidget(QLabel(f"Label {row}"), row, 0)
+        grid.addWidget(QLineEdit(f"Text {row}"), row, 1)
+        grid.addWidget(QPushButton(f"Button {row}"), row, 2)
+    background.layout().addWidget(content)
+    spinner_cell = QWidget()
+    spinner_cell.setFixedSize(100, 100)
+    background.layout().addWidget(spinner_cell)
+    spinner = create_waiting_spinner(spinner_cell)
+    spinner.start()
+    window.resize(1200, 800)
+    return window, spinner
+
+
+def frame_times(
+    app: QApplication, widget: QWidget
+) -> tuple[list[float], PaintCounter]:
+    """Update the widget FRAMES times and return the durations in ms."""
+    durations = []
+    with PaintCounter() as counter:
+        for _ in range(FRAMES):
+            start = time.perf_counter()
+            widget.update()
+            app.processEvents()
+            durations.append((time.perf_counter() - start) * 1000)
+    return durations, counter
+
+
+def add_effect(window: QWidget) -> None:
+    """Replace the shadow of the BackgroundFrame with a graphics effect."""
+    background = window.findChild(BackgroundFrame)
+    background.shadow_visible = False
+    shadow = QGraphicsDropShadowEffect(background)
+    shadow.setBlurRadius(20)
+    shadow.setOffset(0)
+    shadow.setColor(QColor(0, 0, 0, 160))
+    background.setGraphicsEffect(shadow)
+
+
+def benchmark(app: QApplication, effect: bool) -> None:
+    """Repaint the spinner and the window and print the results."""
+    window, spinner = create_window()
+    if effect:
+        add_effect(window)
+    window.show()
+    app.processEvents()
+    spinner_times, counter = frame_times(app, spinner)
+    window_times, _ = frame_times(app, window)
+    window.close()
+    shadow = "QGraphicsDropShadowEffect" if effect else "nine-patch shadow"
+    print_results(
+        f"Repainting a {window.width()}x{window.height()} window ({shadow})",
+        [
+            (
+                "spinner frame (median)",
+                f"{statistics.median(spinner_times):.2f} ms",
+            ),
+            ("spinner frame (max)", f"{max(spinner_times):.2f} ms"),
+            (
+                "paint events per spinner frame",
+                f"{counter.total / FRAMES:.0f}",
+            ),
+            ("window (median)", f"{statistics.median(window_times):.2f} ms"),
+        ],
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    app = create_application()
+    benchmark(app, effect=False)
+    benchmark(app, effect=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+"""Central policy for the animations of the QuteStyle widgets."""
+
+from __future__ import annotations
+
+import logging
+import statistics
+import weakref
+from enum import Enum
+
+from PySide6.QtCore import (
+    QAbstractAnimation,
+    QElapsedTimer,
+    QObject,
+    QVariantAnimation,
+    Signal,
+    Slot,
+)
+
+log = logging.getLogger(
+    f"qute_style.{__name__}"
+)  # pylint: disable=invalid-name
+
+
+class AnimationPolicy(Enum):
+    """Define how the QuteStyle widgets are animated."""
+
+    # Animations run with their full duration.
+    FULL = "full"
+    # Animations are shorter and continuous animations update less often.
+    REDUCED = "reduced"
+    # Animations jump to their end state and continuous animations stand still.
+    OFF = "off"
+
+
+class AnimationPolicyManager(QObject):
+    """
+    Global handler of the AnimationPolicy.
+
+    To use, get the current instance with AnimationPolicyManager.inst(). The
+    built-in animations get their duration with `configure` right before they
+    are started and timer based animations (like the WaitingSpinner) their
+    interval with `interval`, so that they follow the current policy.
+
+    If `automatic` is set, the frame times of the configured animations are
+    measured. When the median frame time of an animation exceeds the
+    FRAME_BUDGET (e.g. over a remote desktop connection), the policy is
+    reduced from FULL to REDUCED and from REDUCED to OFF.
+
+    An automatic reduction isn't permanent: after RECOVERY_ANIMATIONS
+    animations in a row with a median frame time within the RECOVERY_BUDGET,
+    the policy is raised again by one step. Since nothing is measured with
+    OFF, the next animation after RECOVERY_INTERVAL runs with REDUCED again
+    to try it. The policy is never raised above the one that was set.
+    """
+
+    INST: AnimationPolicyManager | None = None
+
+    policy_changed = Signal(AnimationPolicy, name="policy_changed")
+
+    # Factor for the duration of animations with the REDUCED policy.
+    REDUCED_DURATION = 0.4
+    # Factor for the interval of timer based animations with REDUCED policy.
+    REDUCED_INTERVAL = 2
+    # Maximum median frame time in milliseconds (30 frames per second).
+    FRAME_BUDGET = 1000 / 30
+    # Minimum number of frames of an animation to judge its frame times.
+    MIN_FRAMES = 4
+    # Maximum median frame time in milliseconds to raise the policy again,
+    # the gap to the FRAME_BUDGET keeps the policy from toggling.
+    RECOVERY_BUDGET = FRAME_BUDGET / 2
+    # Number of animations in a row within the RECOVERY_BUDGET to raise the
+    # policy again.
+    RECOVERY_ANIMATIONS = 5
+    # Time in milliseconds after which OFF is raised to REDUCED again.
+    RECOVERY_INTERVAL = 60_000
+
+    def __init__(self) -> None:
+        """Create a new AnimationPolicyManager instance."""
+        assert not AnimationPolicyManager.INST
+        super().__init__()
+        self._policy = AnimationPolicy.FULL
+        self.automatic = True
+        # Number of automatic reductions of the policy that was set.
+        self._reductions = 0
+        # Number of animations in a row within the RECOVERY_BUDGET.
+        self._fast_animations = 0
+        # Time since the policy was automatically reduced to OFF.
+        self._since_off = QElapsedTimer()
+        # Monitors of the configured animations that are currently running.
+        self._running: weakref.WeakSet[_FrameMonitor] = weakref.WeakSet()
+
+    @classmethod
+    def inst(cls) -> AnimationPolicyManager:
+        """Return the current instance of the AnimationPolicyManager."""
+        if not AnimationPolicyManager.INST:
+            AnimationPolicyManager.INST = AnimationPolicyManager()
+        return AnimationPolicyManager.INST
+
+    @property
+    def policy(self) -> AnimationPolicy:
+        """Return the current AnimationPolicy."""
+        return self._policy
+
+    @policy.setter
+    def policy(self, policy: AnimationPolicy) -> None:
+        """Set the AnimationPolicy and notify running animations."""
+        self._reductions = 0
+        self._set_policy(policy)
+
+    def _set_policy(self, policy: AnimationPolicy) -> None:
+        """Set the AnimationPolicy without resetting the reductions."""
+        self._fast_animations = 0
+        if policy != self._policy:
+            log.debug("Setting animation policy to %s", policy)
+            self._policy = policy
+            self.policy_changed.emit(policy)
+
+    @property
+    def animation_running(self) -> bool:
+        """Return if one of the configured animations is running."""
+        return bool(self._running)
+
+    def duration(self, duration: int) -> int:
+        """Return the duration in ms of an animation for the policy."""
+        if self._policy == AnimationPolicy.OFF:
+            return 0
+        if self._policy == AnimationPolicy.REDUCED:
+            return int(duration * self.REDUCED_DURATION)
+        return duration
+
+    def interval(self, interval: int) -> int:
+        """Return the interval in ms of a timer based animation."""
+        if self._policy == AnimationPolicy.REDUCED:
+            return interval * self.REDUCED_INTERVAL
+        return interval
+
+    def configure(self, animation: QVariantAnimation, duration: int) -> None:
+        """
+        Set the duration of the animation according to the policy.
+
+        The frame times of the animation are measured from now on to
+        automatically adapt the policy.
+        """
+        if (
+            self.automatic
+            and self._reductions
+            and self._policy == AnimationPolicy.OFF
+            and self._since_off.elapsed() >= self.RECOVERY_INTERVAL
+        ):
+            log.info("Trying reduced animations again")
+            self._raise_policy()
+        animation.setDuration(self.duration(duration))
+        if not animation.findChild(_FrameMonitor):
+            _FrameMonitor(animation)
+
+    def report_frame_times(self, frame_times: list[float]) -> None:
+        """
+        Adapt the policy to the frame times of an animation.
+
+        The policy is reduced if the frame times exceed the FRAME_BUDGET and
+        raised again after an automatic reduction if the frame times of
+        enough animations in a row are within the RECOVERY_BUDGET.
+        """
+        if not self.automatic or len(frame_times) < self.MIN_FRAMES:
+            return
+        median = statistics.median(frame_times)
+        if median > self.FRAME_BUDGET:
+            log.info(
+                "Median frame time of %.1f ms exceeds the budget of %.1f ms",
+                median,
+                self.FRAME_BUDGET,
+            )
+            self._reduce_policy()
+        elif self._reductions and median <= self.RECOVERY_BUDGET:
+            self._fast_animations += 1
+            if self._fast_animations >= self.RECOVERY_ANIMATIONS:
+                log.info(
+                    "Median frame times of %s animations within %.1f ms",
+                    self._fast_animations,
+                    self.RECOVERY_BUDGET,
+                )
+                self._raise_policy()
+        else:
+            self._fast_animations = 0
+
+    def _reduce_policy(self) -> None:
+        """Reduce the policy by one step."""
+        if self._policy == AnimationPolicy.FULL:
+            self._reductions += 1
+            self._set_policy(AnimationPolicy.REDUCED)
+        elif self._policy == AnimationPolicy.REDUCED:
+            self._reductions += 1
+            self._since_off.start()
+            self._set_policy(AnimationPolicy.OFF)
+
+    def _raise_policy(self) -> None:
+        """Raise the policy by one step after an automatic reduction."""
+        self._reductions -= 1
+        if self._policy == AnimationPolicy.OFF:
+            self._set_policy(AnimationPolicy.REDUCED)
+        else:
+            self._set_policy(AnimationPolicy.FULL)
+
+
+class _FrameMonitor(QObject):
+    """Measure the frame times of an animation while it's running."""
+
+    def __init__(self, animation: QVariantAnimation) -> None:
+        """Create a new _FrameMonitor for the given animation."""
+        super().__init__(animation)
+        self._timer = QElapsedTimer()
+        self._frame_times: list[float] = []
+        animation.valueChanged.connect(self.on_frame)
+        animation.stateChanged.connect(self.on_state_changed)
+
+    @Slot(name="on_frame")
+    def on_frame(self) -> None:
+        """Record the time since the previous frame."""
+        if self._timer.isValid():
+            self._frame_times.append(self._timer.nsecsElapsed() / 1e6)
+        self._timer.start()
+
+    @Slot(QAbstractAnimation.State, QAbstractAnimation.State)
+    def on_state_changed(
+        self, new_state: QAbstractAnimation.State, _: QAbstractAnimation.State
+    ) -> None:
+        """Start recording or report the frame times of the animation."""
+        manager = AnimationPolicyManager.inst()
+        if new_state == QAbstractAnimation.State.Running:
+            self._frame_times = []
+            self._timer.invalidate()
+            manager._running.add(self)  # pylint: disable=protected-access
+        elif new_state == QAbstractAnimation.State.Stopped:
+            manager._running.discard(self)  # pylint: disable=protected-access
+            frame_times, self._frame_times = self._frame_times, []
+            manager.report_frame_times(frame_times)
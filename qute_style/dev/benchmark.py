@@ -0,0 +1,243 @@
+"""
+Helpers to measure the painting performance of QuteStyle widgets.
+
+The helpers are used by the benchmark scripts in dev_scripts. They are plain
+measuring tools and are not meant to be used by applications.
+"""
+
+from __future__ import annotations
+
+import os
+import statistics
+import sys
+import time
+from collections import Counter
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from types import TracebackType
+
+from PySide6.QtCore import QElapsedTimer, QEvent, QObject
+from PySide6.QtGui import QPaintEvent
+from PySide6.QtWidgets import QApplication, QWidget
+
+# ensure that the resources are loaded
+import qute_style.resources_rc  # pylint: disable=unused-import  # noqa: F401
+from qute_style.qute_style import QuteStyle
+
+
+def create_application() -> QApplication:
+    """Create a QApplication that uses QuteStyle like QuteStyleMainWindow."""
+    app = QApplication.instance() or QApplication(sys.argv)
+    QApplication.setStyle(QuteStyle())
+    return app
+
+
+def best_of(func: Callable[[], object], repeat: int = 5) -> float:
+    """Call func repeat times and return the shortest duration in seconds."""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def memory_usage() -> int | None:
+    """Return the resident memory of the process in bytes (Linux only)."""
+    statm = Path("/proc/self/statm")
+    if not statm.exists():
+        return None
+    return int(statm.read_text().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def print_results(title: str, rows: Iterable[tuple[str, str]]) -> None:
+    """Print the results of a benchmark as a simple two column table."""
+    rows = list(rows)
+    width = max((len(name) for name, _ in rows), default=0)
+    print(title)
+    print("-" * len(title))
+    for name, value in rows:
+        print(f"{name:<{width}}  {value}")
+    print()
+
+
+class EventCounter(QObject):
+    """
+    Count the events of the given types per widget class while it is active.
+
+    Usage:
+    ```py
+    with EventCounter(QEvent.Type.Polish) as counter:
+        do_something()
+    print(counter.total, counter.counts)
+    ```
+    """
+
+    def __init__(self, *event_types: QEvent.Type) -> None:
+        """Create a new EventCounter for the given event types."""
+        super().__init__()
+        self._event_types = event_types
+        self.counts: Counter[str] = Counter()
+
+    @property
+    def total(self) -> int:
+        """Return the number of events counted."""
+        return sum(self.counts.values())
+
+    def __enter__(self) -> EventCounter:
+        """Start counting the events of all objects."""
+        QApplication.instance().installEventFilter(self)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Stop counting events."""
+        QApplication.instance().removeEventFilter(self)
+
+    def eventFilter(  # noqa: N802
+        self, watched: QObject, event: QEvent
+    ) -> bool:
+        """Count the events of the given types."""
+        if event.type() in self._event_types:
+            self.counts[type(watched).__name__] += 1
+        return False
+
+
+class PaintCounter(EventCounter):
+    """
+    Count the paint events per widget class while it is active.
+
+    Usage:
+    ```py
+    with PaintCounter() as counter:
+        do_something()
+    print(counter.total, counter.counts)
+    ```
+    """
+
+    def __init__(self) -> None:
+        """Create a new PaintCounter."""
+        super().__init__(QEvent.Type.Paint)
+
+
+class PaintTimer:
+    """
+    Sum up the time spent in the paintEvent of widget classes.
+
+    The paintEvent of the given classes is wrapped while the PaintTimer is
+    active. Usage:
+    ```py
+    with PaintTimer(IconButton) as timer:
+        do_something()
+    print(timer.durations["IconButton"], timer.counts["IconButton"])
+    ```
+    """
+
+    def __init__(self, *widget_classes: type[QWidget]) -> None:
+        """Create a new PaintTimer for the given widget classes."""
+        self._widget_classes = widget_classes
+        self._originals: dict[type[QWidget], object] = {}
+        # Duration in seconds and number of paint events per class name.
+        self.durations: Counter[str] = Counter()
+        self.counts: Counter[str] = Counter()
+
+    def per_paint(self, name: str) -> float:
+        """Return the mean duration of a paint event in seconds."""
+        return self.durations[name] / max(self.counts[name], 1)
+
+    def _timed(
+        self, name: str, paint_event: Callable[[QWidget, QPaintEvent], None]
+    ) -> Callable[[QWidget, QPaintEvent], None]:
+        """Return a paintEvent that measures the given paint_event."""
+
+        def paint(widget: QWidget, event: QPaintEvent) -> None:
+            start = time.perf_counter()
+            paint_event(widget, event)
+            self.durations[name] += time.perf_counter() - start
+            self.counts[name] += 1
+
+        return paint
+
+    def __enter__(self) -> PaintTimer:
+        """Start timing the paint events."""
+        for widget_class in self._widget_classes:
+            self._originals[widget_class] = widget_class.__dict__.get(
+                "paintEvent"
+            )
+            widget_class.paintEvent = self._timed(  # type: ignore
+                widget_class.__name__, widget_class.paintEvent
+            )
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Stop timing and restore the original paint events."""
+        for widget_class, original in self._originals.items():
+            if original is None:
+                del widget_class.paintEvent
+            else:
+                widget_class.paintEvent = original  # type: ignore
+        self._originals.clear()
+
+
+class FrameTimer:
+    """
+    Record the time between frames, e.g. between an animation's updates.
+
+    Connect `tick` to a signal that is emitted once per frame (like the
+    valueChanged signal of an animation) and call `start` before.
+    """
+
+    # Duration of a frame at 60 Hz in milliseconds.
+    FRAME_BUDGET = 1000 / 60
+
+    def __init__(self) -> None:
+        """Create a new FrameTimer."""
+        self._timer = QElapsedTimer()
+        self._last = 0.0
+        self.frame_times: list[float] = []
+
+    def start(self) -> None:
+        """Start recording, previous frame times are discarded."""
+        self.frame_times = []
+        self._timer.start()
+        self._last = 0.0
+
+    def tick(self, *_: object) -> None:
+        """Record the end of a frame."""
+        now = self._timer.nsecsElapsed() / 1e6
+        self.frame_times.append(now - self._last)
+        self._last = now
+
+    @property
+    def dropped_frames(self) -> int:
+        """Return the number of frames that exceeded the frame budget."""
+        return sum(
+            int(duration // self.FRAME_BUDGET)
+            for duration in self.frame_times
+            if duration > 1.5 * self.FRAME_BUDGET
+        )
+
+    def summary(self) -> list[tuple[str, str]]:
+        """Return the statistics of the recorded frame times."""
+        if not self.frame_times:
+            return [("frames", "0")]
+        ordered = sorted(self.frame_times)
+        return [
+            ("frames", str(len(ordered))),
+            ("mean frame time", f"{statistics.fmean(ordered):.2f} ms"),
+            (
+                "95th percentile",
+                f"{ordered[int(0.95 * (len(ordered) - 1))]:.2f} ms",
+            ),
+            ("max frame time", f"{ordered[-1]:.2f} ms"),
+            ("dropped frames", str(self.dropped_frames)),
+        ]
@@ -0,0 +1,416 @@
+"""
+Diagnostics for the paint events of a window.
+
+The PaintRecorder records the region of every paint event of the widgets of
+a window for a time window. From the records it renders a heatmap of how often
+each pixel was painted and it lists widgets that could be marked opaque
+(WA_OpaquePaintEvent) or that repaint their full rect most of the time.
+
+The overlay mode shows the heatmap on top of the window while the
+application is used:
+```py
+overlay = show_paint_heatmap(main_window)
+```
+QuteStyleApplication enables the overlay mode if it is started with "-p".
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import deque
+from dataclasses import dataclass
+from types import TracebackType
+from typing import NamedTuple, cast
+
+import shiboken6
+from PySide6.QtCore import QElapsedTimer, QEvent, QObject, QPoint, Qt, QTimer
+from PySide6.QtGui import QColor, QImage, QPainter, QPaintEvent, QRegion, qRgba
+from PySide6.QtWidgets import QApplication, QWidget
+
+log = logging.getLogger(
+    f"qute_style.{__name__}"
+)  # pylint: disable=invalid-name
+
+
+class PaintRecord(NamedTuple):
+    """The region of a single paint event in window coordinates."""
+
+    time: int
+    widget: QWidget
+    region: QRegion
+    full_rect: bool
+
+
+@dataclass
+class WidgetPaintStats:
+    """Paint statistics of a single widget."""
+
+    widget: QWidget
+    name: str
+    paints: int = 0
+    full_rect_paints: int = 0
+    painted_pixels: int = 0
+
+    @property
+    def full_rect_ratio(self) -> float:
+        """Return the ratio of paint events that covered the full rect."""
+        return self.full_rect_paints / self.paints if self.paints else 0
+
+
+def widget_name(widget: QWidget) -> str:
+    """Return a readable name of the widget for reports."""
+    name = type(widget).__name__
+    if widget.objectName():
+        name = f"{name}#{widget.objectName()}"
+    return name
+
+
+def region_area(region: QRegion) -> int:
+    """Return the number of pixels of the region."""
+    return sum(rect.width() * rect.height() for rect in region)
+
+
+def is_opaque(widget: QWidget) -> bool:
+    """
+    Return if the widget paints every pixel of its rect opaque.
+
+    The widget is rendered without its children, so only its own paint event
+    and background are taken into account.
+    """
+    if widget.width() <= 0 or widget.height() <= 0:
+        return False
+    image = QImage(widget.size(), QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(Qt.GlobalColor.transparent)
+    # Without DrawWindowBackground the widget isn't filled like a window.
+    widget.render(image, QPoint(), QRegion(), QWidget.RenderFlag(0))
+    alpha = image.convertToFormat(QImage.Format.Format_Alpha8)
+    bits = alpha.constBits()
+    width = alpha.width()
+    bytes_per_line = alpha.bytesPerLine()
+    return all(
+        min(bits[line * bytes_per_line : line * bytes_per_line + width]) == 255
+        for line in range(alpha.height())
+    )
+
+
+# Colors of the heatmap from painted once (blue) to painted very often (red).
+HEATMAP_COLORS = (
+    QColor(0, 0, 255),
+    QColor(0, 255, 255),
+    QColor(0, 255, 0),
+    QColor(255, 255, 0),
+    QColor(255, 0, 0),
+)
+
+
+def heatmap_color_table(maximum: int, alpha: int = 160) -> list[int]:
+    """
+    Return the color table for a heatmap with the given maximum count.
+
+    Index 0 (never painted) is transparent, counts from 1 to maximum are
+    interpolated between the HEATMAP_COLORS.
+    """
+    table = [qRgba(0, 0, 0, 0)]
+    maximum = max(1, min(maximum, 255))
+    for count in range(1, 256):
+        position = (min(count, maximum) - 1) / max(1, maximum - 1)
+        position *= len(HEATMAP_COLORS) - 1
+        index = min(int(position), len(HEATMAP_COLORS) - 2)
+        fraction = position - index
+        start, end = HEATMAP_COLORS[index], HEATMAP_COLORS[index + 1]
+        table.append(
+            qRgba(
+                round(start.red() + (end.red() - start.red()) * fraction),
+                round(
+                    start.green() + (end.green() - start.green()) * fraction
+                ),
+                round(start.blue() + (end.blue() - start.blue()) * fraction),
+                alpha,
+            )
+        )
+    return table
+
+
+class PaintRecorder(QObject):
+    """
+    Record the paint events of all widgets of a window.
+
+    Only the records of the last time_window milliseconds are kept. Usage:
+    ```py
+    with PaintRecorder(window) as recorder:
+        do_something()
+    recorder.heatmap().save("heatmap.png")
+    print(recorder.report())
+    ```
+    """
+
+    def __init__(self, window: QWidget, time_window: int = 5000) -> None:
+        """Create a new PaintRecorder for the given window."""
+        super().__init__()
+        self._window = window
+        self._time_window = time_window
+        self._timer = QElapsedTimer()
+        self._records: deque[PaintRecord] = deque()
+        self._ignored: set[QWidget] = set()
+
+    def ignore(self, widget: QWidget) -> None:
+        """Ignore the paint events of the widget, e.g. of an overlay."""
+        self._ignored.add(widget)
+
+    def start(self) -> None:
+        """Start recording, previous records are discarded."""
+        self._records.clear()
+        self._timer.start()
+        QApplication.instance().installEventFilter(self)
+
+    def stop(self) -> None:
+        """Stop recording."""
+        QApplication.instance().removeEventFilter(self)
+
+    def __enter__(self) -> PaintRecorder:
+        """Start recording."""
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Stop recording."""
+        self.stop()
+
+    def eventFilter(  # noqa: N802
+        self, watched: QObject, event: QEvent
+    ) -> bool:
+        """Record the region of paint events of the window's widgets."""
+        if (
+            event.type() == QEvent.Type.Paint
+            and watched.isWidgetType()
+            and watched not in self._ignored
+        ):
+            widget = cast(QWidget, watched)
+            if widget.window() is self._window:
+                region = cast(QPaintEvent, event).region()
+                now = self._timer.elapsed()
+                self._prune(now)
+                self._records.append(
+                    PaintRecord(
+                        now,
+                        widget,
+                        region.translated(
+                            widget.mapTo(self._window, QPoint())
+                        ),
+                        (QRegion(widget.rect()) - region).isEmpty(),
+                    )
+                )
+        return False
+
+    def _prune(self, now: int) -> None:
+        """Remove the records that are older than the time window."""
+        start = now - self._time_window
+        while self._records and self._records[0].time < start:
+            self._records.popleft()
+
+    @property
+    def records(self) -> list[PaintRecord]:
+        """Return the records of the time window."""
+        self._prune(self._timer.elapsed())
+        return [
+            record
+            for record in self._records
+            if shiboken6.isValid(record.widget)
+        ]
+
+    def paint_counts(self) -> QImage:
+        """
+        Return how often each pixel of the window was painted.
+
+        The counts are stored in an image of format Alpha8 and saturate
+        at 255.
+        """
+        image = QImage(self._window.size(), QImage.Format.Format_Alpha8)
+        image.fill(0)
+        painter = QPainter(image)
+        painter.setCompositionMode(
+            QPainter.CompositionMode.CompositionMode_Plus
+        )
+        # Each paint adds 1 to the alpha value of the painted pixels.
+        color = QColor(0, 0, 0, 1)
+        for record in self.records:
+            for rect in record.region:
+                painter.fillRect(rect, color)
+        painter.end()
+        return image
+
+    def heatmap(self, maximum: int = 50) -> QImage:
+        """
+        Return a heatmap of the painted pixels of the window.
+
+        Pixels that were painted maximum times or more are drawn red.
+        """
+        image = self.paint_counts()
+        image.reinterpretAsFormat(QImage.Format.Format_Indexed8)
+        image.setColorTable(heatmap_color_table(maximum))
+        return image
+
+    def widget_stats(self) -> list[WidgetPaintStats]:
+        """Return the paint statistics per widget, most painted first."""
+        stats: dict[QWidget, WidgetPaintStats] = {}
+        for record in self.records:
+            try:
+                widget_stats = stats[record.widget]
+            except KeyError:
+                widget_stats = stats[record.widget] = WidgetPaintStats(
+                    record.widget, widget_name(record.widget)
+                )
+            widget_stats.paints += 1
+            widget_stats.full_rect_paints += record.full_rect
+            widget_stats.painted_pixels += region_area(record.region)
+        return sorted(
+            stats.values(), key=lambda stat: stat.painted_pixels, reverse=True
+        )
+
+    def opaque_candidates(self) -> list[WidgetPaintStats]:
+        """
+        Return the painted widgets that could be marked opaque.
+
+        These widgets paint every pixel of their rect but are not marked with
+        WA_OpaquePaintEvent, so Qt paints the widgets below them, too.
+        """
+        return [
+            stats
+            for stats in self.widget_stats()
+            if not stats.widget.isWindow()
+            and not stats.widget.testAttribute(
+                Qt.WidgetAttribute.WA_OpaquePaintEvent
+            )
+            and is_opaque(stats.widget)
+        ]
+
+    def full_rect_repainters(
+        self, min_paints: int = 5, min_ratio: float = 0.9
+    ) -> list[WidgetPaintStats]:
+        """
+        Return the widgets that repaint their full rect most of the time.
+
+        Such widgets call update() without a rect, even though often only a
+        part of them changes.
+        """
+        return [
+            stats
+            for stats in self.widget_stats()
+            if not stats.widget.isWindow()
+            and stats.paints >= min_paints
+            and stats.full_rect_ratio >= min_ratio
+        ]
+
+    def overdraw(self) -> float:
+        """Return the average number of paints of each painted pixel."""
+        painted = QRegion()
+        total = 0
+        for record in self.records:
+            painted += record.region
+            total += region_area(record.region)
+        area = region_area(painted)
+        return total / area if area else 0
+
+    def report(self) -> str:
+        """Return a text report of the recorded paint events."""
+        lines = [
+            f"{len(self.records)} paint events, overdraw "
+            f"{self.overdraw():.1f}x",
+            "",
+            "Most painted widgets (paints, full rect, pixels):",
+        ]
+        lines.extend(
+            f"  {stats.name:<40} {stats.paints:>6} "
+            f"{stats.full_rect_ratio:>6.0%} {stats.painted_pixels:>10}"
+            for stats in self.widget_stats()[:20]
+        )
+        lines.append("")
+        lines.append("Opaque widgets without WA_OpaquePaintEvent:")
+        lines.extend(f"  {stats.name}" for stats in self.opaque_candidates())
+        lines.append("")
+        lines.append("Widgets repainting their full rect:")
+        lines.extend(
+            f"  {stats.name} ({stats.paints} paints)"
+            for stats in self.full_rect_repainters()
+        )
+        return "\n".join(lines)
+
+
+class PaintHeatmapOverlay(QWidget):
+    """
+    Show the paint heatmap of a window on top of it.
+
+    The overlay is a separate, frameless window that doesn't take input, so
+    that its own painting doesn't cause paint events in the observed window.
+    It is closed together with the observed window.
+    """
+
+    def __init__(
+        self,
+        window: QWidget,
+        time_window: int = 5000,
+        interval: int = 500,
+    ) -> None:
+        """Create a new PaintHeatmapOverlay for the window."""
+        super().__init__(
+            window,
+            Qt.WindowType.FramelessWindowHint
+            | Qt.WindowType.Tool
+            | Qt.WindowType.WindowStaysOnTopHint
+            | Qt.WindowType.WindowTransparentForInput,
+        )
+        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.setAttribute(Qt.WidgetAttribute.WA_ShowWithoutActivating)
+        self._window = window
+        self._recorder = PaintRecorder(window, time_window)
+        self._recorder.ignore(self)
+        self._heatmap = QImage()
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval)
+        self._timer.timeout.connect(self.refresh)
+
+    @property
+    def recorder(self) -> PaintRecorder:
+        """Return the recorder of the overlay."""
+        return self._recorder
+
+    def start(self) -> None:
+        """Start recording and show the overlay."""
+        log.debug("Showing the paint heatmap of %s", self._window)
+        self._recorder.start()
+        self._timer.start()
+        self.refresh()
+        self.show()
+
+    def stop(self) -> None:
+        """Stop recording, hide the overlay and log the report."""
+        self._timer.stop()
+        self._recorder.stop()
+        self.hide()
+        log.info("Paint report:\n%s", self._recorder.report())
+
+    def refresh(self) -> None:
+        """Update the heatmap and follow the geometry of the window."""
+        self.setGeometry(self._window.geometry())
+        self._heatmap = self._recorder.heatmap()
+        self.update()
+
+    def paintEvent(self, _: QPaintEvent) -> None:  # noqa: N802
+        """Paint the heatmap."""
+        painter = QPainter(self)
+        painter.drawImage(0, 0, self._heatmap)
+
+
+def show_paint_heatmap(
+    window: QWidget, time_window: int = 5000
+) -> PaintHeatmapOverlay:
+    """Show the paint heatmap of the window on top of it."""
+    overlay = PaintHeatmapOverlay(window, time_window)
+    overlay.start()
+    return overlay
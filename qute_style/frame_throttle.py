@@ -0,0 +1,76 @@
+"""Pass on values at most once per display frame."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+from PySide6.QtCore import QElapsedTimer, QObject, Qt, QTimer, Slot
+from PySide6.QtWidgets import QWidget
+
+T = TypeVar("T")  # pylint: disable=invalid-name
+
+
+class FrameThrottle(QObject, Generic[T]):
+    """
+    Pass on the latest of the requested values at most once per frame.
+
+    This is meant for values that are requested on every mouse move, like
+    the geometry or the position of a window: applying them is expensive and
+    only the latest one matters. The first value is applied at once, the
+    following ones when a frame of the widget's screen has passed since.
+    """
+
+    # Refresh rate that is used if the screen doesn't report one.
+    DEFAULT_REFRESH_RATE = 60
+
+    def __init__(self, widget: QWidget, apply: Callable[[T], None]) -> None:
+        """Create a new FrameThrottle for the screen of the widget."""
+        super().__init__(widget)
+        self._widget = widget
+        self._apply = apply
+        self._pending: T | None = None
+        self._since_apply = QElapsedTimer()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self.flush)
+
+    @property
+    def pending(self) -> T | None:
+        """Return the value that will be applied next, if there is one."""
+        return self._pending
+
+    def reset(self) -> None:
+        """Apply the next requested value at once, e.g. on a mouse press."""
+        self._since_apply.invalidate()
+
+    def request(self, value: T) -> None:
+        """Request the value to be applied."""
+        self._pending = value
+        if self._timer.isActive():
+            return
+        remaining = (
+            self._frame_interval() - self._since_apply.elapsed()
+            if self._since_apply.isValid()
+            else 0
+        )
+        if remaining <= 0:
+            self.flush()
+        else:
+            self._timer.start(remaining)
+
+    @Slot(name="flush")
+    def flush(self) -> None:
+        """Apply the pending value, if there is one."""
+        self._timer.stop()
+        if self._pending is None:
+            return
+        value, self._pending = self._pending, None
+        self._since_apply.start()
+        self._apply(value)
+
+    def _frame_interval(self) -> int:
+        """Return the duration of a frame of the screen in milliseconds."""
+        refresh_rate = self._widget.screen().refreshRate()
+        return round(1000 / (refresh_rate or self.DEFAULT_REFRESH_RATE))
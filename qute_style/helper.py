@@ -22,9 +22,16 @@ def check_ide() -> bool:
 class StyledWaitingSpinner(WaitingSpinner):
     """Styled Version of QWaitingSpinner."""
 
+    # Color code of the theme the spinner's color was parsed from.
+    _color_code: str = ""
+
     def paintEvent(self, _: QPaintEvent) -> None:  # noqa: N802
         """Overwrite method to change color of spinner."""
-        self._color = QColor(get_color("context_color"))
+        # Only parse the color if the theme has changed.
+        color = get_color("context_color")
+        if color != self._color_code:
+            self._color_code = color
+            self._color = QColor(color)
         super().paintEvent(_)
 
 
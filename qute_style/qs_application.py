@@ -25,8 +25,14 @@ from PySide6.QtWidgets import (
     QSplashScreen,
 )
 
+from qute_style.animation_policy import AnimationPolicy, AnimationPolicyManager
+from qute_style.dev.paint_diagnostics import (
+    PaintHeatmapOverlay,
+    show_paint_heatmap,
+)
 from qute_style.helper import check_ide, create_waiting_spinner
 from qute_style.qs_main_window import AppData, CustomMainWindow
+from qute_style.render_quality import RenderQuality, RenderQualityManager
 from qute_style.startup_threads import StartupThread
 from qute_style.style import get_color, get_style
 
@@ -51,7 +57,7 @@ class CustomSplashScreen(QSplashScreen):
         pixmap = QPixmap(size)
         pixmap.fill(Qt.GlobalColor.transparent)
         painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        RenderQualityManager.inst().set_antialiasing(painter)
         path = QPainterPath()
         path.addRoundedRect(QRectF(0, 0, size.width(), size.height()), 12, 12)
         painter.fillPath(path, QColor(background_color))
@@ -94,13 +100,30 @@ class QuteStyleApplication(  # pylint: disable=too-many-instance-attributes
 
     APP_DATA: AppData
 
+    # Policy for the animations of all widgets. With the automatic policy,
+    # animations are reduced if their frame times exceed the frame budget.
+    ANIMATION_POLICY: AnimationPolicy = AnimationPolicy.FULL
+    AUTOMATIC_ANIMATION_POLICY: bool = True
+
+    # Quality of the paint paths of all widgets. With the automatic quality,
+    # the tier is picked from the paint time of the main window.
+    RENDER_QUALITY: RenderQuality = RenderQuality.HIGH
+    AUTOMATIC_RENDER_QUALITY: bool = False
+
     def __init__(self, argv: list[str], show_splash: bool = True) -> None:
         """Init QuteStyleApplication."""
         super().__init__(argv)
 
+        animation_policy = AnimationPolicyManager.inst()
+        animation_policy.policy = self.ANIMATION_POLICY
+        animation_policy.automatic = self.AUTOMATIC_ANIMATION_POLICY
+        RenderQualityManager.inst().quality = self.RENDER_QUALITY
+
         self._update = "-u" not in argv and not check_ide()
         self._force_whats_new = "-w" in argv
         self._reset_settings = "-c" in argv
+        self._show_paint_heatmap = "-p" in argv
+        self._paint_heatmap: PaintHeatmapOverlay | None = None
 
         self.check_startup_thread_configuration()
         self.setApplicationName(self.APP_DATA.app_name)
@@ -125,6 +148,26 @@ class QuteStyleApplication(  # pylint: disable=too-many-instance-attributes
 
         self._handle_startup_threads()
 
+    @property
+    def animation_policy(self) -> AnimationPolicy:
+        """Return the current AnimationPolicy."""
+        return AnimationPolicyManager.inst().policy
+
+    @animation_policy.setter
+    def animation_policy(self, policy: AnimationPolicy) -> None:
+        """Set the AnimationPolicy of all animations."""
+        AnimationPolicyManager.inst().policy = policy
+
+    @property
+    def render_quality(self) -> RenderQuality:
+        """Return the current RenderQuality."""
+        return RenderQualityManager.inst().quality
+
+    @render_quality.setter
+    def render_quality(self, quality: RenderQuality) -> None:
+        """Set the RenderQuality of all paint paths."""
+        RenderQualityManager.inst().quality = quality
+
     def check_startup_thread_configuration(self) -> None:
         """
         Check the configuration of the startup threads.
@@ -220,3 +263,9 @@ class QuteStyleApplication(  # pylint: disable=too-many-instance-attributes
         if self._splash_screen:
             self._splash_screen.finish(self._main_window)
         self._main_window.show()
+        if self.AUTOMATIC_RENDER_QUALITY:
+            RenderQualityManager.inst().calibrate(self._main_window)
+        if self._show_paint_heatmap:
+            # Diagnostic mode, the report is logged when the app quits.
+            self._paint_heatmap = show_paint_heatmap(self._main_window)
+            self.aboutToQuit.connect(self._paint_heatmap.stop)
@@ -33,15 +33,18 @@ from PySide6.QtWidgets import (
 )
 
 import qute_style.resources_rc  # pylint: disable=unused-import  # noqa: F401
+from qute_style.animation_policy import AnimationPolicy, AnimationPolicyManager
+from qute_style.frame_throttle import FrameThrottle
 from qute_style.qute_style import QuteStyle
 from qute_style.style import get_style, set_current_style
 from qute_style.widgets.background_frame import BackgroundFrame
 from qute_style.widgets.base_widgets import BaseWidget, MainWidget
 from qute_style.widgets.credit_bar import CreditBar
-from qute_style.widgets.grips import CornerGrip, EdgeGrip
+from qute_style.widgets.grips import CornerGrip, EdgeGrip, ResizeMode
 from qute_style.widgets.home_page import HomePage
 from qute_style.widgets.left_column import LeftColumn
 from qute_style.widgets.left_menu import LeftMenu
+from qute_style.widgets.snapshot_slide import SnapshotSlide
 from qute_style.widgets.title_bar import TitleBar
 
 log = logging.getLogger(
@@ -105,6 +108,13 @@ class QuteStyleMainWindow(
     # Define the maximum width for the columns (left and right).
     MAX_COLUMN_WIDTH = 240
 
+    # Slide the columns and the LeftMenu with snapshots instead of
+    # relayouting the window on every frame of the animation (SnapshotSlide).
+    SNAPSHOT_ANIMATIONS: bool = False
+
+    # How the grips resize the window, see ResizeMode.
+    RESIZE_MODE: ResizeMode = ResizeMode.COALESCED
+
     # Signal that is emitted when the window has shut down.
     shutdown_complete = Signal(name="shutdown_complete")
 
@@ -129,6 +139,10 @@ class QuteStyleMainWindow(
 
         # Stores the position of the last clicked (needed for moving)
         self.last_move_pos = QPoint()
+        # Moves by the title bar are applied at most once per frame.
+        self._move_throttle: FrameThrottle[QPoint] = FrameThrottle(
+            self, self.move
+        )
 
         # This is the animation group for hiding/showing the columns
         # (left/right). It needs to be globally defined to avoid being garbage
@@ -181,14 +195,14 @@ class QuteStyleMainWindow(
         right_app_layout.addWidget(CreditBar(self._app_data.app_version))
 
         self._grips: list[EdgeGrip | CornerGrip] = [
-            EdgeGrip(self, Qt.Edge.LeftEdge),
-            EdgeGrip(self, Qt.Edge.RightEdge),
-            EdgeGrip(self, Qt.Edge.TopEdge),
-            EdgeGrip(self, Qt.Edge.BottomEdge),
-            CornerGrip(self, Qt.Corner.TopLeftCorner),
-            CornerGrip(self, Qt.Corner.TopRightCorner),
-            CornerGrip(self, Qt.Corner.BottomLeftCorner),
-            CornerGrip(self, Qt.Corner.BottomRightCorner),
+            EdgeGrip(self, Qt.Edge.LeftEdge, self.RESIZE_MODE),
+            EdgeGrip(self, Qt.Edge.RightEdge, self.RESIZE_MODE),
+            EdgeGrip(self, Qt.Edge.TopEdge, self.RESIZE_MODE),
+            EdgeGrip(self, Qt.Edge.BottomEdge, self.RESIZE_MODE),
+            CornerGrip(self, Qt.Corner.TopLeftCorner, self.RESIZE_MODE),
+            CornerGrip(self, Qt.Corner.TopRightCorner, self.RESIZE_MODE),
+            CornerGrip(self, Qt.Corner.BottomLeftCorner, self.RESIZE_MODE),
+            CornerGrip(self, Qt.Corner.BottomRightCorner, self.RESIZE_MODE),
         ]
         for grip in self._grips:
             grip.window_geometry_changed.connect(self.window_geometry_changed)
@@ -403,6 +417,7 @@ class QuteStyleMainWindow(
                 self.LEFT_WIDGET_CLASSES
             ),
         )
+        left_menu.snapshot_animation = self.SNAPSHOT_ANIMATIONS
         left_menu_layout.addWidget(left_menu)
         left_menu_frame.setFixedWidth(
             left_menu.minimumWidth()
@@ -441,8 +456,12 @@ class QuteStyleMainWindow(
             diff = pos - self.last_move_pos
 
             # Add the difference to the current position and move to
-            # that position.
-            self.move(self.pos() + diff)
+            # that position. The position of a pending move is the current
+            # one, as the window hasn't been moved there yet.
+            current = self._move_throttle.pending
+            if current is None:
+                current = self.pos()
+            self._move_throttle.request(current + diff)
         self.last_move_pos = pos
 
     @Slot(name="maximize")
@@ -489,7 +508,7 @@ class QuteStyleMainWindow(
         """
         log.debug("window is in normal mode")
         self.centralWidget().layout().setContentsMargins(10, 10, 10, 10)
-        self._background.set_stylesheet(border_radius=10, border_size=2)
+        self._background.window_maximized = False
         self._title_bar.set_maximized(False)
 
         # enable size change in normal mode
@@ -506,7 +525,7 @@ class QuteStyleMainWindow(
         """
         log.debug("window is in maximized/fullscreen mode")
         self.centralWidget().layout().setContentsMargins(0, 0, 0, 0)
-        self._background.set_stylesheet(border_radius=0, border_size=0)
+        self._background.window_maximized = True
         self._title_bar.set_maximized(True)
 
         # size change is not possible in maximized mode
@@ -532,7 +551,10 @@ class QuteStyleMainWindow(
                 animation = cast(
                     QPropertyAnimation, self._group.animationAt(idx)
                 )
-                if animation.targetObject() is frame:
+                target = animation.targetObject()
+                if target is frame or (
+                    isinstance(target, SnapshotSlide) and target.frame is frame
+                ):
                     log.debug("Found animation for %s", frame)
                     opening = (
                         cast(int, animation.endValue())
@@ -545,38 +567,83 @@ class QuteStyleMainWindow(
 
     @staticmethod
     def _create_slide_animation(
-        frame: QFrame, slide_out: bool
+        frame: QFrame, start: int, slide_out: bool
     ) -> QPropertyAnimation:
         """Create an animation that will open or close a QFrame."""
         animation = QPropertyAnimation(frame, b"minimumWidth")
-        animation.setDuration(500)
+        AnimationPolicyManager.inst().configure(animation, 500)
 
-        # Always start at the current width for the case that the column is
+        # Always start at the given width for the case that the column is
         # currently already animated and not fully closed/opened.
-        animation.setStartValue(frame.width())
+        animation.setStartValue(start)
         animation.setEndValue(
             QuteStyleMainWindow.MAX_COLUMN_WIDTH if slide_out else 0
         )
         animation.setEasingCurve(QEasingCurve.Type.InOutQuart)
         return animation
 
+    def _create_snapshot_animation(
+        self, frame: QFrame, start: int, slide_out: bool
+    ) -> QPropertyAnimation:
+        """Create an animation that slides a QFrame with snapshots."""
+        slide = SnapshotSlide(
+            frame,
+            start,
+            self.MAX_COLUMN_WIDTH if slide_out else 0,
+            (
+                Qt.Edge.LeftEdge
+                if frame is self._right_column_frame
+                else Qt.Edge.RightEdge
+            ),
+        )
+        AnimationPolicyManager.inst().configure(slide.animation, 500)
+        slide.animation.setEasingCurve(QEasingCurve.Type.InOutQuart)
+        return slide.animation
+
     def _start_box_animation(self, left_open: bool, right_open: bool) -> None:
         """
         Animate slide in/out of left or right column.
 
         This method will clear an ongoing animation (group), and create a new
         one based on the request parameters and state of the columns.
+
+        With SNAPSHOT_ANIMATIONS, a single sliding column is animated with a
+        SnapshotSlide. If both columns are sliding at once, the columns are
+        animated on the live frames.
         """
         assert not left_open or not right_open
+        slide_out = {
+            self._left_column_frame: left_open,
+            self._right_column_frame: right_open,
+        }
+        # Stop running snapshot slides before their animations are deleted.
+        start = {frame: SnapshotSlide.stop(frame) for frame in slide_out}
         self._group.clear()
-
-        # Create the two animations that that open/close the columns.
-        self._group.addAnimation(
-            self._create_slide_animation(self._left_column_frame, left_open)
-        )
-        self._group.addAnimation(
-            self._create_slide_animation(self._right_column_frame, right_open)
-        )
+        sliding = [
+            frame
+            for frame in slide_out
+            if start[frame]
+            != (self.MAX_COLUMN_WIDTH if slide_out[frame] else 0)
+        ]
+        if (
+            self.SNAPSHOT_ANIMATIONS
+            and len(sliding) == 1
+            and AnimationPolicyManager.inst().policy != AnimationPolicy.OFF
+        ):
+            frame = sliding[0]
+            self._group.addAnimation(
+                self._create_snapshot_animation(
+                    frame, start[frame], slide_out[frame]
+                )
+            )
+        else:
+            # Create the two animations that that open/close the columns.
+            for frame in slide_out:
+                self._group.addAnimation(
+                    self._create_slide_animation(
+                        frame, start[frame], slide_out[frame]
+                    )
+                )
 
         self._group.start()
 
@@ -590,6 +657,7 @@ class QuteStyleMainWindow(
         """Event triggered on mouse button press."""
         self.last_move_pos = event.globalPosition().toPoint()
         log.debug("Storing last click at %s", self.last_move_pos)
+        self._move_throttle.reset()
 
     @Slot(type, name="on_main_widget")
     def on_main_widget(self, widget_class: type[MainWidget]) -> None:
@@ -7,18 +7,32 @@ import logging
 from collections.abc import Generator
 from typing import cast
 
-from PySide6.QtCore import QRect, Qt
-from PySide6.QtGui import QBrush, QColor, QPainter, QPalette, QPen
+from PySide6.QtCore import QRect, QRectF, Qt
+from PySide6.QtGui import (
+    QBrush,
+    QColor,
+    QIcon,
+    QPainter,
+    QPalette,
+    QPen,
+    QPixmap,
+)
 from PySide6.QtWidgets import (
+    QApplication,
     QCheckBox,
+    QDial,
+    QProgressBar,
     QProxyStyle,
     QStyle,
     QStyleOption,
     QStyleOptionButton,
+    QStyleOptionComboBox,
+    QStyleOptionComplex,
     QStyleOptionViewItem,
     QWidget,
 )
 
+from qute_style.render_quality import RenderQuality, RenderQualityManager
 from qute_style.style import get_color, get_current_style
 from qute_style.widgets.custom_icon_engine import PixmapStore
 
@@ -72,12 +86,53 @@ class ToggleOptionButton(  # pylint: disable=too-few-public-methods
         self._position = value
 
 
+# Plain integer values of the flags that are evaluated for every item of an
+# item view. Combining PySide's enum flags is comparatively expensive. The
+# public ones are shared with the item delegates.
+STATE_ENABLED = QStyle.StateFlag.State_Enabled.value
+STATE_ACTIVE = QStyle.StateFlag.State_Active.value
+STATE_SELECTED = QStyle.StateFlag.State_Selected.value
+STATE_MOUSE_OVER = QStyle.StateFlag.State_MouseOver.value
+_STATE_OPEN = QStyle.StateFlag.State_Open.value
+_HAS_CHECK_INDICATOR = (
+    QStyleOptionViewItem.ViewItemFeature.HasCheckIndicator.value
+)
+_HAS_DECORATION = QStyleOptionViewItem.ViewItemFeature.HasDecoration.value
+_WRAP_TEXT = QStyleOptionViewItem.ViewItemFeature.WrapText.value
+_TEXT_WORD_WRAP = Qt.TextFlag.TextWordWrap.value
+# The states the check indicator of a view item depends on.
+CHECK_SPRITE_STATES = STATE_ENABLED | STATE_MOUSE_OVER | STATE_SELECTED
+# Upper bound of cached check indicator sprites, the cache is reset when
+# exceeded (e.g. after many theme changes).
+_MAX_CHECK_SPRITES = 256
+# Upper bound of cached combo box sprites, see _MAX_CHECK_SPRITES.
+_MAX_COMBO_BOX_SPRITES = 256
+CHECK_STATE_FLAGS = {
+    Qt.CheckState.Unchecked: QStyle.StateFlag.State_Off.value,
+    Qt.CheckState.PartiallyChecked: QStyle.StateFlag.State_NoChange.value,
+    Qt.CheckState.Checked: QStyle.StateFlag.State_On.value,
+}
+# Horizontal margin of an item's text, this matches QCommonStyle
+# (PM_FocusFrameHMargin + 1).
+ITEM_TEXT_MARGIN = 3
+
+
 class QuteStyle(QProxyStyle):
     """Custom style for a Qute Style application."""
 
     # Custom ControlElement for drawControl method.
     CE_Toggle = QStyle.ControlElement(QStyle.ControlElement.CE_CustomBase + 1)
 
+    # Dynamic property that marks an item view for the stylesheet-free fast
+    # path. See qute_style.widgets.item_delegate.set_fast_path.
+    FAST_PATH_PROPERTY = "fastPath"
+
+    # Widgets that look the same whether the mouse is over them or not. The
+    # base style enables hover tracking for them, which makes Qt repaint them
+    # on every enter and leave. This is switched off unless a style sheet
+    # rule with :hover applies to the widget.
+    NO_HOVER_WIDGETS: tuple[type[QWidget], ...] = (QProgressBar, QDial)
+
     # This is the cache that holds QPalettes already created, since they will
     # not change unless the user changes the theme.
     PALETTE_CACHE: dict[str, QPalette] = {}
@@ -309,6 +364,85 @@ class QuteStyle(QProxyStyle):
                 QuteStyle.ToggleOptions.BOX_HEIGHT,
             )
 
+    class ComboBoxOptions:  # pylint: disable=too-few-public-methods
+        """
+        QComboBox configuration.
+
+        The values match the QComboBox rules of the style sheet, so that a
+        StyledComboBox painted by QuteStyle looks the same as before.
+        """
+
+        # Width of the frame, disabled combo boxes have no frame.
+        BORDER = 1
+
+        # Corner radius of the frame.
+        RADIUS = 5
+
+        # Padding of the edit field.
+        PADDING_LEFT = 10
+        PADDING = 5
+
+        # Width of the drop-down and its separator on the left.
+        DROP_DOWN_WIDTH = 25
+        SEPARATOR_WIDTH = 3
+
+        # Size of the arrow and its distance to the right edge.
+        ARROW_SIZE = 9
+        ARROW_MARGIN = 6
+
+        ARROW_ICON = ":/svg_icons/expand_more.svg"
+
+        @staticmethod
+        def border(option: QStyleOption) -> int:
+            """Return the width of the frame for the given option."""
+            if option.state & QStyle.StateFlag.State_Enabled:
+                return QuteStyle.ComboBoxOptions.BORDER
+            return 0
+
+        @staticmethod
+        def drop_down_rect(option: QStyleOption) -> QRect:
+            """Return the rect of the drop-down including its separator."""
+            border = QuteStyle.ComboBoxOptions.border(option)
+            width = (
+                QuteStyle.ComboBoxOptions.DROP_DOWN_WIDTH
+                + QuteStyle.ComboBoxOptions.SEPARATOR_WIDTH
+            )
+            return QRect(
+                option.rect.right() - border - width + 1,
+                option.rect.top() + border,
+                width,
+                option.rect.height() - 2 * border,
+            )
+
+        @staticmethod
+        def edit_field_rect(option: QStyleOption) -> QRect:
+            """Return the rect of the text (the edit field)."""
+            border = QuteStyle.ComboBoxOptions.border(option)
+            padding = QuteStyle.ComboBoxOptions.PADDING
+            left = option.rect.left() + border
+            return QRect(
+                left + QuteStyle.ComboBoxOptions.PADDING_LEFT,
+                option.rect.top() + border + padding,
+                QuteStyle.ComboBoxOptions.drop_down_rect(option).left()
+                - left
+                - QuteStyle.ComboBoxOptions.PADDING_LEFT
+                - padding,
+                option.rect.height() - 2 * (border + padding),
+            )
+
+        @staticmethod
+        def arrow_rect(option: QStyleOption) -> QRect:
+            """Return the rect the arrow icon is drawn into."""
+            size = QuteStyle.ComboBoxOptions.ARROW_SIZE
+            return QRect(
+                option.rect.right()
+                - size
+                - QuteStyle.ComboBoxOptions.ARROW_MARGIN,
+                option.rect.top() + (option.rect.height() - size) // 2,
+                size,
+                size,
+            )
+
     def standardPalette(  # noqa: N802
         self,
     ) -> QPalette:
@@ -327,6 +461,18 @@ class QuteStyle(QProxyStyle):
             palette.setColor(group, role, QColor(get_color(name)))
         return palette
 
+    def polish(
+        self, arg: QWidget | QApplication | QPalette
+    ) -> QPalette | None:
+        """Polish the widget, application or palette."""
+        result = super().polish(arg)
+        if isinstance(arg, QuteStyle.NO_HOVER_WIDGETS):
+            # Qt's style sheet style polishes the widget through this style
+            # first and enables hover tracking afterwards only if a :hover
+            # rule applies to the widget, i.e. if it does change on hover.
+            arg.setAttribute(Qt.WidgetAttribute.WA_Hover, False)
+        return result
+
     def drawControl(  # noqa: N802
         self,
         element: QStyle.ControlElement,
@@ -350,8 +496,172 @@ class QuteStyle(QProxyStyle):
         ):
             self._draw_check_box_label(option, painter, widget)
             return
+        elif (
+            element == QStyle.ControlElement.CE_ItemViewItem
+            and isinstance(option, QStyleOptionViewItem)
+            and widget is not None
+            and widget.property(QuteStyle.FAST_PATH_PROPERTY)
+        ):
+            self.draw_item_view_item(option, painter, widget)
+            return
         super().drawControl(element, option, painter, widget)
 
+    def draw_item_view_item(
+        self,
+        option: QStyleOptionViewItem,
+        painter: QPainter,
+        widget: QWidget,
+    ) -> None:
+        """
+        Draw a complete view item for a view marked with FAST_PATH_PROPERTY.
+
+        QCommonStyle calls back into this style for every primitive of an
+        item (panel, check indicator, focus rect), which is expensive from
+        Python. This draws the same parts in one pass and evaluates the
+        state flags only once.
+        """
+        state = option.state.value
+        features = option.features.value
+        painter.save()
+        painter.setClipRect(option.rect)
+        if (
+            state & (STATE_SELECTED | STATE_MOUSE_OVER)
+            or cast(QBrush, option.backgroundBrush).style()
+            != Qt.BrushStyle.NoBrush
+        ):
+            self._panel_draw_item_view_item(option, painter, widget)
+
+        if features & _HAS_CHECK_INDICATOR:
+            self.draw_item_view_item_check(
+                option,
+                painter,
+                self.subElementRect(
+                    QStyle.SubElement.SE_ItemViewItemCheckIndicator,
+                    option,
+                    widget,
+                ),
+                (state & CHECK_SPRITE_STATES)
+                | CHECK_STATE_FLAGS[option.checkState],
+            )
+
+        if features & _HAS_DECORATION:
+            if not state & STATE_ENABLED:
+                mode = QIcon.Mode.Disabled
+            elif state & STATE_SELECTED:
+                mode = QIcon.Mode.Selected
+            else:
+                mode = QIcon.Mode.Normal
+            option.icon.paint(
+                painter,
+                self.subElementRect(
+                    QStyle.SubElement.SE_ItemViewItemDecoration,
+                    option,
+                    widget,
+                ),
+                option.decorationAlignment,
+                mode,
+                QIcon.State.On if state & _STATE_OPEN else QIcon.State.Off,
+            )
+
+        if option.text:
+            self._draw_item_view_item_text(
+                option,
+                painter,
+                (
+                    self.subElementRect(
+                        QStyle.SubElement.SE_ItemViewItemText, option, widget
+                    )
+                    if features & (_HAS_CHECK_INDICATOR | _HAS_DECORATION)
+                    # Without check indicator and decoration, the text
+                    # fills the whole item.
+                    else option.rect
+                ),
+                state,
+            )
+        painter.restore()
+
+    @staticmethod
+    def draw_item_view_item_check(
+        option: QStyleOptionViewItem,
+        painter: QPainter,
+        rect: QRect,
+        state: int,
+    ) -> None:
+        """
+        Draw the check indicator of a view item from a cached sprite.
+
+        The sprite is drawn once per size, pixel ratio, state, palette and
+        antialiasing of the RenderQualityManager with the regular indicator
+        drawing.
+        """
+        scale = painter.device().devicePixelRatio()
+        key = (
+            rect.width(),
+            rect.height(),
+            scale,
+            state,
+            option.palette.cacheKey(),
+            RenderQualityManager.inst().antialiasing_key(),
+        )
+        try:
+            pixmap = QuteStyle._CHECK_SPRITES[key]
+        except KeyError:
+            if len(QuteStyle._CHECK_SPRITES) > _MAX_CHECK_SPRITES:
+                QuteStyle._CHECK_SPRITES.clear()
+            pixmap = QPixmap(
+                int(rect.width() * scale), int(rect.height() * scale)
+            )
+            pixmap.setDevicePixelRatio(scale)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            button_option = QStyleOptionButton()
+            button_option.rect = QRect(0, 0, rect.width(), rect.height())
+            button_option.state = QStyle.StateFlag(state)
+            button_option.palette = option.palette
+            sprite_painter = QPainter(pixmap)
+            QuteStyle._draw_primitive_indicator_checkbox(
+                button_option, sprite_painter
+            )
+            sprite_painter.end()
+            QuteStyle._CHECK_SPRITES[key] = pixmap
+        painter.drawPixmap(rect.topLeft(), pixmap)
+
+    @staticmethod
+    def _draw_item_view_item_text(
+        option: QStyleOptionViewItem,
+        painter: QPainter,
+        rect: QRect,
+        state: int,
+    ) -> None:
+        """Draw the wrapped or elided text of a view item into rect."""
+        if not state & STATE_ENABLED:
+            group = QPalette.ColorGroup.Disabled
+        elif state & STATE_ACTIVE:
+            group = QPalette.ColorGroup.Normal
+        else:
+            group = QPalette.ColorGroup.Inactive
+        role = (
+            QPalette.ColorRole.HighlightedText
+            if state & STATE_SELECTED
+            else QPalette.ColorRole.Text
+        )
+        painter.setPen(option.palette.color(group, role))
+        text_rect = rect.adjusted(ITEM_TEXT_MARGIN, 0, -ITEM_TEXT_MARGIN, 0)
+        painter.setFont(option.font)
+        if option.features.value & _WRAP_TEXT:
+            painter.drawText(
+                text_rect,
+                option.displayAlignment.value | _TEXT_WORD_WRAP,
+                option.text,
+            )
+        else:
+            painter.drawText(
+                text_rect,
+                option.displayAlignment,
+                option.fontMetrics.elidedText(
+                    option.text, option.textElideMode, text_rect.width()
+                ),
+            )
+
     def _draw_checkbox(
         self, option: QStyleOptionButton, painter: QPainter, widget: QCheckBox
     ) -> None:
@@ -451,6 +761,185 @@ class QuteStyle(QProxyStyle):
                 QuteStyle.ToggleOptions.BACKGROUND_RECT_RADIUS,
             )
 
+    def drawComplexControl(  # noqa: N802
+        self,
+        control: QStyle.ComplexControl,
+        option: QStyleOptionComplex,
+        painter: QPainter,
+        widget: QWidget | None = None,
+    ) -> None:
+        """Draw a complex control."""
+        if control == QStyle.ComplexControl.CC_ComboBox and isinstance(
+            option, QStyleOptionComboBox
+        ):
+            self.draw_combo_box(option, painter)
+            return
+        super().drawComplexControl(control, option, painter, widget)
+
+    def subControlRect(  # noqa: N802
+        self,
+        control: QStyle.ComplexControl,
+        option: QStyleOptionComplex,
+        sub_control: QStyle.SubControl,
+        widget: QWidget | None = None,
+    ) -> QRect:
+        """Return the rect of a sub control of a complex control."""
+        if control == QStyle.ComplexControl.CC_ComboBox and isinstance(
+            option, QStyleOptionComboBox
+        ):
+            if sub_control == QStyle.SubControl.SC_ComboBoxArrow:
+                return QuteStyle.ComboBoxOptions.drop_down_rect(option)
+            if sub_control == QStyle.SubControl.SC_ComboBoxEditField:
+                return QuteStyle.ComboBoxOptions.edit_field_rect(option)
+            if sub_control in (
+                QStyle.SubControl.SC_ComboBoxFrame,
+                QStyle.SubControl.SC_ComboBoxListBoxPopup,
+            ):
+                return QRect(option.rect)
+        return super().subControlRect(control, option, sub_control, widget)
+
+    def draw_combo_box(
+        self, option: QStyleOptionComboBox, painter: QPainter
+    ) -> None:
+        """
+        Draw the frame, drop-down separator and arrow of a QComboBox.
+
+        The label is not drawn, use CE_ComboBoxLabel for it. StyledComboBox
+        calls this directly to bypass the main style sheet, special cases
+        like a cssClass are left to the style sheet. Since a form usually
+        holds many combo boxes of the same size, the drawing is cached as a
+        sprite per size, pixel ratio, colors and antialiasing of the
+        RenderQualityManager.
+        """
+        state = option.state.value
+        enabled = state & STATE_ENABLED
+        if not enabled:
+            border_color = None
+        elif state & STATE_MOUSE_OVER:
+            border_color = get_color("context_hover")
+        else:
+            border_color = get_color("bg_elements")
+        background_color = get_color(
+            "bg_elements" if enabled else "bg_disabled"
+        )
+        separator_color = get_color("bg_two")
+        arrow_color = get_color("foreground" if enabled else "fg_disabled")
+        rect = option.rect
+        scale = painter.device().devicePixelRatio()
+        key = (
+            rect.width(),
+            rect.height(),
+            scale,
+            border_color,
+            background_color,
+            separator_color,
+            arrow_color,
+            RenderQualityManager.inst().antialiasing_key(),
+        )
+        try:
+            pixmap = QuteStyle._COMBO_BOX_SPRITES[key]
+        except KeyError:
+            if len(QuteStyle._COMBO_BOX_SPRITES) > _MAX_COMBO_BOX_SPRITES:
+                QuteStyle._COMBO_BOX_SPRITES.clear()
+            pixmap = QPixmap(
+                int(rect.width() * scale), int(rect.height() * scale)
+            )
+            pixmap.setDevicePixelRatio(scale)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            sprite_option = QStyleOptionComboBox()
+            sprite_option.rect = QRect(0, 0, rect.width(), rect.height())
+            sprite_option.state = option.state
+            sprite_painter = QPainter(pixmap)
+            self._draw_combo_box_sprite(
+                sprite_option,
+                sprite_painter,
+                (border_color, background_color, separator_color, arrow_color),
+            )
+            sprite_painter.end()
+            QuteStyle._COMBO_BOX_SPRITES[key] = pixmap
+        painter.drawPixmap(rect.topLeft(), pixmap)
+
+    @staticmethod
+    def draw_combo_box_label(
+        option: QStyleOptionComboBox, painter: QPainter
+    ) -> None:
+        """
+        Draw the icon and the text of a non-editable QComboBox.
+
+        This replaces CE_ComboBoxLabel for StyledComboBox, the text is drawn
+        with the painter's pen.
+        """
+        if option.editable:
+            return
+        rect = QuteStyle.ComboBoxOptions.edit_field_rect(option)
+        if not option.currentIcon.isNull():
+            size = option.iconSize
+            mode = (
+                QIcon.Mode.Normal
+                if option.state.value & STATE_ENABLED
+                else QIcon.Mode.Disabled
+            )
+            option.currentIcon.paint(
+                painter,
+                QRect(
+                    rect.left(),
+                    rect.top() + (rect.height() - size.height()) // 2,
+                    size.width(),
+                    size.height(),
+                ),
+                Qt.AlignmentFlag.AlignCenter,
+                mode,
+            )
+            rect.setLeft(rect.left() + size.width() + ITEM_TEXT_MARGIN)
+        painter.drawText(
+            rect,
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+            option.currentText,
+        )
+
+    def _draw_combo_box_sprite(
+        self,
+        option: QStyleOptionComboBox,
+        painter: QPainter,
+        colors: tuple[str | None, str | None, str | None, str],
+    ) -> None:
+        """
+        Draw the parts of a QComboBox with the given colors.
+
+        The colors are those of the border, background, separator and arrow,
+        None is not drawn.
+        """
+        border_color, background_color, separator_color, arrow_color = colors
+        border = QuteStyle.ComboBoxOptions.border(option)
+        radius = QuteStyle.ComboBoxOptions.RADIUS
+        with painter_save(painter):
+            RenderQualityManager.inst().set_antialiasing(painter, radius)
+            if border_color is None:
+                painter.setPen(Qt.PenStyle.NoPen)
+            else:
+                painter.setPen(QPen(QColor(border_color), border))
+            if background_color is None:
+                painter.setBrush(Qt.BrushStyle.NoBrush)
+            else:
+                painter.setBrush(QColor(background_color))
+            # Draw the frame on the pixel centers so that it stays sharp.
+            offset = border / 2
+            painter.drawRoundedRect(
+                QRectF(option.rect).adjusted(offset, offset, -offset, -offset),
+                radius,
+                radius,
+            )
+        if separator_color is not None:
+            separator = QuteStyle.ComboBoxOptions.drop_down_rect(option)
+            separator.setWidth(QuteStyle.ComboBoxOptions.SEPARATOR_WIDTH)
+            painter.fillRect(separator, QColor(separator_color))
+        self.draw_pixmap(
+            painter,
+            QuteStyle.ComboBoxOptions.arrow_rect(option),
+            QuteStyle.ComboBoxOptions.ARROW_ICON,
+            arrow_color,
+        )
+
     def drawPrimitive(  # noqa: N802
         self,
         element: QStyle.PrimitiveElement,
@@ -529,7 +1018,7 @@ class QuteStyle(QProxyStyle):
     ) -> None:
         """Draw the checkbox background rectangle."""
         with painter_save(painter):
-            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            RenderQualityManager.inst().set_antialiasing(painter, 2)
             painter.setPen(Qt.PenStyle.NoPen)
             painter.setBrush(QBrush(QuteStyle._cb_background_color(option)))
             painter.drawRoundedRect(option.rect, 2, 2)  # type: ignore
@@ -541,7 +1030,7 @@ class QuteStyle(QProxyStyle):
     ) -> None:
         # Draw the frame around the rectangle depending on mouse over
         with painter_save(painter):
-            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            RenderQualityManager.inst().set_antialiasing(painter, 1)
             painter.setBrush(Qt.BrushStyle.NoBrush)
             painter.setPen(QPen(QuteStyle._cb_frame_color(option)))
             painter.drawRoundedRect(
@@ -607,13 +1096,14 @@ class QuteStyle(QProxyStyle):
         widget: QWidget | None,
     ) -> None:
         """Draw a view item for a QAbstractItemView."""
+        state = option.state.value
         painter.save()
-        brush = self._item_view_item_background_brush(option)
-        if option.showDecorationSelected and (
-            option.state & QStyle.StateFlag.State_Selected
-            or option.state & QStyle.StateFlag.State_MouseOver
+        if option.showDecorationSelected and state & (
+            STATE_SELECTED | STATE_MOUSE_OVER
         ):
-            painter.fillRect(option.rect, brush)
+            painter.fillRect(
+                option.rect, self.item_view_item_background_brush(option)
+            )
         else:
             if (
                 cast(QBrush, option.backgroundBrush).style()
@@ -624,26 +1114,55 @@ class QuteStyle(QProxyStyle):
                 painter.fillRect(option.rect, option.backgroundBrush)
                 painter.setBrushOrigin(old_brush_origin)
 
-            if option.state & QStyle.StateFlag.State_Selected:
+            if state & STATE_SELECTED:
                 assert widget
                 text_rect = self.subElementRect(
                     QStyle.SubElement.SE_ItemViewItemText, option, widget
                 )
-                painter.fillRect(text_rect, brush)
+                painter.fillRect(
+                    text_rect, self.item_view_item_background_brush(option)
+                )
         painter.restore()
 
+    # Check indicator sprites of view items, see draw_item_view_item_check.
+    _CHECK_SPRITES: dict[
+        tuple[int, int, float, int, int, tuple[RenderQuality, bool]], QPixmap
+    ] = {}
+
+    # Cache of drawn combo boxes, see draw_combo_box.
+    _COMBO_BOX_SPRITES: dict[
+        tuple[
+            int,
+            int,
+            float,
+            str | None,
+            str | None,
+            str | None,
+            str,
+            tuple[RenderQuality, bool],
+        ],
+        QPixmap,
+    ] = {}
+
+    # Brushes for hovered view items by color code. View items are painted
+    # very often, this saves creating a QColor and a QBrush for every item.
+    _HOVER_BRUSHES: dict[str, QBrush] = {}
+
     @staticmethod
-    def _item_view_item_background_brush(
+    def item_view_item_background_brush(
         option: QStyleOptionViewItem,
     ) -> QBrush:
         """Return the brush for painting an ItemView's item background."""
-        if (
-            option.state & QStyle.StateFlag.State_MouseOver
-            and not option.state & QStyle.StateFlag.State_Selected
-        ):
-            return QBrush(QColor(get_color("context_hover")))
-        if option.state & QStyle.StateFlag.State_Enabled:
-            if option.state & QStyle.StateFlag.State_Active:
+        state = option.state.value
+        if state & STATE_MOUSE_OVER and not state & STATE_SELECTED:
+            color = get_color("context_hover")
+            try:
+                return QuteStyle._HOVER_BRUSHES[color]
+            except KeyError:
+                brush = QuteStyle._HOVER_BRUSHES[color] = QBrush(QColor(color))
+                return brush
+        if state & STATE_ENABLED:
+            if state & STATE_ACTIVE:
                 color_group = QPalette.ColorGroup.Normal
             else:
                 color_group = QPalette.ColorGroup.Inactive
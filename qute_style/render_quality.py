@@ -0,0 +1,147 @@
+"""Render quality tiers for the paint paths of QuteStyle."""
+
+from __future__ import annotations
+
+import logging
+import time
+from enum import Enum
+
+from PySide6.QtCore import QObject, Qt, Signal
+from PySide6.QtGui import QPainter
+from PySide6.QtWidgets import QWidget
+
+from qute_style.animation_policy import AnimationPolicyManager
+
+log = logging.getLogger(
+    f"qute_style.{__name__}"
+)  # pylint: disable=invalid-name
+
+
+class RenderQuality(Enum):
+    """Define how carefully the QuteStyle widgets are rendered."""
+
+    # Antialiasing and smooth scaling everywhere.
+    HIGH = "high"
+    # No antialiasing for small rounded rects and while animations run.
+    BALANCED = "balanced"
+    # No antialiasing and fast scaling.
+    FAST = "fast"
+
+
+class RenderQualityManager(QObject):
+    """
+    Global handler of the RenderQuality.
+
+    To use, get the current instance with RenderQualityManager.inst(). The
+    paint paths call `set_antialiasing` instead of enabling antialiasing
+    unconditionally and the PixmapStore scales with `transformation_mode`.
+    Cached sprites (like the rounded rects of the PixmapStore) are always
+    antialiased, as they are only drawn once. Sprites that are drawn with
+    `set_antialiasing` (like the check indicators of QuteStyle) include the
+    `antialiasing_key` in their cache key.
+
+    `calibrate` measures the paint time of a widget (usually the main window)
+    and picks the tier accordingly.
+    """
+
+    INST: RenderQualityManager | None = None
+
+    quality_changed = Signal(RenderQuality, name="quality_changed")
+
+    # Largest radius of an axis-aligned rounded rect that is drawn without
+    # antialiasing with BALANCED quality.
+    SMALL_RADIUS = 2
+    # Calibrated paint times in ms up to which HIGH or BALANCED are used.
+    HIGH_PAINT_TIME = 8
+    BALANCED_PAINT_TIME = 16
+
+    def __init__(self) -> None:
+        """Create a new RenderQualityManager instance."""
+        assert not RenderQualityManager.INST
+        super().__init__()
+        self._quality = RenderQuality.HIGH
+
+    @classmethod
+    def inst(cls) -> RenderQualityManager:
+        """Return the current instance of the RenderQualityManager."""
+        if not RenderQualityManager.INST:
+            RenderQualityManager.INST = RenderQualityManager()
+        return RenderQualityManager.INST
+
+    @property
+    def quality(self) -> RenderQuality:
+        """Return the current RenderQuality."""
+        return self._quality
+
+    @quality.setter
+    def quality(self, quality: RenderQuality) -> None:
+        """Set the RenderQuality."""
+        if quality != self._quality:
+            log.debug("Setting render quality to %s", quality)
+            self._quality = quality
+            self.quality_changed.emit(quality)
+
+    def antialiasing(self, radius: float | None = None) -> bool:
+        """
+        Return if a shape should be drawn antialiased.
+
+        The radius is that of an axis-aligned rounded rect, None for any
+        other shape.
+        """
+        if self._quality == RenderQuality.HIGH:
+            return True
+        if self._quality == RenderQuality.FAST:
+            return False
+        if radius is not None and radius <= self.SMALL_RADIUS:
+            return False
+        return not AnimationPolicyManager.inst().animation_running
+
+    def antialiasing_key(self) -> tuple[RenderQuality, bool]:
+        """
+        Return the state that `antialiasing` depends on.
+
+        That's the quality and, with BALANCED, if an animation is running.
+        """
+        return (
+            self._quality,
+            self._quality == RenderQuality.BALANCED
+            and AnimationPolicyManager.inst().animation_running,
+        )
+
+    def set_antialiasing(
+        self, painter: QPainter, radius: float | None = None
+    ) -> None:
+        """Set the antialiasing of the painter for the shape to draw."""
+        painter.setRenderHint(
+            QPainter.RenderHint.Antialiasing, self.antialiasing(radius)
+        )
+
+    def transformation_mode(self) -> Qt.TransformationMode:
+        """Return the mode to scale pixmaps with."""
+        if self._quality == RenderQuality.FAST:
+            return Qt.TransformationMode.FastTransformation
+        return Qt.TransformationMode.SmoothTransformation
+
+    def calibrate(self, widget: QWidget, samples: int = 3) -> RenderQuality:
+        """
+        Pick the RenderQuality from the paint time of the given widget.
+
+        The widget is painted with HIGH quality a few times and the fastest
+        paint time is compared to HIGH_PAINT_TIME and BALANCED_PAINT_TIME.
+        """
+        self.quality = RenderQuality.HIGH
+        paint_times = []
+        for _ in range(samples):
+            start = time.perf_counter()
+            widget.grab()
+            paint_times.append((time.perf_counter() - start) * 1000)
+        paint_time = min(paint_times)
+        if paint_time <= self.HIGH_PAINT_TIME:
+            quality = RenderQuality.HIGH
+        elif paint_time <= self.BALANCED_PAINT_TIME:
+            quality = RenderQuality.BALANCED
+        else:
+            quality = RenderQuality.FAST
+        log.info("Paint time of %.1f ms, using %s", paint_time, quality)
+        self.quality = quality
+        return quality
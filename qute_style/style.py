@@ -736,6 +736,11 @@ QFrame#app_background {{
     border-radius: 10;
     border: 2px;
 }}
+/* See BackgroundFrame.window_maximized */
+QFrame#app_background[windowMaximized="true"] {{
+    border-radius: 0;
+    border: 0px;
+}}
 QFrame {{
     color: {foreground};
     font: 9pt 'Segoe UI';
@@ -2,17 +2,46 @@
 
 from __future__ import annotations
 
-from PySide6.QtGui import QColor
+import math
+from typing import cast
+
+from PySide6.QtCore import QEvent, QObject, QPoint, QRect, QRectF, Qt
+from PySide6.QtGui import QColor, QImage, QPainter, QPainterPath, QPaintEvent
 from PySide6.QtWidgets import (
     QFrame,
-    QGraphicsDropShadowEffect,
+    QGraphicsBlurEffect,
+    QGraphicsPathItem,
+    QGraphicsScene,
     QHBoxLayout,
     QWidget,
 )
 
 
 class BackgroundFrame(QFrame):
-    """BackgroundFrame for the App."""
+    """
+    BackgroundFrame for the App.
+
+    The frame draws a drop shadow around itself onto its parent widget. The
+    shadow is a blurred rounded rect that is rendered once per device pixel
+    ratio and drawn as a nine-patch: the corners are drawn as they are and
+    the edges are stretched. In contrast to a
+    QGraphicsDropShadowEffect, repainting a child of the frame doesn't
+    render and blur the whole frame again.
+    """
+
+    # Dynamic property that selects the look of a maximized window in the
+    # main stylesheet.
+    MAXIMIZED_PROPERTY = "windowMaximized"
+
+    SHADOW_BLUR_RADIUS: int = 20
+    SHADOW_COLOR: QColor = QColor(0, 0, 0, 160)
+    # Radius of the rounded rect that casts the shadow, like the default
+    # border radius of the frame.
+    SHADOW_CORNER_RADIUS: int = 10
+
+    # Rendered shadows per blur radius, corner radius, color and device pixel
+    # ratio, shared by all frames.
+    _SHADOWS: dict[tuple[int, int, int, float], QImage] = {}
 
     def __init__(self, parent: QWidget | None = None) -> None:
         """Create a new BackgroundFrame."""
@@ -23,15 +52,18 @@ class BackgroundFrame(QFrame):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(2)
 
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(20)
-        shadow.setXOffset(0)
-        shadow.setYOffset(0)
-        shadow.setColor(QColor(0, 0, 0, 160))
-        self.setGraphicsEffect(shadow)
+        self._shadow_visible = True
+        # The widget the shadow is drawn on.
+        self._shadow_parent: QWidget | None = None
+        self._watch_parent()
 
     def set_stylesheet(self, border_radius: int, border_size: int) -> None:
-        """Set the stylesheet with custom border radius and size."""
+        """
+        Set the stylesheet with custom border radius and size.
+
+        This polishes all widgets in the frame again. To switch between the
+        normal and the maximized look, use `window_maximized`.
+        """
         self.setStyleSheet(
             f"""
             #app_background {{
@@ -40,3 +72,200 @@ class BackgroundFrame(QFrame):
                 }}
             """
         )
+
+    @property
+    def window_maximized(self) -> bool:
+        """Return if the frame has the look of a maximized window."""
+        return bool(self.property(self.MAXIMIZED_PROPERTY))
+
+    @window_maximized.setter
+    def window_maximized(self, maximized: bool) -> None:
+        """
+        Set if the frame has the look of a maximized window.
+
+        A maximized frame has neither rounded corners, nor border or shadow.
+        The look of both modes is defined in the main stylesheet. Only the
+        frame itself is polished again, not the widgets it contains.
+        """
+        if maximized == self.window_maximized:
+            return
+        self.setProperty(self.MAXIMIZED_PROPERTY, maximized)
+        self.style().unpolish(self)
+        self.style().polish(self)
+        self.update()
+        self.shadow_visible = not maximized
+
+    @property
+    def shadow_visible(self) -> bool:
+        """Return if the shadow is drawn around the frame."""
+        return self._shadow_visible
+
+    @shadow_visible.setter
+    def shadow_visible(self, visible: bool) -> None:
+        """Set if the shadow is drawn, e.g. not when maximized."""
+        if visible == self._shadow_visible:
+            return
+        self._shadow_visible = visible
+        if self._shadow_parent is not None:
+            self._shadow_parent.update(self._shadow_rect())
+
+    def event(self, event: QEvent) -> bool:
+        """Follow the parent the frame is drawn on and its own geometry."""
+        if event.type() == QEvent.Type.ParentChange:
+            self._watch_parent()
+        elif (
+            event.type() in (QEvent.Type.Move, QEvent.Type.Resize)
+            and self._shadow_visible
+            and self._shadow_parent is not None
+        ):
+            # Qt only repaints the old and new rect of the frame itself.
+            self._shadow_parent.update()
+        return super().event(event)
+
+    def eventFilter(self, obj: QObject, event: QEvent) -> bool:  # noqa: N802
+        """Draw the shadow before the parent widget is painted."""
+        if (
+            event.type() == QEvent.Type.Paint
+            and obj is self._shadow_parent
+            and self._shadow_visible
+            and self.isVisible()
+        ):
+            self._paint_shadow(
+                self._shadow_parent, cast(QPaintEvent, event).rect()
+            )
+        return False
+
+    def _watch_parent(self) -> None:
+        """Move the event filter to the current parent widget."""
+        if self._shadow_parent is not None:
+            self._shadow_parent.removeEventFilter(self)
+        self._shadow_parent = self.parentWidget()
+        if self._shadow_parent is not None:
+            self._shadow_parent.installEventFilter(self)
+
+    def _shadow_rect(self) -> QRect:
+        """Return the rect of the shadow in the coordinates of the parent."""
+        margin = self.SHADOW_BLUR_RADIUS
+        return self.geometry().adjusted(-margin, -margin, margin, margin)
+
+    def _paint_shadow(self, widget: QWidget, update_rect: QRect) -> None:
+        """Draw the parts of the nine-patch shadow onto the widget."""
+        frame = self.geometry()
+        corner = self.SHADOW_CORNER_RADIUS
+        # The frame covers the shadow except for its rounded corners.
+        if frame.adjusted(corner, corner, -corner, -corner).contains(
+            update_rect
+        ):
+            return
+        dpr = widget.devicePixelRatioF()
+        image = self._shadow_image(dpr)
+        outer = self._shadow_rect()
+        # Size of the corner patches in logical pixels
+        size = 2 * self.SHADOW_BLUR_RADIUS + corner
+        width = min(size, outer.width() // 2)
+        height = min(size, outer.height() // 2)
+        middle = (size + 1) * dpr
+        edge = size * dpr
+        left, top = outer.left(), outer.top()
+        right, bottom = left + outer.width(), top + outer.height()
+        inner_width = outer.width() - 2 * width
+        inner_height = outer.height() - 2 * height
+
+        painter = QPainter(widget)
+        for target, source in (
+            # corners
+            (QRectF(left, top, width, height), QRectF(0, 0, edge, edge)),
+            (
+                QRectF(right - width, top, width, height),
+                QRectF(middle, 0, edge, edge),
+            ),
+            (
+                QRectF(left, bottom - height, width, height),
+                QRectF(0, middle, edge, edge),
+            ),
+            (
+                QRectF(right - width, bottom - height, width, height),
+                QRectF(middle, middle, edge, edge),
+            ),
+            # edges
+            (
+                QRectF(left + width, top, inner_width, height),
+                QRectF(edge, 0, dpr, edge),
+            ),
+            (
+                QRectF(left + width, bottom - height, inner_width, height),
+                QRectF(edge, middle, dpr, edge),
+            ),
+            (
+                QRectF(left, top + height, width, inner_height),
+                QRectF(0, edge, edge, dpr),
+            ),
+            (
+                QRectF(right - width, top + height, width, inner_height),
+                QRectF(middle, edge, edge, dpr),
+            ),
+        ):
+            if target.isValid():
+                painter.drawImage(target, image, source)
+        painter.end()
+
+    def _shadow_image(self, dpr: float) -> QImage:
+        """Return the rendered shadow for the device pixel ratio."""
+        key = (
+            self.SHADOW_BLUR_RADIUS,
+            self.SHADOW_CORNER_RADIUS,
+            self.SHADOW_COLOR.rgba(),
+            dpr,
+        )
+        image = BackgroundFrame._SHADOWS.get(key)
+        if image is None:
+            image = _render_shadow(
+                self.SHADOW_BLUR_RADIUS,
+                self.SHADOW_CORNER_RADIUS,
+                self.SHADOW_COLOR,
+                dpr,
+            )
+            BackgroundFrame._SHADOWS[key] = image
+        return image
+
+
+def _render_shadow(
+    blur_radius: int, corner_radius: int, color: QColor, dpr: float
+) -> QImage:
+    """
+    Render the shadow of a rounded rect as nine-patch image.
+
+    The rounded rect is large enough that the blur of one corner doesn't reach
+    the opposite one. Its center row and column are stretched to the size of
+    the frame.
+    """
+    size = 2 * blur_radius + corner_radius
+    image_size = math.ceil((2 * size + 1) * dpr)
+    path = QPainterPath()
+    rect_size = (2 * (blur_radius + corner_radius) + 1) * dpr
+    path.addRoundedRect(
+        QRectF(blur_radius * dpr, blur_radius * dpr, rect_size, rect_size),
+        corner_radius * dpr,
+        corner_radius * dpr,
+    )
+    item = QGraphicsPathItem(path)
+    item.setBrush(color)
+    item.setPen(Qt.PenStyle.NoPen)
+    blur = QGraphicsBlurEffect()
+    # With half the radius, the falloff is like the one of a
+    # QGraphicsDropShadowEffect with the full blur radius.
+    blur.setBlurRadius(blur_radius * dpr / 2)
+    blur.setBlurHints(QGraphicsBlurEffect.BlurHint.PerformanceHint)
+    item.setGraphicsEffect(blur)
+    scene = QGraphicsScene()
+    scene.addItem(item)
+
+    image = QImage(
+        image_size, image_size, QImage.Format.Format_ARGB32_Premultiplied
+    )
+    image.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(image)
+    source = QRectF(QPoint(0, 0), image.size().toSizeF())
+    scene.render(painter, source, source)
+    painter.end()
+    return image
@@ -0,0 +1,194 @@
+"""Compact list model for the items of a CheckableComboBox."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+from PySide6.QtCore import (
+    QAbstractListModel,
+    QModelIndex,
+    QObject,
+    QPersistentModelIndex,
+    Qt,
+)
+from PySide6.QtGui import QIcon
+
+
+class CheckableListModel(QAbstractListModel):
+    """
+    List model that stores checkable items in flat arrays.
+
+    A QStandardItemModel stores every item as a QStandardItem with a map of
+    QVariants. This model keeps the texts, the data (like the data of a
+    QStandardItem in Qt.ItemDataRole.UserRole + 1) and the icons in lists and
+    the check states in a bitset, which needs a fraction of the memory for
+    large lists. Icons are shared between items.
+    """
+
+    # Role of the item data, like QStandardItem.data().
+    DATA_ROLE = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        """Create a new, empty CheckableListModel."""
+        super().__init__(parent)
+        self._texts: list[str] = []
+        self._data: list[Any] = []
+        self._icons: list[QIcon | None] = []
+        # Check state of row n in bit n % 8 of byte n // 8.
+        self._checked = bytearray()
+
+    def rowCount(  # noqa: N802
+        self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()
+    ) -> int:
+        """Return the number of items."""
+        if parent.isValid():
+            return 0
+        return len(self._texts)
+
+    def flags(self, index: QModelIndex | QPersistentModelIndex) -> Qt.ItemFlag:
+        """Return the flags of a checkable item."""
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsUserCheckable
+
+    def data(
+        self,
+        index: QModelIndex | QPersistentModelIndex,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        """Return the data of the item for the given role."""
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return self._texts[row]
+        if role == Qt.ItemDataRole.CheckStateRole:
+            return self.check_state(row)
+        if role == self.DATA_ROLE:
+            return self._data[row]
+        if role == Qt.ItemDataRole.DecorationRole:
+            return self._icons[row]
+        return None
+
+    def setData(  # noqa: N802
+        self,
+        index: QModelIndex | QPersistentModelIndex,
+        value: Any,
+        role: int = Qt.ItemDataRole.EditRole,
+    ) -> bool:
+        """Set the data of the item for the given role."""
+        if not index.isValid():
+            return False
+        row = index.row()
+        if role == Qt.ItemDataRole.CheckStateRole:
+            self.set_check_state(row, Qt.CheckState(value))
+            return True
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            self._texts[row] = str(value)
+        elif role == self.DATA_ROLE:
+            self._data[row] = value
+        elif role == Qt.ItemDataRole.DecorationRole:
+            self._icons[row] = value
+        else:
+            return False
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def insertRows(  # noqa: N802
+        self,
+        row: int,
+        count: int,
+        parent: QModelIndex | QPersistentModelIndex = QModelIndex(),
+    ) -> bool:
+        """Insert count empty, unchecked items before the given row."""
+        if parent.isValid() or not 0 <= row <= self.rowCount() or count < 1:
+            return False
+        self.beginInsertRows(QModelIndex(), row, row + count - 1)
+        self._texts[row:row] = [""] * count
+        self._data[row:row] = [None] * count
+        self._icons[row:row] = [None] * count
+        self._shift_bits(row, count)
+        self.endInsertRows()
+        return True
+
+    def removeRows(  # noqa: N802
+        self,
+        row: int,
+        count: int,
+        parent: QModelIndex | QPersistentModelIndex = QModelIndex(),
+    ) -> bool:
+        """Remove count items starting with the given row."""
+        if (
+            parent.isValid()
+            or count < 1
+            or row < 0
+            or row + count > self.rowCount()
+        ):
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row + count - 1)
+        del self._texts[row : row + count]
+        del self._data[row : row + count]
+        del self._icons[row : row + count]
+        self._shift_bits(row, -count)
+        self.endRemoveRows()
+        return True
+
+    def add_items(
+        self, items: Iterable[tuple[str, Any]], icon: QIcon | None = None
+    ) -> None:
+        """Append unchecked items given as (text, data) at once."""
+        texts, data = [], []
+        for text, item_data in items:
+            texts.append(text)
+            data.append(item_data)
+        if not texts:
+            return
+        first = self.rowCount()
+        self.beginInsertRows(QModelIndex(), first, first + len(texts) - 1)
+        self._texts += texts
+        self._data += data
+        self._icons += [icon] * len(texts)
+        self._resize_bits()
+        self.endInsertRows()
+
+    def item_data(self, row: int) -> Any:
+        """Return the data of the item in the given row."""
+        return self._data[row]
+
+    def check_state(self, row: int) -> Qt.CheckState:
+        """Return the check state of the item in the given row."""
+        if self._checked[row >> 3] & (1 << (row & 7)):
+            return Qt.CheckState.Checked
+        return Qt.CheckState.Unchecked
+
+    def set_check_state(self, row: int, state: Qt.CheckState) -> None:
+        """Check or uncheck the item in the given row."""
+        if state == self.check_state(row):
+            return
+        if state == Qt.CheckState.Checked:
+            self._checked[row >> 3] |= 1 << (row & 7)
+        else:
+            self._checked[row >> 3] &= ~(1 << (row & 7)) & 0xFF
+        index = self.index(row, 0)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+
+    def _resize_bits(self) -> None:
+        """Resize the bitset to the number of items."""
+        size = (self.rowCount() + 7) >> 3
+        if len(self._checked) < size:
+            self._checked.extend(bytes(size - len(self._checked)))
+        else:
+            del self._checked[size:]
+
+    def _shift_bits(self, row: int, count: int) -> None:
+        """Shift the bits from the given row by count (negative: remove)."""
+        bits = int.from_bytes(self._checked, "little")
+        low = bits & ((1 << row) - 1)
+        if count > 0:
+            high = (bits >> row) << (row + count)
+        else:
+            high = (bits >> (row - count)) << row
+        size = max(len(self._checked), (self.rowCount() + 7) >> 3)
+        self._checked = bytearray((low | high).to_bytes(size, "little"))
+        self._resize_bits()
@@ -3,11 +3,20 @@
 from __future__ import annotations
 
 import logging
+import math
 from collections import defaultdict
 
-from PySide6.QtCore import QPoint, QRect, QSize, Qt
-from PySide6.QtGui import QColor, QIcon, QIconEngine, QPainter, QPixmap
+from PySide6.QtCore import QPoint, QRect, QRectF, QSize, Qt
+from PySide6.QtGui import (
+    QColor,
+    QIcon,
+    QIconEngine,
+    QImageReader,
+    QPainter,
+    QPixmap,
+)
 
+from qute_style.render_quality import RenderQualityManager
 from qute_style.style import get_color
 
 # pylint: disable=invalid-name
@@ -76,10 +85,20 @@ class PixmapStore:
     _pixmaps: dict[str, dict[tuple[int, int], dict[str | None, QPixmap]]] = (
         defaultdict(lambda: defaultdict(dict))
     )
+    # _scaled_pixmaps[path, width, height, color, device pixel ratio]
+    _scaled_pixmaps: dict[tuple[str, int, int, str | None, float], QPixmap] = (
+        {}
+    )
+    # _rounded_rects[width, height, radius, color, device pixel ratio]
+    _rounded_rects: dict[tuple[int, int, int, str, float], QPixmap] = {}
+    # Upper bound of stored rounded rects.
+    MAX_ROUNDED_RECTS = 512
 
     def __init__(self) -> None:
         """Create a new PixmapStore instance."""
         assert not PixmapStore.INST
+        # The icons are scaled according to the render quality.
+        RenderQualityManager.inst().quality_changed.connect(self.clear_pixmaps)
 
     # make sure correct class is called --> maybe privat or something
     @classmethod
@@ -89,6 +108,12 @@ class PixmapStore:
             PixmapStore.INST = PixmapStore()
         return PixmapStore.INST
 
+    def clear_pixmaps(self) -> None:
+        """Remove all icon pixmaps, they are created again when needed."""
+        log.debug("Clearing the icon pixmaps")
+        self._pixmaps.clear()
+        self._scaled_pixmaps.clear()
+
     def get_pixmap(
         self, path: str, width: int, height: int, color: str | None = None
     ) -> QPixmap:
@@ -129,7 +154,108 @@ class PixmapStore:
                 width,
                 height,
                 Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
+                RenderQualityManager.inst().transformation_mode(),
             )
             self._pixmaps[path][width, height][color] = pixmap
             return pixmap
+
+    def get_scaled_pixmap(
+        self,
+        path: str,
+        width: int,
+        height: int,
+        color: str | None = None,
+        scale: float = 1.0,
+    ) -> QPixmap:
+        """
+        Return the pixmap with width and height for a device pixel ratio.
+
+        Unlike get_pixmap, the image is read at the size in device pixels,
+        so that an svg is rendered sharp instead of scaled up. It's stretched
+        to width and height. The color is optional like for get_pixmap.
+        """
+        key = (path, width, height, color, scale)
+        try:
+            return self._scaled_pixmaps[key]
+        except KeyError as exc:
+            log.debug(
+                "Creating QPixmap for path '%s' with width '%s', height '%s', "
+                "color '%s' and device pixel ratio '%s'",
+                *key,
+            )
+            reader = QImageReader(path)
+            reader.setScaledSize(
+                QSize(math.ceil(width * scale), math.ceil(height * scale))
+            )
+            image = reader.read()
+            if image.isNull():
+                raise ValueError(f"Could not load pixmap: {path}") from exc
+            if color:
+                painter = QPainter(image)
+                painter.setCompositionMode(
+                    QPainter.CompositionMode.CompositionMode_SourceIn
+                )
+                painter.fillRect(image.rect(), QColor(color))
+                painter.end()
+            pixmap = QPixmap.fromImage(image)
+            pixmap.setDevicePixelRatio(scale)
+            self._scaled_pixmaps[key] = pixmap
+            return pixmap
+
+    def get_rounded_rect(
+        self,
+        width: int,
+        height: int,
+        radius: int,
+        color: str,
+        scale: float = 1.0,
+    ) -> QPixmap:
+        """
+        Return the sprite of an antialiased rounded rect from the store.
+
+        The color is a color code, so that the sprites of different themes
+        don't get mixed up. The store is reset when it holds too many sprites,
+        e.g. after resizing or animating buttons.
+        """
+        key = (width, height, radius, color, scale)
+        try:
+            return self._rounded_rects[key]
+        except KeyError:
+            if len(self._rounded_rects) >= self.MAX_ROUNDED_RECTS:
+                log.debug("Clearing %s rounded rects", self.MAX_ROUNDED_RECTS)
+                self._rounded_rects.clear()
+            pixmap = QPixmap(
+                math.ceil(width * scale), math.ceil(height * scale)
+            )
+            pixmap.setDevicePixelRatio(scale)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(color))
+            painter.drawRoundedRect(
+                QRectF(0, 0, width, height), radius, radius
+            )
+            painter.end()
+            self._rounded_rects[key] = pixmap
+            return pixmap
+
+    def draw_rounded_rect(
+        self, painter: QPainter, rect: QRect, radius: int, color: str
+    ) -> None:
+        """
+        Draw an antialiased rounded rect in the given color code.
+
+        Blitting the sprite is a lot faster than QPainter.drawRoundedRect,
+        which matters for buttons that are repainted on hover.
+        """
+        painter.drawPixmap(
+            rect.topLeft(),
+            self.get_rounded_rect(
+                rect.width(),
+                rect.height(),
+                radius,
+                color,
+                painter.device().devicePixelRatio(),
+            ),
+        )
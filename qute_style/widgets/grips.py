@@ -1,28 +1,150 @@
 """Custom widgets for grips to resize the application."""
 
+from __future__ import annotations
+
 import logging
+from collections.abc import Callable
+from enum import Enum
 from typing import TYPE_CHECKING
 
-from PySide6.QtCore import QRect, Qt, Signal
+from PySide6.QtCore import QObject, QRect, Qt, Signal
 from PySide6.QtGui import QCursor, QMouseEvent
-from PySide6.QtWidgets import QSizeGrip, QWidget
+from PySide6.QtWidgets import QRubberBand, QSizeGrip, QWidget
+
+from qute_style.frame_throttle import FrameThrottle
 
 log = logging.getLogger(
     f"qute_style.{__name__}"
 )  # pylint: disable=invalid-name
 
 
+class ResizeMode(Enum):
+    """Define how the grips resize the window."""
+
+    # Set the geometry on every mouse move.
+    LIVE = "live"
+    # Set the geometry at most once per display frame.
+    COALESCED = "coalesced"
+    # Let the window system resize the window (QWindow.startSystemResize).
+    # If the platform doesn't support it, the grips resize like COALESCED.
+    SYSTEM = "system"
+    # Show an outline of the new geometry and set it on release.
+    OUTLINE = "outline"
+
+
+class GripResizer(QObject):
+    """
+    Apply the geometries requested by a grip according to a ResizeMode.
+
+    Every mouse move of a grip requests a new geometry for the window.
+    Setting it relayouts and repaints the whole window, so with COALESCED
+    only the latest geometry is applied once per display frame (see
+    FrameThrottle). The last requested geometry is always applied when the
+    mouse is released.
+    """
+
+    def __init__(
+        self,
+        grip: QWidget,
+        mode: ResizeMode,
+        edges: Qt.Edge,
+        apply: Callable[[QRect], None],
+    ) -> None:
+        """Create a new GripResizer for the grip at the given edges."""
+        super().__init__(grip)
+        self._grip = grip
+        self._mode = mode
+        self._edges = edges
+        self._apply = apply
+        self._throttle: FrameThrottle[QRect] = FrameThrottle(grip, apply)
+        # Geometry of the outline with ResizeMode.OUTLINE
+        self._outline_geometry: QRect | None = None
+        self._outline: QRubberBand | None = None
+
+    @property
+    def mode(self) -> ResizeMode:
+        """Return the ResizeMode."""
+        return self._mode
+
+    def start(self) -> bool:
+        """
+        Start resizing on a mouse press.
+
+        Return True if the window system took over resizing the window. In
+        that case, the grip won't receive the following mouse moves.
+        """
+        self._throttle.reset()
+        if self._mode != ResizeMode.SYSTEM:
+            return False
+        handle = self._grip.window().windowHandle()
+        if handle is not None and handle.startSystemResize(self._edges):
+            log.debug("System resize started for edges %s", self._edges)
+            return True
+        return False
+
+    def request(self, geometry: QRect) -> None:
+        """Request the given geometry for the window."""
+        if self._mode == ResizeMode.LIVE:
+            self._apply(geometry)
+        elif self._mode == ResizeMode.OUTLINE:
+            self._outline_geometry = geometry
+            self._show_outline(geometry)
+        else:
+            self._throttle.request(geometry)
+
+    def finish(self) -> None:
+        """Apply the last requested geometry on a mouse release."""
+        if self._outline is not None:
+            # The outline has no parent that would delete it.
+            self._outline.hide()
+            self._outline.deleteLater()
+            self._outline = None
+        if self._outline_geometry is not None:
+            geometry, self._outline_geometry = self._outline_geometry, None
+            self._apply(geometry)
+        self._throttle.flush()
+
+    def _show_outline(self, geometry: QRect) -> None:
+        """Show the outline of the window at the given geometry."""
+        if self._outline is None:
+            # The outline is a window of its own, as it may be larger than
+            # the window that is resized.
+            self._outline = QRubberBand(QRubberBand.Shape.Rectangle)
+            # Close it together with the window if the resize doesn't finish.
+            self._grip.destroyed.connect(self._outline.deleteLater)
+        self._outline.setGeometry(geometry)
+        self._outline.show()
+
+
 class CornerGrip(QSizeGrip):
     """Widget that shows a grip handle in a corner."""
 
     window_geometry_changed = Signal(QRect, name="window_geometry_changed")
 
-    def __init__(self, parent: QWidget, position: Qt.Corner) -> None:
+    EDGES = {
+        Qt.Corner.TopLeftCorner: Qt.Edge.TopEdge | Qt.Edge.LeftEdge,
+        Qt.Corner.TopRightCorner: Qt.Edge.TopEdge | Qt.Edge.RightEdge,
+        Qt.Corner.BottomLeftCorner: Qt.Edge.BottomEdge | Qt.Edge.LeftEdge,
+        Qt.Corner.BottomRightCorner: Qt.Edge.BottomEdge | Qt.Edge.RightEdge,
+    }
+
+    def __init__(
+        self,
+        parent: QWidget,
+        position: Qt.Corner,
+        resize_mode: ResizeMode = ResizeMode.COALESCED,
+    ) -> None:
         """Create a new CornerGrip."""
         super().__init__(parent)
         self._position = position
         self.setObjectName("grip")
         self.setFixedSize(15, 15)
+        self._resizer = GripResizer(
+            self,
+            resize_mode,
+            self.EDGES[position],
+            self.window_geometry_changed.emit,
+        )
 
     if TYPE_CHECKING:
 
@@ -49,6 +171,12 @@ class CornerGrip(QSizeGrip):
         not working.
         """
         log.debug("Mouse press event")
+        self._resizer.start()
+
+    def mouseReleaseEvent(self, event: QMouseEvent) -> None:  # noqa: N802
+        """Apply the last geometry when the mouse is released."""
+        self._resizer.finish()
+        super().mouseReleaseEvent(event)
 
     def mouseMoveEvent(self, event: QMouseEvent) -> None:  # noqa: N802
         """
@@ -107,7 +235,7 @@ class CornerGrip(QSizeGrip):
             )
             geo.setHeight(height)
             geo.setWidth(width)
-        self.window_geometry_changed.emit(geo)
+        self._resizer.request(geo)
 
 
 class EdgeGrip(QWidget):
@@ -115,12 +243,20 @@ class EdgeGrip(QWidget):
 
     window_geometry_changed = Signal(QRect, name="window_geometry_changed")
 
-    def __init__(self, parent: QWidget, position: Qt.Edge) -> None:
+    def __init__(
+        self,
+        parent: QWidget,
+        position: Qt.Edge,
+        resize_mode: ResizeMode = ResizeMode.COALESCED,
+    ) -> None:
         """Create a new EdgeGrip."""
         super().__init__(parent)
         self.installEventFilter(self.parent())
         self._position = position
         self.setObjectName("grip")
+        self._resizer = GripResizer(
+            self, resize_mode, position, self.window_geometry_changed.emit
+        )
         if position in (Qt.Edge.TopEdge, Qt.Edge.BottomEdge):
             self.setCursor(QCursor(Qt.CursorShape.SizeVerCursor))
             self.setMaximumHeight(10)
@@ -146,6 +282,16 @@ class EdgeGrip(QWidget):
         elif self._position == Qt.Edge.RightEdge:
             self.setGeometry(width - 15, 10, 10, height)
 
+    def mousePressEvent(self, event: QMouseEvent) -> None:  # noqa: N802
+        """Start resizing, possibly by the window system."""
+        self._resizer.start()
+        event.accept()
+
+    def mouseReleaseEvent(self, event: QMouseEvent) -> None:  # noqa: N802
+        """Apply the last geometry when the mouse is released."""
+        self._resizer.finish()
+        event.accept()
+
     def mouseMoveEvent(self, event: QMouseEvent) -> None:  # noqa: N802
         """
         Handle a mouse move event to resize the grip.
@@ -169,7 +315,7 @@ class EdgeGrip(QWidget):
                 self.parent().minimumWidth(), self.parent().width() + delta_x
             )
             geo.setWidth(width)
-        self.window_geometry_changed.emit(geo)
+        self._resizer.request(geo)
 
     def _resize_y(self, delta_y: int) -> None:
         """Resize the grip in y-direction."""
@@ -186,4 +332,4 @@ class EdgeGrip(QWidget):
                 self.parent().height() + delta_y,
             )
             geo.setHeight(height)
-        self.window_geometry_changed.emit(geo)
+        self._resizer.request(geo)
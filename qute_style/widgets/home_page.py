@@ -33,6 +33,7 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from qute_style.animation_policy import AnimationPolicyManager
 from qute_style.dev.dev_functions import VersionInfo
 from qute_style.style import THEMES, _create_theme_drawing, log
 from qute_style.widgets.base_widgets import MainWidget
@@ -57,7 +58,6 @@ class StackedWidget(QStackedWidget):
         super().__init__(parent)
         self._animation_running = False
         self._animation = QPropertyAnimation(self, b"size")
-        self._animation.setDuration(400)
         self._animation.setEasingCurve(QEasingCurve.Type.OutQuad)
         self._animation.finished.connect(self.on_animation_finished)
 
@@ -79,8 +79,10 @@ class StackedWidget(QStackedWidget):
                     self.currentWidget().width(), self.currentWidget().height()
                 )
             )
-            self._animation.start()
+            AnimationPolicyManager.inst().configure(self._animation, 400)
+            # Set the flag first, the animation finishes at once if it's off.
             self._animation_running = True
+            self._animation.start()
 
     @Slot(name="on_animation_finished")
     def on_animation_finished(self) -> None:
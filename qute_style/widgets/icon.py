@@ -1,20 +1,34 @@
 """Icon that can be painted in any given color."""
 
-from typing import cast
-
 from PySide6 import QtGui
+from PySide6.QtCore import QEvent
 from PySide6.QtGui import QPainter, QPixmap
-from PySide6.QtWidgets import QApplication, QWidget
+from PySide6.QtWidgets import QWidget
 
 from qute_style.style import get_color
 from qute_style.widgets.custom_icon_engine import PixmapStore
 
 
 class Icon(QWidget):
-    """Icon that can be painted in any given color."""
+    """
+    Icon that can be painted in any given color.
+
+    The Icon keeps the pixmap it paints, so that a repaint only draws it. The
+    pixmap is taken from the PixmapStore again when the icon is set, the
+    theme changes or the Icon is moved to a screen with another device pixel
+    ratio.
+    """
 
     DEFAULT_ICON_PATH = ":/svg_icons/no_icon.svg"
 
+    # Events after which the pixmap is taken from the PixmapStore again.
+    _REFRESH_EVENTS = (
+        QEvent.Type.StyleChange,
+        QEvent.Type.PaletteChange,
+        QEvent.Type.DevicePixelRatioChange,
+        QEvent.Type.ScreenChangeInternal,
+    )
+
     def __init__(
         self, radius: int = 20, color_name: str | None = "foreground"
     ) -> None:
@@ -26,21 +40,31 @@ class Icon(QWidget):
         self.setFixedSize(int(1.5 * radius), int(1.5 * radius))
         self._icon_path = self.DEFAULT_ICON_PATH
         self._color_name = color_name
+        # The pixmap to paint, None if it needs to be taken from the store.
+        self._pixmap: QPixmap | None = None
 
     def set_icon(self, icon_path: str) -> None:
         """Set the given icon path."""
         self._icon_path = icon_path
+        self._pixmap = None
         self.update()
 
     @property
     def scale(self) -> float:
         """Return the current scale for painting."""
-        # At this point, there must be a QApplication
-        return cast(QApplication, QApplication.instance()).devicePixelRatio()
+        return self.devicePixelRatio()
+
+    def event(self, event: QEvent) -> bool:
+        """Take the pixmap again after a theme or screen change."""
+        if event.type() in self._REFRESH_EVENTS:
+            self._pixmap = None
+        return super().event(event)
 
     def paintEvent(self, _: QtGui.QPaintEvent) -> None:  # noqa: N802
         """Override QWidget.paintEvent to draw pixmap."""
-        pixmap = self._get_pixmap()
+        if self._pixmap is None:
+            self._pixmap = self._get_pixmap()
+        pixmap = self._pixmap
         xy_pos = (self.height() - pixmap.height()) // 2
 
         painter = QPainter(self)
@@ -52,9 +76,12 @@ class Icon(QWidget):
         color = get_color(self._color_name) if self._color_name else None
         radius = int(self._radius * self.scale)
 
-        # Get the pixmap from store.
-        pixmap = PixmapStore.inst().get_pixmap(
-            self._icon_path, radius, radius, color
+        # Get the pixmap from store. The copy shares the pixel data, but
+        # the scale factor of the stored pixmap is not changed.
+        pixmap = QPixmap(
+            PixmapStore.inst().get_pixmap(
+                self._icon_path, radius, radius, color
+            )
         )
 
         # Set the scale_factor -> displayed pixmap fits into target
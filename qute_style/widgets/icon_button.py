@@ -6,11 +6,19 @@ import logging
 from typing import TypedDict
 
 from PySide6.QtCore import QEvent, QRect, Qt
-from PySide6.QtGui import QBrush, QColor, QMouseEvent, QPainter, QPaintEvent
+from PySide6.QtGui import (
+    QColor,
+    QMouseEvent,
+    QPainter,
+    QPaintEvent,
+    QRegion,
+    QStaticText,
+)
 from PySide6.QtWidgets import QPushButton, QWidget
 
 from qute_style.style import get_color
 from qute_style.widgets.custom_icon_engine import PixmapStore
+from qute_style.widgets.text_truncator import TextTruncator
 
 log = logging.getLogger(
     f"qute_style.{__name__}"
@@ -35,6 +43,11 @@ class IconButton(QPushButton):
 
     FIXED_HEIGHT: int = 36
     FIXED_WIDTH: int | None = 36
+    # Corner radius of the background.
+    RADIUS: int = 8
+
+    # Truncates the texts of all buttons into the shared TruncationCache.
+    _TRUNCATOR = TextTruncator()
 
     def __init__(
         self,
@@ -69,6 +82,11 @@ class IconButton(QPushButton):
         self._text_color = "foreground"
         self._margin = margin
 
+        # The label drawn by _text_paint and the key it was created for.
+        self._label = QStaticText()
+        self._label_y = 0
+        self._label_key: tuple[str, int, int] | None = None
+
     def set_sizes(self) -> None:
         """
         Set the size of the button.
@@ -103,13 +121,7 @@ class IconButton(QPushButton):
         """Customize painting of the button and icon."""
         painter = QPainter()
         painter.begin(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        painter.setPen(Qt.PenStyle.NoPen)
-        if self._bg_color == "transparent":
-            painter.setBrush(QBrush(QColor(self._bg_color)))
-        else:
-            painter.setBrush(QBrush(QColor(get_color(self._bg_color))))
-        painter.drawRoundedRect(self.rect(), 8, 8)
+        self._background_paint(painter, self.rect(), self._bg_color)
 
         if self.isEnabled():
             color = get_color(self._icon_color)
@@ -121,41 +133,117 @@ class IconButton(QPushButton):
         self._text_paint(painter, QColor(text_color))
         painter.end()
 
+    def event(self, event: QEvent) -> bool:
+        """Disable the hover tracking enabled by the style sheet."""
+        result = super().event(event)
+        if event.type() in (QEvent.Type.Polish, QEvent.Type.StyleChange):
+            # The button paints its hover state itself in enterEvent and
+            # leaveEvent. The style sheet's QPushButton:hover rule enables
+            # hover tracking, which would repaint the button again on every
+            # enter and leave.
+            self.setAttribute(Qt.WidgetAttribute.WA_Hover, False)
+        return result
+
+    def changeEvent(self, event: QEvent) -> None:  # noqa: N802
+        """Create the label again after a change of the font."""
+        if event.type() == QEvent.Type.FontChange:
+            self._label_key = None
+        super().changeEvent(event)
+
     def enterEvent(self, _: QEvent) -> None:  # noqa: N802
         """Change style on mouse entering the button area."""
         if self.isEnabled() and not self._is_active:
-            self._bg_color = self._bgs["hovering"]
-            self._icon_color = "active"
-            self._text_color = "foreground"
-            self.update()
+            self._set_colors(self._bgs["hovering"], "active", "foreground")
 
     def leaveEvent(self, _: QEvent) -> None:  # noqa: N802
         """Change style on mouse leaving the button area."""
         if not self._is_active:
-            self._bg_color = self._bgs["background"]
-            self._icon_color = "foreground"
-            self._text_color = "foreground"
-            self.update()
+            self._set_colors(
+                self._bgs["background"], "foreground", "foreground"
+            )
 
     def mousePressEvent(self, event: QMouseEvent) -> None:  # noqa: N802
         """Event triggered on mouse button press."""
         if event.button() is Qt.MouseButton.LeftButton:
-            self._bg_color = self._bgs["pressed"]
-            self._icon_color = "context_pressed"
-            self._text_color = "context_pressed"
-            self.update()
+            self._set_colors(
+                self._bgs["pressed"], "context_pressed", "context_pressed"
+            )
             self.setFocus()
             self.clicked.emit()
 
     def mouseReleaseEvent(self, event: QMouseEvent) -> None:  # noqa: N802
         """Event triggered on mouse button release."""
         if event.button() == Qt.MouseButton.LeftButton:
-            self._bg_color = self._bgs["released"]
-            self._icon_color = "active"
-            self._text_color = "foreground"
-            self.update()
+            self._set_colors(self._bgs["released"], "active", "foreground")
             self.released.emit()
 
+    def _set_colors(
+        self, bg_color: str, icon_color: str, text_color: str
+    ) -> None:
+        """
+        Set the colors of the button and repaint the parts that changed.
+
+        Hovering over a row of buttons changes the colors very often, so only
+        the region that really looks different is repainted.
+        """
+        region = self._color_region(
+            bg_color != self._bg_color,
+            icon_color != self._icon_color,
+            text_color != self._text_color,
+        )
+        self._bg_color = bg_color
+        self._icon_color = icon_color
+        self._text_color = text_color
+        if not region.isEmpty():
+            self.update(region)
+
+    def _color_region(
+        self, background: bool, icon: bool, text: bool
+    ) -> QRegion:
+        """Return the region that looks different if the colors change."""
+        if background:
+            return QRegion(self.rect())
+        region = QRegion()
+        if icon:
+            region += self._icon_rect()
+        if text and self.text():
+            region += self._text_rect()
+        return region
+
+    def _icon_rect(self) -> QRect:
+        """Return the rect the icon is painted in."""
+        return QRect(0, 0, self.FIXED_HEIGHT, self.FIXED_HEIGHT)
+
+    def _text_rect(self) -> QRect:
+        """
+        Return the rect the text is painted in.
+
+        This is the button's total rect without the rect for the icon. This
+        means, the rect is shifted to the left by FIXED_HEIGHT and then cut
+        of so it isn't larger than self.rect().
+        """
+        return QRect(
+            self.rect().x() + self.FIXED_HEIGHT,
+            0,
+            self.width() - self.FIXED_HEIGHT,
+            self.height(),
+        )
+
+    def _background_paint(
+        self, painter: QPainter, rect: QRect, color_name: str
+    ) -> None:
+        """
+        Paint the rounded background rect in the given color.
+
+        The rect is drawn from a sprite of the PixmapStore, so that a hover
+        or press only blits the sprite of the new state.
+        """
+        if color_name == "transparent":
+            return
+        PixmapStore.inst().draw_rounded_rect(
+            painter, rect, self.RADIUS, get_color(color_name)
+        )
+
     def _icon_paint(
         self,
         root_painter: QPainter,
@@ -191,23 +279,30 @@ class IconButton(QPushButton):
         # target rect = 2x20
 
     def _text_paint(self, root_painter: QPainter, text_color: QColor) -> None:
-        """Paint the text in the given color."""
-        if not self.text():
+        """
+        Paint the text in the given color.
+
+        The text is elided to the width of the text rect and drawn from a
+        QStaticText, which is cached per text, font and width for all
+        buttons. The button keeps its current label, so that a repaint
+        without changes (e.g. during an animation) only draws it.
+        """
+        text = self.text()
+        if not text:
             return
+        rect = self._text_rect()
+        key = (text, rect.width(), rect.height())
+        if key != self._label_key:
+            metrics = self.fontMetrics()
+            self._label = IconButton._TRUNCATOR.truncate_text(
+                text, rect.width(), metrics, self.font()
+            )
+            self._label_y = (
+                rect.top() + (rect.height() - metrics.height()) // 2
+            )
+            self._label_key = key
         root_painter.setPen(text_color)
-
-        # Create a rect from the button's total rect without the rect for the
-        # icon. This means, the rect is shifted to the left by FIXED_HEIGHT
-        # and then cut of so it isn't larger than self.rect().
-        rect_text = QRect(
-            self.rect().x() + self.FIXED_HEIGHT,
-            0,
-            self.width() - self.FIXED_HEIGHT,
-            self.height(),
-        )
-        root_painter.drawText(
-            rect_text, Qt.AlignmentFlag.AlignVCenter, self.text()
-        )
+        root_painter.drawStaticText(rect.left(), self._label_y, self._label)
 
     def set_icon(self, icon_path: str) -> None:
         """Set the icon to the given path."""
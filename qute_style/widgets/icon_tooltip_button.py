@@ -43,11 +43,9 @@ class IconTooltipButton(IconButton, Generic[BaseWidgetType]):
 
         self._widget_class: type[BaseWidgetType] | None = widget_class
 
-        self._tooltip = ToolTip(
-            app_parent,
-            tooltip_text,
-        )
-        self._tooltip.hide()
+        # The ToolTip is shared by all buttons of the app parent and only
+        # created when the first one is shown.
+        self._tooltip_text = tooltip_text
 
     def __repr__(self) -> str:  # type: ignore[override]
         """Return a str representation of the object."""
@@ -56,15 +54,24 @@ class IconTooltipButton(IconButton, Generic[BaseWidgetType]):
         )
         return f"<{self.__class__.__name__} for widget {class_name}>"
 
+    @property
+    def _tooltip(self) -> ToolTip:
+        """Return the ToolTip shared by the buttons of the app parent."""
+        return ToolTip.shared(self._app_parent)
+
     @property
     def tooltip_text(self) -> str:
         """Get the tooltip text."""
-        return self._tooltip.text()
+        return self._tooltip_text
 
     @tooltip_text.setter
     def tooltip_text(self, text: str) -> None:
         """Set the tooltip text."""
-        self._tooltip.setText(text)
+        self._tooltip_text = text
+        tooltip = ToolTip.find(self._app_parent)
+        if tooltip is not None and tooltip.owner is self:
+            tooltip.setText(text)
+            tooltip.adjustSize()
 
     @property
     def widget_class(
@@ -84,6 +91,11 @@ class IconTooltipButton(IconButton, Generic[BaseWidgetType]):
 
     def move_tooltip(self) -> None:
         """Move the button tooltip to the correct position and show it."""
+        tooltip = self._tooltip
+        tooltip.owner = self
+        tooltip.setText(self._tooltip_text)
+        # The coordinates depend on the size needed for the text.
+        tooltip.adjustSize()
         # GET MAIN WINDOW PARENT
         global_pos = self.mapToGlobal(QPoint(0, 0))
         # SET WIDGET TO GET POSTION
@@ -96,10 +108,17 @@ class IconTooltipButton(IconButton, Generic[BaseWidgetType]):
         pos_x, pos_y = self._get_tooltip_coords(pos)  # type: ignore
         # SET POSITION TO WIDGET
         # Move _tooltip position
-        self._tooltip.move(pos_x, pos_y)
-        self._tooltip.show()
+        tooltip.move(pos_x, pos_y)
+        tooltip.show()
+
+    def hide_tooltip(self) -> None:
+        """Hide the tooltip if it's shown for this button."""
+        tooltip = ToolTip.find(self._app_parent)
+        if tooltip is not None and tooltip.owner is self:
+            tooltip.hide()
+            tooltip.owner = None
 
     def leaveEvent(self, event: QEvent) -> None:  # noqa: N802
         """Change style on mouse entering the button area."""
-        self._tooltip.hide()
+        self.hide_tooltip()
         super().leaveEvent(event)
@@ -0,0 +1,353 @@
+"""Item delegates that render item views directly through QuteStyle."""
+
+from __future__ import annotations
+
+import logging
+
+from PySide6.QtCore import (
+    QModelIndex,
+    QObject,
+    QPersistentModelIndex,
+    QPoint,
+    QRect,
+    QSize,
+    Qt,
+)
+from PySide6.QtGui import QIcon, QPainter, QPalette
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QApplication,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
+    QWidget,
+)
+
+from qute_style.qute_style import (
+    CHECK_SPRITE_STATES,
+    CHECK_STATE_FLAGS,
+    ITEM_TEXT_MARGIN,
+    STATE_ACTIVE,
+    STATE_ENABLED,
+    STATE_MOUSE_OVER,
+    STATE_SELECTED,
+    QuteStyle,
+)
+from qute_style.widgets.text_truncator import TextTruncator
+
+log = logging.getLogger(
+    f"qute_style.{__name__}"
+)  # pylint: disable=invalid-name
+
+
+def _item_style(widget: QWidget | None) -> QStyle:
+    """
+    Return the style used to render the items of the given view.
+
+    The application's style is the QuteStyle itself, while the style of a
+    widget below a style sheet is Qt's style sheet style wrapping it.
+    """
+    style = QApplication.style()
+    if isinstance(style, QuteStyle) or widget is None:
+        return style
+    return widget.style()
+
+
+class FastPathItemDelegate(QStyledItemDelegate):
+    """
+    Delegate that paints the items of a view through QuteStyle directly.
+
+    A view below a widget with a style sheet is rendered through Qt's style
+    sheet style, that matches the style sheet rules for every single item
+    before handing it to QuteStyle. The style sheet contains no item rules
+    for views, so the delegate skips the wrapper and asks QuteStyle directly.
+    """
+
+    def paint(
+        self,
+        painter: QPainter,
+        option: QStyleOptionViewItem,
+        index: QModelIndex | QPersistentModelIndex,
+    ) -> None:
+        """Paint the item at index through QuteStyle."""
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        style = _item_style(opt.widget)
+        if isinstance(style, QuteStyle) and opt.widget is not None:
+            # Calling QuteStyle's Python method directly saves the round trip
+            # through the C++ drawControl.
+            style.draw_item_view_item(opt, painter, opt.widget)
+        else:
+            style.drawControl(
+                QStyle.ControlElement.CE_ItemViewItem, opt, painter, opt.widget
+            )
+
+    def sizeHint(  # noqa: N802
+        self,
+        option: QStyleOptionViewItem,
+        index: QModelIndex | QPersistentModelIndex,
+    ) -> QSize:
+        """Return the size hint of the item at index from QuteStyle."""
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        return _item_style(opt.widget).sizeFromContents(
+            QStyle.ContentsType.CT_ItemViewItem, opt, QSize(), opt.widget
+        )
+
+
+class ThemedItemDelegate(FastPathItemDelegate):
+    """
+    Delegate for views with very many rows, e.g. tables of measurements.
+
+    The delegate reads the display, check state and decoration data of an
+    item directly instead of initializing a complete style option, paints
+    the theme colors of QuteStyle, draws the check indicator through the
+    style's indicator sprites and renders the text elided as a QStaticText.
+    The static texts are kept in the shared TruncationCache.
+
+    With uniform_row_heights, all rows get the height of the first item,
+    which allows views to skip measuring every row. The size hints are cached
+    by text, check indicator, icon and font, call `clear_cache` if the model
+    changes its data in a way that changes the size of an item.
+
+    The text is always drawn as a single line aligned left. Items with a
+    background, foreground, font or text alignment of their own and all
+    items of applications that don't use QuteStyle are painted with the
+    default rendering.
+    """
+
+    # Upper limit of cached size hints. The cache is cleared if it is full,
+    # so scrolling through a huge model doesn't keep every size alive. The
+    # texts are kept in the shared TruncationCache, which has a byte budget.
+    MAX_SIZE_HINTS = 100_000
+    # Roles that change how an item looks. Items that set one of them are
+    # painted by the style like with QStyledItemDelegate.
+    _STYLE_ROLES = (
+        Qt.ItemDataRole.BackgroundRole,
+        Qt.ItemDataRole.ForegroundRole,
+        Qt.ItemDataRole.FontRole,
+        Qt.ItemDataRole.TextAlignmentRole,
+    )
+
+    def __init__(
+        self,
+        parent: QObject | None = None,
+        uniform_row_heights: bool = False,
+    ) -> None:
+        """Create a new ThemedItemDelegate."""
+        super().__init__(parent)
+        self._uniform_row_heights = uniform_row_heights
+        self._row_height: int | None = None
+        self._size_hints: dict[tuple[str, bool, int, str], QSize] = {}
+        self._truncator = TextTruncator()
+        self._indicator_size: QSize | None = None
+
+    @property
+    def uniform_row_heights(self) -> bool:
+        """Return if all rows have the same height."""
+        return self._uniform_row_heights
+
+    @property
+    def row_height(self) -> int | None:
+        """Return the uniform row height once an item was measured."""
+        return self._row_height
+
+    def clear_cache(self) -> None:
+        """Clear the cached size hints and the uniform row height."""
+        self._row_height = None
+        self._size_hints.clear()
+        self._indicator_size = None
+
+    def paint(
+        self,
+        painter: QPainter,
+        option: QStyleOptionViewItem,
+        index: QModelIndex | QPersistentModelIndex,
+    ) -> None:
+        """Paint the item at index with the theme colors."""
+        style = _item_style(option.widget)
+        if not isinstance(style, QuteStyle) or any(
+            index.data(role) is not None for role in self._STYLE_ROLES
+        ):
+            super().paint(painter, option, index)
+            return
+        rect = option.rect
+        state = option.state.value
+        painter.save()
+        painter.setClipRect(rect)
+        if state & (STATE_SELECTED | STATE_MOUSE_OVER):
+            painter.fillRect(
+                rect,
+                QuteStyle.item_view_item_background_brush(option),
+            )
+
+        left = rect.left()
+        check_state = index.data(Qt.ItemDataRole.CheckStateRole)
+        if check_state is not None:
+            left = self._draw_check(painter, option, style, check_state)
+
+        decoration = index.data(Qt.ItemDataRole.DecorationRole)
+        if isinstance(decoration, QIcon):
+            size = option.decorationSize
+            icon_rect = QRect(
+                left + ITEM_TEXT_MARGIN,
+                rect.top() + (rect.height() - size.height()) // 2,
+                size.width(),
+                size.height(),
+            )
+            decoration.paint(
+                painter,
+                icon_rect,
+                Qt.AlignmentFlag.AlignCenter,
+                self._icon_mode(state),
+            )
+            left = icon_rect.right() + 1
+
+        text = index.data(Qt.ItemDataRole.DisplayRole)
+        if text is not None and text != "":
+            self._draw_text(painter, option, str(text), left, state)
+        painter.restore()
+
+    @staticmethod
+    def _icon_mode(state: int) -> QIcon.Mode:
+        """Return the mode of an item's icon for the state flags."""
+        if not state & STATE_ENABLED:
+            return QIcon.Mode.Disabled
+        if state & STATE_SELECTED:
+            return QIcon.Mode.Selected
+        return QIcon.Mode.Normal
+
+    def _draw_check(
+        self,
+        painter: QPainter,
+        option: QStyleOptionViewItem,
+        style: QuteStyle,
+        check_state: Qt.CheckState | int,
+    ) -> int:
+        """Draw the check indicator and return the x position behind it."""
+        if self._indicator_size is None:
+            self._indicator_size = QSize(
+                style.pixelMetric(
+                    QStyle.PixelMetric.PM_IndicatorWidth, option, option.widget
+                ),
+                style.pixelMetric(
+                    QStyle.PixelMetric.PM_IndicatorHeight,
+                    option,
+                    option.widget,
+                ),
+            )
+        rect = option.rect
+        size = self._indicator_size
+        check_rect = QRect(
+            QPoint(
+                rect.left() + ITEM_TEXT_MARGIN,
+                rect.top() + (rect.height() - size.height()) // 2,
+            ),
+            size,
+        )
+        if isinstance(check_state, int):
+            check_state = Qt.CheckState(check_state)
+        QuteStyle.draw_item_view_item_check(
+            option,
+            painter,
+            check_rect,
+            (option.state.value & CHECK_SPRITE_STATES)
+            | CHECK_STATE_FLAGS[check_state],
+        )
+        return check_rect.right() + 1
+
+    def _draw_text(
+        self,
+        painter: QPainter,
+        option: QStyleOptionViewItem,
+        text: str,
+        left: int,
+        state: int,
+    ) -> None:
+        """Draw the elided text from the cached static texts."""
+        if not state & STATE_ENABLED:
+            group = QPalette.ColorGroup.Disabled
+        elif state & STATE_ACTIVE:
+            group = QPalette.ColorGroup.Normal
+        else:
+            group = QPalette.ColorGroup.Inactive
+        painter.setPen(
+            option.palette.color(
+                group,
+                (
+                    QPalette.ColorRole.HighlightedText
+                    if state & STATE_SELECTED
+                    else QPalette.ColorRole.Text
+                ),
+            )
+        )
+        font = option.font
+        rect = option.rect
+        x_pos = left + ITEM_TEXT_MARGIN
+        metrics = option.fontMetrics
+        static_text = self._truncator.truncate_text(
+            text, rect.right() - ITEM_TEXT_MARGIN - x_pos + 1, metrics, font
+        )
+        painter.setFont(font)
+        painter.drawStaticText(
+            x_pos,
+            rect.top() + (rect.height() - metrics.height()) // 2,
+            static_text,
+        )
+
+    def sizeHint(  # noqa: N802
+        self,
+        option: QStyleOptionViewItem,
+        index: QModelIndex | QPersistentModelIndex,
+    ) -> QSize:
+        """Return the cached size hint of the item at index."""
+        size_hint = index.data(Qt.ItemDataRole.SizeHintRole)
+        if isinstance(size_hint, QSize):
+            # An explicit size hint isn't cached, it's returned as is.
+            return QSize(size_hint)
+        decoration = index.data(Qt.ItemDataRole.DecorationRole)
+        if decoration is None:
+            decoration_key = 0
+        elif isinstance(decoration, QIcon):
+            decoration_key = decoration.cacheKey()
+        else:
+            # Pixmaps, images and colors aren't cached.
+            return super().sizeHint(option, index)
+        text = index.data(Qt.ItemDataRole.DisplayRole)
+        key = (
+            "" if text is None else str(text),
+            index.data(Qt.ItemDataRole.CheckStateRole) is not None,
+            decoration_key,
+            option.font.key(),
+        )
+        try:
+            return self._size_hints[key]
+        except KeyError:
+            if len(self._size_hints) >= self.MAX_SIZE_HINTS:
+                self._size_hints.clear()
+            size = super().sizeHint(option, index)
+            if self._uniform_row_heights:
+                if self._row_height is None:
+                    self._row_height = size.height()
+                size.setHeight(self._row_height)
+            self._size_hints[key] = size
+            return size
+
+
+def set_fast_path(view: QAbstractItemView, enabled: bool = True) -> None:
+    """
+    Enable or disable the stylesheet-free fast path for an item view.
+
+    The view is marked with QuteStyle.FAST_PATH_PROPERTY, so that QuteStyle
+    draws its items in a single pass. If the view uses Qt's default delegate,
+    it is replaced by a FastPathItemDelegate. Custom delegates are kept, they
+    benefit from the single pass drawing as long as they use the style.
+    """
+    log.debug("Setting fast path of %s to %s", view, enabled)
+    view.setProperty(QuteStyle.FAST_PATH_PROPERTY, enabled)
+    delegate = view.itemDelegate()
+    if enabled and type(delegate) is QStyledItemDelegate:
+        view.setItemDelegate(FastPathItemDelegate(view))
+    elif not enabled and isinstance(delegate, FastPathItemDelegate):
+        view.setItemDelegate(QStyledItemDelegate(view))
+    view.viewport().update()
@@ -0,0 +1,257 @@
+"""Search index and result model for the items of a CheckableComboBox."""
+
+from __future__ import annotations
+
+import bisect
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import Any, cast
+
+from PySide6.QtCore import (
+    QAbstractItemModel,
+    QAbstractListModel,
+    QModelIndex,
+    QObject,
+    QPersistentModelIndex,
+    Qt,
+    Slot,
+)
+
+
+class ItemSearchIndex:
+    """
+    N-gram index over the texts of a list of items.
+
+    Every row is added to the posting lists of all substrings of up to GRAM
+    characters of its (case folded) text. A query of up to GRAM characters is
+    answered by its posting list, a longer query only checks the rows of its
+    rarest trigram. The posting lists are kept sorted.
+
+    Rows can be inserted, changed and removed. Inserting and removing rows
+    shifts the following rows, which is recorded and only applied to a
+    posting list when it's used next, so that a change doesn't touch the
+    whole index.
+    """
+
+    GRAM: int = 3
+    # Number of recorded shifts that are applied to all posting lists at once
+    MAX_SHIFTS: int = 64
+
+    def __init__(self) -> None:
+        """Create a new, empty ItemSearchIndex."""
+        self._texts: list[str] = []
+        self._postings: defaultdict[str, list[int]] = defaultdict(list)
+        # Shifts of the rows from the first one on as (first, delta), where a
+        # negative delta removes -delta rows, and the number of shifts that
+        # have been applied to the posting list of a gram.
+        self._shifts: list[tuple[int, int]] = []
+        self._applied: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """Return the number of indexed texts."""
+        return len(self._texts)
+
+    def _grams(self, text: str) -> set[str]:
+        """Return the substrings of up to GRAM characters of the text."""
+        return {
+            text[idx : idx + size]
+            for size in range(1, self.GRAM + 1)
+            for idx in range(len(text) - size + 1)
+        }
+
+    def _posting(self, gram: str) -> list[int] | None:
+        """Return the up to date posting list of the gram, if there's one."""
+        rows = self._postings.get(gram)
+        if rows is None:
+            return None
+        applied = self._applied.get(gram, 0)
+        if applied < len(self._shifts):
+            for first, delta in self._shifts[applied:]:
+                start = bisect.bisect_left(rows, first)
+                end = bisect.bisect_left(rows, first - min(delta, 0))
+                rows[start:] = [row + delta for row in rows[end:]]
+            self._applied[gram] = len(self._shifts)
+        return rows
+
+    def _apply_shifts(self) -> None:
+        """Apply the recorded shifts to all posting lists."""
+        if self._shifts:
+            for gram in self._postings:
+                self._posting(gram)
+            self._shifts = []
+            self._applied = {}
+
+    def _record_shift(self, first: int, delta: int) -> None:
+        """Record that the rows from first on are shifted by delta."""
+        self._shifts.append((first, delta))
+        if len(self._shifts) >= self.MAX_SHIFTS:
+            self._apply_shifts()
+
+    def _add(self, row: int, grams: Iterable[str]) -> None:
+        """Add the row to the posting lists of the grams."""
+        for gram in grams:
+            rows = self._posting(gram)
+            if rows is None:
+                rows = self._postings[gram]
+                self._applied[gram] = len(self._shifts)
+            bisect.insort(rows, row)
+
+    def _discard(self, row: int, grams: Iterable[str]) -> None:
+        """Remove the row from the posting lists of the grams."""
+        for gram in grams:
+            rows = cast(list[int], self._posting(gram))
+            del rows[bisect.bisect_left(rows, row)]
+
+    def append(self, texts: Iterable[str]) -> None:
+        """Add the texts as the next rows to the index."""
+        self._apply_shifts()
+        postings = self._postings
+        row = len(self._texts)
+        for item_text in texts:
+            text = item_text.casefold()
+            self._texts.append(text)
+            for gram in self._grams(text):
+                postings[gram].append(row)
+            row += 1
+
+    def insert(self, first: int, texts: Iterable[str]) -> None:
+        """Insert the texts as the rows starting at first."""
+        new_texts = [text.casefold() for text in texts]
+        if not new_texts:
+            return
+        if first < len(self._texts):
+            self._record_shift(first, len(new_texts))
+        self._texts[first:first] = new_texts
+        for row, text in enumerate(new_texts, first):
+            self._add(row, self._grams(text))
+
+    def replace(self, first: int, texts: Iterable[str]) -> None:
+        """Replace the texts of the rows starting at first."""
+        for row, item_text in enumerate(texts, first):
+            text = item_text.casefold()
+            old_text = self._texts[row]
+            if text == old_text:
+                continue
+            old_grams, grams = self._grams(old_text), self._grams(text)
+            self._discard(row, old_grams - grams)
+            self._add(row, grams - old_grams)
+            self._texts[row] = text
+
+    def remove(self, first: int, last: int) -> None:
+        """Remove the rows first to last from the index."""
+        del self._texts[first : last + 1]
+        self._record_shift(first, first - last - 1)
+
+    def clear(self) -> None:
+        """Remove all texts from the index."""
+        self._texts = []
+        self._postings = defaultdict(list)
+        self._shifts = []
+        self._applied = {}
+
+    def search(self, query: str) -> list[int]:
+        """Return the rows whose text contains the query, in order."""
+        query = query.casefold()
+        texts = self._texts
+        if not query:
+            return list(range(len(texts)))
+        if len(query) <= self.GRAM:
+            return list(self._posting(query) or ())
+        # Only the posting list of the rarest trigram has to be up to date
+        gram = min(
+            (
+                query[idx : idx + self.GRAM]
+                for idx in range(len(query) - self.GRAM + 1)
+            ),
+            key=lambda gram: len(self._postings.get(gram, ())),
+        )
+        candidates = self._posting(gram) or ()
+        # The trigrams may appear in the text, but not in sequence.
+        return [row for row in candidates if query in texts[row]]
+
+
+class SearchResultModel(QAbstractListModel):
+    """List model that shows the given rows of a source model."""
+
+    def __init__(
+        self, source: QAbstractItemModel, parent: QObject | None = None
+    ) -> None:
+        """Create a new SearchResultModel without rows."""
+        super().__init__(parent)
+        self._source = source
+        self._rows: list[int] = []
+        source.dataChanged.connect(self._on_source_data_changed)
+
+    def set_rows(self, rows: list[int]) -> None:
+        """Show the given rows of the source model."""
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def source_row(self, row: int) -> int:
+        """Return the row of the source model for the given row."""
+        return self._rows[row]
+
+    @property
+    def source_rows(self) -> list[int]:
+        """Return the shown rows of the source model."""
+        return self._rows
+
+    def rowCount(  # noqa: N802
+        self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()
+    ) -> int:
+        """Return the number of shown rows."""
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def flags(self, index: QModelIndex | QPersistentModelIndex) -> Qt.ItemFlag:
+        """Return the flags of the source item."""
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return self._source.flags(self._source_index(index))
+
+    def data(
+        self,
+        index: QModelIndex | QPersistentModelIndex,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        """Return the data of the source item."""
+        if not index.isValid():
+            return None
+        return self._source.data(self._source_index(index), role)
+
+    def setData(  # noqa: N802
+        self,
+        index: QModelIndex | QPersistentModelIndex,
+        value: Any,
+        role: int = Qt.ItemDataRole.EditRole,
+    ) -> bool:
+        """Set the data of the source item."""
+        if not index.isValid():
+            return False
+        return self._source.setData(self._source_index(index), value, role)
+
+    def _source_index(
+        self, index: QModelIndex | QPersistentModelIndex
+    ) -> QModelIndex:
+        """Return the index of the source item for the given index."""
+        return self._source.index(self._rows[index.row()], 0)
+
+    @Slot(
+        QModelIndex,
+        QModelIndex,
+        "QVector<int>",  # type: ignore
+        name="_on_source_data_changed",
+    )
+    def _on_source_data_changed(
+        self,
+        _start: QModelIndex,
+        _end: QModelIndex,
+        roles: list[Qt.ItemDataRole],
+    ) -> None:
+        """Repaint the shown rows when the source items change."""
+        if self._rows:
+            self.dataChanged.emit(
+                self.index(0, 0), self.index(len(self._rows) - 1, 0), roles
+            )
@@ -13,10 +13,12 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from qute_style.animation_policy import AnimationPolicy, AnimationPolicyManager
 from qute_style.widgets.base_widgets import BaseWidget, MainWidget
 from qute_style.widgets.div import Div
 from qute_style.widgets.icon_tooltip_button import BaseWidgetType
 from qute_style.widgets.left_menu_button import LeftMenuButton
+from qute_style.widgets.snapshot_slide import SnapshotSlide
 
 log = logging.getLogger(
     f"qute_style.{__name__}"
@@ -105,6 +107,8 @@ class LeftMenu(QWidget):
 
         self.setMinimumWidth(50)
         self._animation = QPropertyAnimation(parent, b"minimumWidth")
+        # Slide the menu with a SnapshotSlide instead of animating the width.
+        self.snapshot_animation = False
 
     if TYPE_CHECKING:
 
@@ -188,7 +192,9 @@ class LeftMenu(QWidget):
         """
         Toggle the animation (closing/opening the menu).
 
-        Animation is working with the minimum width of the parent widget.
+        Animation is working with the minimum width of the parent widget. If
+        snapshot_animation is set, the parent is resized at once and slid with
+        a SnapshotSlide instead.
         """
         parent_margin = (
             self.parent().layout().contentsMargins().left()
@@ -196,19 +202,24 @@ class LeftMenu(QWidget):
         )
         parent_width = self.parent().width()
         self._animation.stop()
+        start = SnapshotSlide.stop(self.parent())
         closed = self.minimumWidth() + parent_margin == parent_width
-        self._animation.setStartValue(self.parent().width())
-        self._animation.setEndValue(
-            240 if closed else self.minimumWidth() + parent_margin
-        )
+        end = 240 if closed else self.minimumWidth() + parent_margin
         # if closed, menu is expanding so set toggle active
         # if not closed, menu is closing set toggle not active
         self._toggle_button.set_active_toggle(closed)
         icon = LeftMenu.ICON_PATH_CLOSE if closed else LeftMenu.ICON_PATH_OPEN
         self._toggle_button.set_icon(icon)
-        self._animation.setEasingCurve(QEasingCurve.Type.InOutCubic)
-        self._animation.setDuration(500)
-        self._animation.start()
+        manager = AnimationPolicyManager.inst()
+        if self.snapshot_animation and manager.policy != AnimationPolicy.OFF:
+            animation = SnapshotSlide(self.parent(), start, end).animation
+        else:
+            animation = self._animation
+            animation.setStartValue(start)
+            animation.setEndValue(end)
+        animation.setEasingCurve(QEasingCurve.Type.InOutCubic)
+        manager.configure(animation, 500)
+        animation.start()
 
     def _button(
         self, widget_class: type[BaseWidgetType]
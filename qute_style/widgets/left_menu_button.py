@@ -5,11 +5,19 @@ from __future__ import annotations
 import logging
 from typing import Generic
 
-from PySide6.QtCore import QEvent, QPoint, QRect, Qt
-from PySide6.QtGui import QColor, QMouseEvent, QPainter, QPaintEvent, QPixmap
+from PySide6.QtCore import QEvent, QPoint, QRect
+from PySide6.QtGui import (
+    QColor,
+    QMouseEvent,
+    QPainter,
+    QPaintEvent,
+    QPixmap,
+    QRegion,
+)
 from PySide6.QtWidgets import QWidget
 
 from qute_style.style import get_color
+from qute_style.widgets.custom_icon_engine import PixmapStore
 from qute_style.widgets.icon_button import BackgroundColorNames, IconButton
 from qute_style.widgets.icon_tooltip_button import (
     BaseWidgetType,
@@ -29,6 +37,10 @@ class LeftMenuButton(
     FIXED_WIDTH = None
     FIXED_HEIGHT = 50
 
+    # Curvy border that is painted next to active buttons and its size.
+    ACTIVE_MENU_ICON = ":/svg_icons/active_menu.svg"
+    ACTIVE_MENU_SIZE = (5, FIXED_HEIGHT)
+
     def __init__(  # noqa: PLR0913
         self,
         app_parent: QWidget,
@@ -55,10 +67,6 @@ class LeftMenuButton(
             margin,
         )
 
-        # This can't be a class variable because it gets garbage collected
-        # and the app crashes. It should be in the pixmap store.
-        self.active_menu = QPixmap(":/svg_icons/active_menu.svg")
-
         self._is_active_tab = False
         self._is_toggle_active = False
 
@@ -70,30 +78,23 @@ class LeftMenuButton(
     def paintEvent(self, _: QPaintEvent) -> None:  # noqa: N802
         """Handle a paint event for the MenuButton."""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        # set NoPen so that no borders are drawn.
-        painter.setPen(Qt.PenStyle.NoPen)
+        # The visible width changes during the menu animation. Computing it
+        # is comparatively expensive, so it's done once per paint.
+        visible_width = self.visible_width()
 
         if self._is_active:
-            indicator_color = get_color("context_color")
-            self._draw_button_rect(painter, indicator_color)
+            self._draw_button_rect(painter, "context_color", visible_width)
         elif self._is_active_tab:
-            indicator_color = self._bgs["pressed"]
-            self._draw_button_rect(painter, indicator_color)
+            self._draw_button_rect(
+                painter, self._bgs["pressed"], visible_width
+            )
         else:
             # If the button is neither active (i.e. left column is shown) nor
             # does it belong to the active tab, we draw the hover effect.
-            if self._bg_color == "transparent":
-                painter.setBrush(QColor(self._bg_color))
-            else:
-                painter.setBrush(QColor(get_color(self._bg_color)))
-            painter.setBrush(QColor(get_color(self._bg_color)))
-            rect_inside = QRect(
-                4, 5, self.visible_width() - 8, self.height() - 10
-            )
-            painter.drawRoundedRect(rect_inside, 8, 8)
+            rect_inside = QRect(4, 5, visible_width - 8, self.height() - 10)
+            self._background_paint(painter, rect_inside, self._bg_color)
 
-        if self.visible_width() != self.height():
+        if visible_width != self.height():
             # Draw the text. If the button is active or if the button
             # represents the active tab, we'll use color text_active (brighter)
             if self._is_active or self._is_active_tab:
@@ -112,18 +113,28 @@ class LeftMenuButton(
         self._icon_paint(painter, QColor(color))
 
     def _draw_button_rect(
-        self, painter: QPainter, indicator_color: str
+        self, painter: QPainter, indicator_color: str, visible_width: int
     ) -> None:
-        """Draw the rectangle of the menu button with the given color."""
-        painter.setBrush(QColor(indicator_color))
+        """Draw the rectangle of the menu button with the given color name."""
         rect_blue = QRect(4, 5, 20, self.height() - 10)
-        painter.drawRoundedRect(rect_blue, 8, 8)
-        painter.setBrush(QColor(get_color("bg_one")))
-        rect_inside_active = QRect(
-            7, 5, self.visible_width(), self.height() - 10
-        )
-        painter.drawRoundedRect(rect_inside_active, 8, 8)
-        self._paint_active_icon(painter)
+        self._background_paint(painter, rect_blue, indicator_color)
+        rect_inside_active = QRect(7, 5, visible_width, self.height() - 10)
+        self._background_paint(painter, rect_inside_active, "bg_one")
+        self._paint_active_icon(painter, visible_width)
+
+    def _color_region(
+        self, background: bool, icon: bool, text: bool
+    ) -> QRegion:
+        """Return the region that looks different if the colors change."""
+        region = QRegion()
+        # The background color is only used for the hover effect of buttons
+        # that are neither active nor belong to the active tab. The text
+        # color doesn't depend on the hover state at all.
+        if background and not (self._is_active or self._is_active_tab):
+            region += QRect(0, 0, self.visible_width(), self.height())
+        if icon and not self._is_toggle_active:
+            region += self._icon_rect()
+        return region
 
     def set_active_tab(self, is_active: bool) -> None:
         """
@@ -143,7 +154,9 @@ class LeftMenuButton(
         """Set the toggle active for Buttons that display a different icon."""
         self._is_toggle_active = active
 
-    def _paint_active_icon(self, root_painter: QPainter) -> None:
+    def _paint_active_icon(
+        self, root_painter: QPainter, visible_width: int
+    ) -> None:
         """
         Paint a curvy border to the background to the button/icon.
 
@@ -153,19 +166,33 @@ class LeftMenuButton(
         Hint: One can use white color for painting to understand fully what
         this method does.
         """
-        painter = QPainter(self.active_menu)
-        painter.setCompositionMode(
-            QPainter.CompositionMode.CompositionMode_SourceIn
+        root_painter.drawPixmap(
+            QPoint(visible_width - self.ACTIVE_MENU_SIZE[0], 0),
+            self._active_menu_pixmap(root_painter.device().devicePixelRatio()),
+        )
+
+    @property
+    def active_menu(self) -> QPixmap:
+        """Return the tinted curvy border for the button's pixel ratio."""
+        return self._active_menu_pixmap(self.devicePixelRatio())
+
+    def _active_menu_pixmap(self, scale: float) -> QPixmap:
+        """
+        Return the tinted curvy border for the device pixel ratio.
+
+        The pixmap is shared by all buttons and only rendered once per theme
+        and device pixel ratio, at its size in device pixels.
+        """
+        width, height = self.ACTIVE_MENU_SIZE
+        return PixmapStore.inst().get_scaled_pixmap(
+            self.ACTIVE_MENU_ICON, width, height, get_color("bg_one"), scale
         )
-        painter.fillRect(self.active_menu.rect(), QColor(get_color("bg_one")))
-        root_painter.drawPixmap(self.visible_width() - 5, 0, self.active_menu)
-        painter.end()
 
     def enterEvent(self, event: QEvent) -> None:  # noqa: N802
         """Change style on mouse entering the button area."""
         if (
             self.visible_width() == LeftMenuButton.FIXED_HEIGHT
-            and self._tooltip.text()
+            and self.tooltip_text
             and not self._is_active
         ):
             self.move_tooltip()
@@ -173,7 +200,7 @@ class LeftMenuButton(
 
     def mousePressEvent(self, event: QMouseEvent) -> None:  # noqa: N802
         """Event triggered on mouse button press."""
-        self._tooltip.hide()
+        self.hide_tooltip()
         super().mousePressEvent(event)
 
     def _get_tooltip_coords(self, pos: QPoint) -> tuple[int, int]:
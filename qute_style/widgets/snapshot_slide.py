@@ -0,0 +1,182 @@
+"""Overlay that animates a sliding frame using snapshots."""
+
+from __future__ import annotations
+
+import logging
+
+from PySide6.QtCore import (
+    Property,
+    QEvent,
+    QPropertyAnimation,
+    QRect,
+    Qt,
+    Slot,
+)
+from PySide6.QtGui import QPainter, QPaintEvent, QPixmap
+from PySide6.QtWidgets import QApplication, QWidget
+
+log = logging.getLogger(
+    f"qute_style.{__name__}"
+)  # pylint: disable=invalid-name
+
+
+class SnapshotSlide(QWidget):
+    """
+    Overlay that slides a frame open or closed using snapshots.
+
+    Animating the minimumWidth of a frame relayouts and repaints the frame and
+    all widgets next to it on every frame of the animation. A SnapshotSlide
+    resizes the frame to its end width at once instead and covers the frame
+    and its neighbors on the side of the moving edge with an overlay. The
+    overlay is composed of a snapshot of the open frame and a snapshot of the
+    neighbors while the frame is closed, so that only the overlay is repainted
+    while the animation is running. The overlay removes itself when the
+    animation has finished.
+
+    The animation is available as `animation` and runs from start to end
+    width. It's not started, so that it can be added to an animation group.
+    """
+
+    def __init__(
+        self,
+        frame: QWidget,
+        start: int,
+        end: int,
+        moving_edge: Qt.Edge = Qt.Edge.RightEdge,
+    ) -> None:
+        """
+        Create a new SnapshotSlide for the given frame.
+
+        The frame is resized to the end width immediately. The moving edge is
+        the edge of the frame that slides, the widgets on that side are part
+        of the snapshot.
+        """
+        parent = frame.parentWidget()
+        super().__init__(parent)
+        self.hide()
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
+        self.frame = frame
+        self._moving_edge = moving_edge
+        self._slide_width = start
+
+        SnapshotSlide.stop(frame)
+
+        row = parent.layout().contentsRect() if parent.layout() else QRect()
+        if not row.isValid():
+            row = parent.rect()
+        geometry = frame.geometry()
+        if moving_edge == Qt.Edge.RightEdge:
+            geometry.setRight(row.right())
+        else:
+            geometry.setLeft(row.left())
+        self.setGeometry(geometry)
+
+        widths = (frame.width(), start, end)
+        self._frame_snapshot, self._neighbor_snapshot = QPixmap(), QPixmap()
+        captures = [
+            (min(widths), self._capture_neighbors),
+            (max(widths), self._capture_frame),
+        ]
+        # Capture the end state last to avoid an additional relayout.
+        if end == min(widths):
+            captures.reverse()
+        for width, capture in captures:
+            self._resize_frame(width)
+            capture(width)
+        self._resize_frame(end)
+
+        self.animation = QPropertyAnimation(self, b"slide_width", self)
+        self.animation.setStartValue(start)
+        self.animation.setEndValue(end)
+        self.animation.finished.connect(self.remove)
+
+        self.raise_()
+        self.show()
+
+    @staticmethod
+    def _running_slides(frame: QWidget) -> list[SnapshotSlide]:
+        """Return the slides that are currently shown for the given frame."""
+        return [
+            slide
+            for slide in frame.parentWidget().findChildren(
+                SnapshotSlide,
+                options=Qt.FindChildOption.FindDirectChildrenOnly,
+            )
+            if slide.frame is frame and not slide.isHidden()
+        ]
+
+    @staticmethod
+    def stop(frame: QWidget) -> int:
+        """
+        Remove the running slides of the frame and return its visible width.
+
+        While a SnapshotSlide is running for the frame, the frame is displayed
+        with the width of the animation and not with its actual width.
+        """
+        width = frame.width()
+        for slide in SnapshotSlide._running_slides(frame):
+            width = slide.slide_width
+            slide.remove()
+        return width
+
+    def _resize_frame(self, width: int) -> None:
+        """Resize the frame to the given width and relayout at once."""
+        # setMinimumWidth already resizes the frame if it's growing.
+        relayout = self.frame.width() != width
+        self.frame.setMinimumWidth(width)
+        if relayout:
+            log.debug("Relayout for %s at width %s", self.frame, width)
+            QApplication.sendPostedEvents(None, QEvent.Type.LayoutRequest)
+
+    def _grab(self, x: int, width: int) -> QPixmap:
+        """Grab the given horizontal range of the overlay's geometry."""
+        window = self.window()
+        top_left = self.parentWidget().mapTo(window, self.pos())
+        return window.grab(
+            QRect(top_left.x() + x, top_left.y(), width, self.height())
+        )
+
+    def _capture_frame(self, width: int) -> None:
+        """Capture the frame while it's opened with the given width."""
+        if self._moving_edge == Qt.Edge.RightEdge:
+            self._frame_snapshot = self._grab(0, width)
+        else:
+            self._frame_snapshot = self._grab(self.width() - width, width)
+
+    def _capture_neighbors(self, width: int) -> None:
+        """Capture the neighbors while the frame has the given width."""
+        if self._moving_edge == Qt.Edge.RightEdge:
+            self._neighbor_snapshot = self._grab(width, self.width() - width)
+        else:
+            self._neighbor_snapshot = self._grab(0, self.width() - width)
+
+    @Property(int)
+    def slide_width(self) -> int:
+        """Return the width the frame is currently displayed with."""
+        return self._slide_width
+
+    @slide_width.setter  # type: ignore[no-redef]
+    def slide_width(self, width: int) -> None:
+        """Set the width the frame is displayed with."""
+        self._slide_width = width
+        self.update()
+
+    @Slot(name="remove")
+    def remove(self) -> None:
+        """Remove the overlay and show the frame and its neighbors."""
+        self.hide()
+        self.deleteLater()
+
+    def paintEvent(self, _: QPaintEvent) -> None:  # noqa: N802
+        """Paint the snapshots of the neighbors and the frame."""
+        painter = QPainter(self)
+        width = self._slide_width
+        if self._moving_edge == Qt.Edge.RightEdge:
+            painter.drawPixmap(width, 0, self._neighbor_snapshot)
+            painter.setClipRect(0, 0, width, self.height())
+            painter.drawPixmap(0, 0, self._frame_snapshot)
+        else:
+            x = self.width() - width
+            painter.drawPixmap(0, 0, self._neighbor_snapshot)
+            painter.setClipRect(x, 0, width, self.height())
+            painter.drawPixmap(x, 0, self._frame_snapshot)
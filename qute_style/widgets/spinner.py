@@ -29,15 +29,43 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+from __future__ import annotations
+
+import logging
 import math
+import weakref
 
-from PySide6.QtCore import QRect, Qt, QTimer
-from PySide6.QtGui import QColor, QPainter, QPaintEvent
+import shiboken6
+from PySide6.QtCore import QElapsedTimer, QObject, QRect, Qt, QTimer, Slot
+from PySide6.QtGui import QColor, QPainter, QPaintEvent, QPixmap
 from PySide6.QtWidgets import QWidget
 
+from qute_style.animation_policy import AnimationPolicy, AnimationPolicyManager
+from qute_style.render_quality import RenderQualityManager
+
+log = logging.getLogger(
+    f"qute_style.{__name__}"
+)  # pylint: disable=invalid-name
+
 
 class WaitingSpinner(QWidget):
-    """WaitingSpinner is a highly configurable, custom spinner widget."""
+    """
+    WaitingSpinner is a highly configurable, custom spinner widget.
+
+    All frames of a cycle are rendered once into a sprite strip, so that a
+    frame is painted with a single drawPixmap. The strips are shared between
+    spinners with identical settings. The spinning spinners are driven by the
+    application wide SpinnerClock.
+    """
+
+    # _strips[size, lines, length, width, radius, roundness, trail opacity,
+    # trail fade, rgba, antialiasing, device pixel ratio]
+    _strips: dict[
+        tuple[int, int, int, int, int, float, float, float, int, bool, float],
+        QPixmap,
+    ] = {}
+    # Upper bound of stored sprite strips.
+    MAX_STRIPS = 16
 
     def __init__(  # noqa: PLR0913
         self,
@@ -71,27 +99,80 @@ class WaitingSpinner(QWidget):
         self._inner_radius: int = radius
         self._current_counter: int = 0
         self._is_spinning: bool = False
+        # Time in ms per line and the clock time the spinner was started at.
+        self._interval: int = 1
+        self._start_time: int = 0
 
-        self._timer: QTimer = QTimer(self)
-        self._timer.timeout.connect(self._rotate)
         self._update_size()
-        self._update_timer()
+        self._update_interval()
         self.hide()
 
         self.setWindowModality(modality)
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
 
     def paintEvent(self, _: QPaintEvent) -> None:  # noqa: N802
-        """Paint the WaitingSpinner."""
+        """Paint the current frame of the WaitingSpinner."""
         self._update_position()
-        painter = QPainter(self)
-        painter.fillRect(self.rect(), Qt.GlobalColor.transparent)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
-
         if self._current_counter >= self._number_of_lines:
             self._current_counter = 0
 
-        painter.setPen(Qt.PenStyle.NoPen)
+        strip = self._strip()
+        # The strip is square per frame, its height is the frame size in
+        # device pixels.
+        size = strip.height()
+        painter = QPainter(self)
+        painter.drawPixmap(
+            self.rect(),
+            strip,
+            QRect(self._current_counter * size, 0, size, size),
+        )
+        if self._is_spinning:
+            # The clock stops while no spinner is visible.
+            SpinnerClock.inst().wake()
+
+    def _strip(self) -> QPixmap:
+        """Return the sprite strip with all frames of the spinner."""
+        ratio = self.devicePixelRatioF()
+        antialiasing = RenderQualityManager.inst().antialiasing()
+        key = (
+            self.width(),
+            self._number_of_lines,
+            self._line_length,
+            self._line_width,
+            self._inner_radius,
+            self._roundness,
+            self._minimum_trail_opacity,
+            self._trail_fade_percentage,
+            self._color.rgba(),
+            antialiasing,
+            ratio,
+        )
+        try:
+            return WaitingSpinner._strips[key]
+        except KeyError:
+            if len(WaitingSpinner._strips) >= self.MAX_STRIPS:
+                log.debug("Clearing %s spinner strips", self.MAX_STRIPS)
+                WaitingSpinner._strips.clear()
+            size = math.ceil(self.width() * ratio)
+            strip = QPixmap(size * self._number_of_lines, size)
+            strip.setDevicePixelRatio(ratio)
+            strip.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(strip)
+            painter.setRenderHint(
+                QPainter.RenderHint.Antialiasing, antialiasing
+            )
+            painter.setPen(Qt.PenStyle.NoPen)
+            for counter in range(self._number_of_lines):
+                painter.save()
+                painter.translate(counter * size / ratio, 0)
+                self._draw_lines(painter, counter)
+                painter.restore()
+            painter.end()
+            WaitingSpinner._strips[key] = strip
+            return strip
+
+    def _draw_lines(self, painter: QPainter, counter: int) -> None:
+        """Draw the lines of the frame in which the counter's line leads."""
         for i in range(self._number_of_lines):
             painter.save()
             painter.translate(
@@ -102,7 +183,7 @@ class WaitingSpinner(QWidget):
             painter.rotate(rotate_angle)
             painter.translate(self._inner_radius, 0)
             distance = self._line_count_distance_from_primary(
-                i, self._current_counter, self._number_of_lines
+                i, counter, self._number_of_lines
             )
             color = self._current_line_color(
                 distance,
@@ -128,6 +209,9 @@ class WaitingSpinner(QWidget):
     def start(self) -> None:
         """Show and start spinning the WaitingSpinner."""
         self._update_position()
+        if not self._is_spinning:
+            self._current_counter = 0
+            self._start_time = SpinnerClock.inst().elapsed
         self._is_spinning = True
         self.show()
 
@@ -135,9 +219,7 @@ class WaitingSpinner(QWidget):
             assert self.parentWidget()
             self.parentWidget().setEnabled(False)
 
-        if not self._timer.isActive():
-            self._timer.start()
-            self._current_counter = 0
+        SpinnerClock.inst().register(self)
 
     def stop(self) -> None:
         """Hide and stop spinning the WaitingSpinner."""
@@ -147,9 +229,8 @@ class WaitingSpinner(QWidget):
         if self.parentWidget() and self._disable_parent_when_spinning:
             self.parentWidget().setEnabled(True)
 
-        if self._timer.isActive():
-            self._timer.stop()
-            self._current_counter = 0
+        SpinnerClock.inst().unregister(self)
+        self._current_counter = 0
 
     @property
     def color(self) -> QColor:
@@ -200,7 +281,7 @@ class WaitingSpinner(QWidget):
     def revolutions_per_second(self, revolutions_per_second: float) -> None:
         """Set revolutions per second of WaitingSpinner."""
         self._revolutions_per_second = revolutions_per_second
-        self._update_timer()
+        self._update_interval()
 
     @property
     def number_of_lines(self) -> int:
@@ -212,7 +293,7 @@ class WaitingSpinner(QWidget):
         """Set number of lines of WaitingSpinner."""
         self._number_of_lines = lines
         self._current_counter = 0
-        self._update_timer()
+        self._update_interval()
 
     @property
     def line_length(self) -> int:
@@ -252,23 +333,28 @@ class WaitingSpinner(QWidget):
         """Return actual spinning status of WaitingSpinner."""
         return self._is_spinning
 
-    def _rotate(self) -> None:
-        """Rotate the WaitingSpinner."""
-        self._current_counter += 1
-        if self._current_counter >= self._number_of_lines:
-            self._current_counter = 0
-        self.update()
+    def _advance(self, now: int) -> None:
+        """Show the frame for the given time of the SpinnerClock."""
+        counter = (
+            (now - self._start_time) // self._interval % self._number_of_lines
+        )
+        if counter != self._current_counter:
+            self._current_counter = counter
+            self.update()
 
     def _update_size(self) -> None:
         """Update the size of the WaitingSpinner."""
         size = (self._inner_radius + self._line_length) * 2
         self.setFixedSize(size, size)
 
-    def _update_timer(self) -> None:
+    def _update_interval(self) -> None:
         """Update the spinning speed of the WaitingSpinner."""
-        self._timer.setInterval(
-            int(1000 / (self._number_of_lines * self._revolutions_per_second))
+        self._interval = max(
+            int(1000 / (self._number_of_lines * self._revolutions_per_second)),
+            1,
         )
+        if self._is_spinning:
+            SpinnerClock.inst().update_interval()
 
     def _update_position(self) -> None:
         """Center WaitingSpinner on parent widget."""
@@ -314,3 +400,113 @@ class WaitingSpinner(QWidget):
             result_alpha = min(1.0, max(0.0, result_alpha))
             color.setAlphaF(result_alpha)
         return color
+
+
+class SpinnerClock(QObject):
+    """
+    Application wide clock that drives all spinning WaitingSpinners.
+
+    To use, get the current instance with SpinnerClock.inst(). A single timer
+    ticks with the shortest interval of the registered spinners and advances
+    only the spinners that are visible and not fully obscured. The frame of a
+    spinner is derived from the time since it was started, so a spinner keeps
+    its speed if ticks are skipped. When no spinner is visible, the timer
+    stops until a spinner is painted again.
+    """
+
+    INST: SpinnerClock | None = None
+
+    def __init__(self) -> None:
+        """Create a new SpinnerClock instance."""
+        assert not SpinnerClock.INST
+        super().__init__()
+        self._spinners: weakref.WeakSet[WaitingSpinner] = weakref.WeakSet()
+        self._elapsed = QElapsedTimer()
+        self._elapsed.start()
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self._tick)
+        AnimationPolicyManager.inst().policy_changed.connect(
+            self._on_policy_changed
+        )
+
+    @classmethod
+    def inst(cls) -> SpinnerClock:
+        """Return the current instance of the SpinnerClock."""
+        if not SpinnerClock.INST:
+            SpinnerClock.INST = SpinnerClock()
+        return SpinnerClock.INST
+
+    @property
+    def elapsed(self) -> int:
+        """Return the time in ms since the clock was created."""
+        return self._elapsed.elapsed()
+
+    @property
+    def is_ticking(self) -> bool:
+        """Return if the timer of the clock is running."""
+        return self._timer.isActive()
+
+    def register(self, spinner: WaitingSpinner) -> None:
+        """Drive the given spinner until it's unregistered."""
+        self._spinners.add(spinner)
+        self.update_interval()
+        self.wake()
+
+    def unregister(self, spinner: WaitingSpinner) -> None:
+        """Stop driving the given spinner."""
+        self._spinners.discard(spinner)
+        if self._valid_spinners():
+            self.update_interval()
+        else:
+            self._timer.stop()
+
+    def update_interval(self) -> None:
+        """Tick with the shortest interval of the registered spinners."""
+        spinners = self._valid_spinners()
+        if spinners:
+            interval = min(
+                spinner._interval  # pylint: disable=protected-access
+                for spinner in spinners
+            )
+            self._timer.setInterval(
+                AnimationPolicyManager.inst().interval(interval)
+            )
+
+    def wake(self) -> None:
+        """Start the timer if it's stopped and spinners are registered."""
+        if (
+            not self._timer.isActive()
+            and AnimationPolicyManager.inst().policy != AnimationPolicy.OFF
+            and self._valid_spinners()
+        ):
+            log.debug("Starting the spinner clock")
+            self._timer.start()
+
+    def _valid_spinners(self) -> list[WaitingSpinner]:
+        """Return the registered spinners that have not been deleted."""
+        return [
+            spinner for spinner in self._spinners if shiboken6.isValid(spinner)
+        ]
+
+    @Slot(name="_tick")
+    def _tick(self) -> None:
+        """Advance the visible spinners, stop if none is visible."""
+        now = self.elapsed
+        visible = False
+        for spinner in self._valid_spinners():
+            if spinner.isVisible() and not spinner.visibleRegion().isEmpty():
+                spinner._advance(now)  # pylint: disable=protected-access
+                visible = True
+        if not visible:
+            log.debug("No spinner is visible, stopping the spinner clock")
+            self._timer.stop()
+
+    @Slot(AnimationPolicy)
+    def _on_policy_changed(self, policy: AnimationPolicy) -> None:
+        """Adapt the timer to the AnimationPolicy."""
+        self.update_interval()
+        if policy == AnimationPolicy.OFF:
+            # The spinners stand still if animations are off.
+            self._timer.stop()
+        else:
+            self.wake()
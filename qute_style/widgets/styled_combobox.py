@@ -2,17 +2,21 @@
 
 from __future__ import annotations
 
+import bisect
 import contextlib
 import logging
+from collections.abc import Generator, Iterable, Iterator, Sequence
 from typing import Generic, TypeVar, cast
 
 from PySide6 import QtGui
 from PySide6.QtCore import (
     QEvent,
+    QMetaMethod,
     QModelIndex,
     QObject,
     QPoint,
     Qt,
+    QTimer,
     Signal,
     Slot,
 )
@@ -21,20 +25,27 @@ from PySide6.QtGui import (
     QIcon,
     QMouseEvent,
     QPainter,
+    QPalette,
     QResizeEvent,
     QStandardItem,
     QStandardItemModel,
 )
 from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QApplication,
+    QBoxLayout,
     QComboBox,
+    QLineEdit,
     QListView,
-    QStyle,
     QStyleOptionComboBox,
     QWidget,
 )
 
-from qute_style.style import get_color
-from qute_style.widgets.custom_icon_engine import CustomIconEngine, PixmapStore
+from qute_style.qute_style import QuteStyle
+from qute_style.style import get_style
+from qute_style.widgets.checkable_list_model import CheckableListModel
+from qute_style.widgets.custom_icon_engine import CustomIconEngine
+from qute_style.widgets.item_search import ItemSearchIndex, SearchResultModel
 
 log = logging.getLogger(
     f"qute_style.{__name__}"
@@ -66,60 +77,115 @@ class StyledComboBox(QComboBox):
             QComboBox.SizeAdjustPolicy.AdjustToMinimumContentsLengthWithIcon
         )
 
-    def paintEvent(self, event: QtGui.QPaintEvent) -> None:  # noqa: N802
-        """Overwrite method to draw custom arrow."""
-        # Draw ComboBox like defined in style sheet
-        super().paintEvent(event)
-
-        # Paint custom arrow above ComboBox
-        painter = QPainter()
-        painter.begin(self)
+        # Whether only the main style sheet applies, see _single_pass.
+        self._main_style_only: bool | None = None
 
-        # Set correct color
-        if self.isEnabled():
-            color = get_color("foreground")
-        else:
-            color = get_color("fg_disabled")
+    def event(self, event: QEvent) -> bool:
+        """Check the applying style sheets again after they may change."""
+        if event.type() in (
+            QEvent.Type.StyleChange,
+            QEvent.Type.ParentChange,
+            QEvent.Type.DynamicPropertyChange,
+        ):
+            self._main_style_only = None
+        return super().event(event)
+
+    def _single_pass(self) -> bool:
+        """
+        Return if the ComboBox can be drawn in a single pass with QuteStyle.
+
+        That's only the case if no style sheet rule beyond the main style
+        sheet applies: neither the application nor the ComboBox or one of its
+        parents may have another style sheet. Rules of the main style sheet
+        for special cases (a cssClass or a ComboBox within an item view) are
+        left to the style sheet as well.
+        """
+        if not isinstance(QApplication.style(), QuteStyle):
+            return False
+        if self._main_style_only is None:
+            self._main_style_only = self._check_main_style_only()
+        return self._main_style_only
+
+    def _check_main_style_only(self) -> bool:
+        """Return if only the main style sheet applies to the ComboBox."""
+        if self.property("cssClass") is not None:
+            return False
+        main_style = get_style()
+        style_sheets = [
+            cast(QApplication, QApplication.instance()).styleSheet()
+        ]
+        widget: QWidget | None = self
+        while widget is not None:
+            if isinstance(widget, QAbstractItemView):
+                return False
+            style_sheets.append(widget.styleSheet())
+            widget = widget.parentWidget()
+        return all(sheet in ("", main_style) for sheet in style_sheets)
 
-        # Define size of arrow depending on ComboBox SubControl
+    def paintEvent(self, event: QtGui.QPaintEvent) -> None:  # noqa: N802
+        """
+        Draw the ComboBox in a single pass with QuteStyle if possible.
+
+        If only the main style sheet applies, its QComboBox rules are
+        bypassed and QuteStyle draws the frame, the drop-down and the arrow
+        from the theme colors. Otherwise, the style sheet draws it.
+        """
+        if not self._single_pass():
+            super().paintEvent(event)
+            return
+        style = cast(QuteStyle, QApplication.style())
+        painter = QPainter(self)
         opt = QStyleOptionComboBox()
-        rect = self.style().subControlRect(
-            QStyle.ComplexControl.CC_ComboBox,
-            opt,
-            QStyle.SubControl.SC_ComboBoxArrow,
-            None,
-        )
-        radius = int(rect.width() * 0.5)
-
-        # Get correct scale and pixmap
-        scale = int(painter.device().devicePixelRatio())
-        pixmap = PixmapStore.inst().get_pixmap(
-            ":/svg_icons/expand_more.svg",
-            radius * scale,
-            radius * scale,
-            color,
-        )
-        # Draw arrow above existing ComboBox
-        painter.setCompositionMode(
-            QPainter.CompositionMode.CompositionMode_SourceOver
-        )
-        # Draw arrow in rect 25x25 at the end, with size: radius x radius
-        # x-axis: in the middle of arrow rect with spacing 2
-        # y-axis: in the middle of arrow rect
-        painter.drawPixmap(
-            int(self.width() - 0.5 * (4 + rect.width() + radius)),
-            int(0.5 * (self.height() - radius)),
-            radius,
-            radius,
-            pixmap,
+        self.initStyleOption(opt)
+        style.draw_combo_box(opt, painter)
+        # The label is drawn with the painter's pen.
+        painter.setPen(
+            opt.palette.color(
+                (
+                    QPalette.ColorGroup.Normal
+                    if self.isEnabled()
+                    else QPalette.ColorGroup.Disabled
+                ),
+                QPalette.ColorRole.Text,
+            )
         )
+        style.draw_combo_box_label(opt, painter)
         painter.end()
 
 
 class CheckableComboBox(StyledComboBox, Generic[ItemData]):
-    """Combobox that displays a list of items to be checked."""
+    """
+    Combobox that displays a list of items to be checked.
+
+    The data and check state of the items are mirrored in an index that is
+    kept in sync with the model's signals. The checked items, the text and
+    the current state are answered from the index, so toggling an item does
+    not scan the model.
+
+    With COMPACT_MODEL, the items are stored in a CheckableListModel instead
+    of a QStandardItemModel and the popup lays out the items in batches,
+    which is meant for very large lists.
+
+    With SEARCHABLE, the popup has a search field on top. The texts of the
+    items are kept in an ItemSearchIndex and the matching items are shown in
+    a separate view, so that filtering doesn't touch the rows of the model.
+
+    Changes of the checked items are emitted as the ids that were checked and
+    unchecked via selection_changed, optionally debounced. The dict of all
+    items and their check state is only built for dataChanged if the signal
+    is connected.
+    """
 
     dataChanged = Signal(dict, name="dataChanged")  # noqa: N815
+    # ids of the items that were checked and unchecked
+    selection_changed = Signal(list, list)
+
+    # Store the items in a CheckableListModel.
+    COMPACT_MODEL: bool = False
+    # Show a search field in the popup to filter the items.
+    SEARCHABLE: bool = False
+    # First row of the items reported via selection_changed.
+    _FIRST_ITEM_ROW: int = 0
 
     def __init__(self, parent: QWidget | None = None) -> None:
         """Create a new CheckableComboBox."""
@@ -135,8 +201,42 @@ class CheckableComboBox(StyledComboBox, Generic[ItemData]):
         self.setEditable(True)
         self.lineEdit().setReadOnly(True)
 
+        # Index of the items: data and check state per row, the checked rows
+        # (and in order, None if it's outdated) and the text of the checked
+        # items (None if it's outdated).
+        self._row_data: list[ItemData | None] = []
+        self._row_states: list[Qt.CheckState] = []
+        self._checked_rows: set[int] = set()
+        self._sorted_rows: list[int] | None = []
+        self._text: str | None = None
+
+        # ids checked and unchecked since the last selection_changed, the
+        # dicts are used as ordered sets
+        self._added_ids: dict[ItemData | None, None] = {}
+        self._removed_ids: dict[ItemData | None, None] = {}
+        self._selection_timer = QTimer(self)
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.setInterval(0)
+        self._selection_timer.timeout.connect(self._emit_selection_changed)
+        self._selection_debounce = 0
+
+        if self.COMPACT_MODEL:
+            self.setModel(CheckableListModel(self))
+            view = cast(QListView, self.view())
+            view.setUniformItemSizes(True)
+            view.setLayoutMode(QListView.LayoutMode.Batched)
+
+        # Keep the index in sync, before the data change is handled
+        model = self.model()
+        model.dataChanged.connect(self._on_model_data_changed)
+        model.rowsInserted.connect(self._on_rows_inserted)
+        model.rowsRemoved.connect(self._on_rows_removed)
+        model.rowsMoved.connect(self._rebuild_index)
+        model.layoutChanged.connect(self._rebuild_index)
+        model.modelReset.connect(self._rebuild_index)
+
         # Update the text when an item is toggled
-        self.model().dataChanged.connect(self.handle_data_change)
+        model.dataChanged.connect(self.handle_data_change)
 
         # Prevent popup from closing when clicking on an item
         self.view().viewport().installEventFilter(self)
@@ -148,6 +248,14 @@ class CheckableComboBox(StyledComboBox, Generic[ItemData]):
         # add some spacing between the items
         cast(QListView, self.view()).setSpacing(2)
 
+        # Search field, the view of the matching items and their index
+        self._search_field: QLineEdit | None = None
+        self._result_view: QListView | None = None
+        self._result_model: SearchResultModel | None = None
+        self._search_index = ItemSearchIndex()
+        if self.SEARCHABLE:
+            self._create_search()
+
     @property
     def single_mode(self) -> bool:
         """Return if only one item can be checked at a time (single mode)."""
@@ -159,6 +267,227 @@ class CheckableComboBox(StyledComboBox, Generic[ItemData]):
         log.debug("Setting single mode to %s", single_mode)
         self._single = single_mode
 
+    @property
+    def selection_debounce(self) -> int:
+        """Return the time in ms that selection changes are collected."""
+        return self._selection_debounce
+
+    @selection_debounce.setter
+    def selection_debounce(self, msecs: int) -> None:
+        """
+        Collect selection changes for the given time in ms.
+
+        Toggles within this time after the last one are emitted in a single
+        selection_changed. With 0, selection_changed is emitted right away.
+        """
+        self._selection_debounce = msecs
+        self._selection_timer.setInterval(msecs)
+
+    def _create_search(self) -> None:
+        """Add the search field and the view of the matches to the popup."""
+        view = cast(QListView, self.view())
+        self._search_field = QLineEdit(self)
+        self._search_field.setPlaceholderText(self.tr("Suchen..."))
+        self._search_field.setClearButtonEnabled(True)
+        self._search_field.textChanged.connect(self._apply_search)
+
+        self._result_model = SearchResultModel(self.model(), self)
+        self._result_view = QListView(self)
+        self._result_view.setModel(self._result_model)
+        self._result_view.setItemDelegate(view.itemDelegate())
+        self._result_view.setSpacing(view.spacing())
+        self._result_view.setUniformItemSizes(True)
+        self._result_view.setLayoutMode(QListView.LayoutMode.Batched)
+        self._result_view.setVerticalScrollMode(view.verticalScrollMode())
+        self._result_view.viewport().installEventFilter(self)
+        self._result_view.hide()
+
+        # The popup's layout contains the scrollers and the view
+        container = view.parentWidget()
+        layout = cast(QBoxLayout, container.layout())
+        layout.insertWidget(0, self._search_field)
+        layout.insertWidget(layout.indexOf(view) + 1, self._result_view)
+
+    @Slot(str, name="_apply_search")
+    def _apply_search(self, query: str) -> None:
+        """Show the items that match the query instead of all items."""
+        if self._result_model is None or self._result_view is None:
+            return
+        if query:
+            self._update_search_index()
+            rows = self._search_rows(query)
+            log.debug("%s items match %r", len(rows), query)
+        else:
+            rows = []
+        self._result_model.set_rows(rows)
+        self._result_view.setVisible(bool(query))
+        self.view().setVisible(not query)
+        self._search_changed()
+
+    def _update_search_index(self) -> None:
+        """Add the items that are not indexed yet to the search index."""
+        count = self.model().rowCount()
+        first = len(self._search_index)
+        if first < count:
+            log.debug("Indexing the texts of %s items", count - first)
+            self._search_index.append(self._item_texts(first, count - 1))
+
+    def _item_texts(self, first: int, last: int) -> Iterator[str]:
+        """Return the texts of the items in the given rows."""
+        model = self.model()
+        return (
+            model.data(model.index(row, 0)) or ""
+            for row in range(first, last + 1)
+        )
+
+    def _search_rows(self, query: str) -> list[int]:
+        """Return the rows of the items that match the query."""
+        return self._search_index.search(query)
+
+    def _filtered_rows(self) -> list[int] | None:
+        """Return the rows shown by an active search, else None."""
+        if self._search_field is None or not self._search_field.text():
+            return None
+        assert self._result_model is not None
+        return self._result_model.source_rows
+
+    def _search_changed(self) -> None:
+        """Handle a change of the shown items after a search."""
+
+    def _invalidate_search(self) -> None:
+        """Update the search after rows changed."""
+        if self._search_field is not None and self._search_field.text():
+            self._apply_search(self._search_field.text())
+
+    def _sync_rows(self, first: int, last: int) -> None:
+        """Update the index from the items in the given rows."""
+        model = self.model()
+        for row in range(first, last + 1):
+            if isinstance(model, CheckableListModel):
+                data, state = model.item_data(row), model.check_state(row)
+            else:
+                item = cast(QStandardItemModel, model).item(row)
+                data, state = item.data(), item.checkState()
+            checked = state == Qt.CheckState.Checked
+            was_checked = row in self._checked_rows
+            old_data = self._row_data[row]
+            if checked != was_checked:
+                self._sorted_rows = None
+            if checked != was_checked or (checked and data != old_data):
+                self._text = None
+                if row >= self._FIRST_ITEM_ROW:
+                    if was_checked:
+                        self._record_selection(old_data, False)
+                    if checked:
+                        self._record_selection(data, True)
+            if checked:
+                self._checked_rows.add(row)
+            else:
+                self._checked_rows.discard(row)
+            self._row_data[row] = data
+            self._row_states[row] = state
+
+    def _set_check_state(self, row: int, state: Qt.CheckState) -> None:
+        """Set the check state of the item in the given row."""
+        model = self.model()
+        if isinstance(model, CheckableListModel):
+            model.set_check_state(row, state)
+        else:
+            cast(QStandardItemModel, model).item(row).setCheckState(state)
+
+    @Slot(
+        QModelIndex,
+        QModelIndex,
+        "QVector<int>",  # type: ignore
+        name="_on_model_data_changed",
+    )
+    def _on_model_data_changed(
+        self,
+        start: QModelIndex,
+        end: QModelIndex,
+        roles: list[Qt.ItemDataRole],
+    ) -> None:
+        """Update the index for the changed rows."""
+        self._sync_rows(start.row(), end.row())
+        # Rows that are not indexed yet are indexed with the next search
+        last = min(end.row(), len(self._search_index) - 1)
+        if (
+            not roles or Qt.ItemDataRole.DisplayRole in roles
+        ) and start.row() <= last:
+            self._search_index.replace(
+                start.row(), self._item_texts(start.row(), last)
+            )
+            self._invalidate_search()
+
+    @Slot(QModelIndex, int, int, name="_on_rows_inserted")
+    def _on_rows_inserted(self, _: QModelIndex, first: int, last: int) -> None:
+        """Add the inserted rows to the index."""
+        count = last - first + 1
+        self._row_data[first:first] = [None] * count
+        self._row_states[first:first] = [Qt.CheckState.Unchecked] * count
+        self._checked_rows = {
+            row + count if row >= first else row for row in self._checked_rows
+        }
+        self._sorted_rows = None
+        self._sync_rows(first, last)
+        # Appended items are indexed incrementally with the next search
+        if first < len(self._search_index):
+            self._search_index.insert(first, self._item_texts(first, last))
+        self._invalidate_search()
+        self._schedule_selection_changed()
+
+    @Slot(QModelIndex, int, int, name="_on_rows_removed")
+    def _on_rows_removed(self, _: QModelIndex, first: int, last: int) -> None:
+        """Remove the removed rows from the index."""
+        count = last - first + 1
+        for row in self._sorted_checked_rows():
+            if first <= row <= last:
+                self._text = None
+                if row >= self._FIRST_ITEM_ROW:
+                    self._record_selection(self._row_data[row], False)
+        del self._row_data[first : last + 1]
+        del self._row_states[first : last + 1]
+        self._checked_rows = {
+            row - count if row > last else row
+            for row in self._checked_rows
+            if not first <= row <= last
+        }
+        self._sorted_rows = None
+        if first < len(self._search_index):
+            self._search_index.remove(
+                first, min(last, len(self._search_index) - 1)
+            )
+        self._invalidate_search()
+        self._schedule_selection_changed()
+
+    @Slot(name="_rebuild_index")
+    def _rebuild_index(self) -> None:
+        """Rebuild the index after the rows have been moved or reset."""
+        log.debug("Rebuilding the index of %s", self)
+        for row in self._sorted_checked_rows():
+            if row >= self._FIRST_ITEM_ROW:
+                self._record_selection(self._row_data[row], False)
+        count = self.model().rowCount()
+        self._row_data = [None] * count
+        self._row_states = [Qt.CheckState.Unchecked] * count
+        self._checked_rows = set()
+        self._sorted_rows = []
+        self._text = None
+        self._sync_rows(0, count - 1)
+        self._search_index.clear()
+        self._invalidate_search()
+        self._schedule_selection_changed()
+
+    def _sorted_checked_rows(self) -> list[int]:
+        """Return the checked rows in order, sorted once per change."""
+        if self._sorted_rows is None:
+            self._sorted_rows = sorted(self._checked_rows)
+        return self._sorted_rows
+
+    def _checked_item_rows(self) -> list[int]:
+        """Return the checked rows that are shown in the text, in order."""
+        return self._sorted_checked_rows()
+
     def resizeEvent(self, event: QResizeEvent) -> None:  # noqa: N802
         """Recompute text when CheckableCombobox is resized."""
         super().resizeEvent(event)
@@ -182,26 +511,60 @@ class CheckableComboBox(StyledComboBox, Generic[ItemData]):
                     self.popup_open = True
                 return True
 
-            if obj is self.view().viewport():
-                with contextlib.suppress(AttributeError):
-                    self._check_item_at_pos(event.pos())
-                    return True
+            if obj is self.view().viewport() and self._check_item_at_pos(
+                event.pos()
+            ):
+                return True
+            if (
+                self._result_view is not None
+                and obj is self._result_view.viewport()
+                and self._check_result_at_pos(event.pos())
+            ):
+                return True
         return False
 
+    def showPopup(self) -> None:  # noqa: N802
+        """Show the popup, with the focus on the search field."""
+        super().showPopup()
+        if self._search_field is not None:
+            self._update_search_index()
+            # Make room for the search field above the items
+            container = self.view().parentWidget()
+            container.resize(
+                container.width(),
+                container.height() + self._search_field.sizeHint().height(),
+            )
+            self._search_field.setFocus()
+
     def hidePopup(self) -> None:  # noqa: N802
         """Set the state correctly when the popup is hidden from outside."""
         log.debug("Hiding popup")
         self.popup_open = False
         super().hidePopup()
-
-    def _check_item_at_pos(self, pos: QPoint) -> None:
-        """Toggle the CheckState at the given pos."""
-        index = self.view().indexAt(pos)
-        item = cast(QStandardItemModel, self.model()).item(index.row())
-        if item.checkState() == Qt.CheckState.Checked:
-            item.setCheckState(Qt.CheckState.Unchecked)
+        if self._search_field is not None:
+            self._search_field.clear()
+
+    def _check_item_at_pos(self, pos: QPoint) -> bool:
+        """Toggle the CheckState at the given pos, return if there's one."""
+        return self._toggle_row(self.view().indexAt(pos).row())
+
+    def _check_result_at_pos(self, pos: QPoint) -> bool:
+        """Toggle the CheckState of the match at the given pos."""
+        assert self._result_view is not None and self._result_model is not None
+        row = self._result_view.indexAt(pos).row()
+        if row < 0:
+            return False
+        return self._toggle_row(self._result_model.source_row(row))
+
+    def _toggle_row(self, row: int) -> bool:
+        """Toggle the CheckState of the given row, return if there's one."""
+        if row < 0:
+            return False
+        if self._row_states[row] == Qt.CheckState.Checked:
+            self._set_check_state(row, Qt.CheckState.Unchecked)
         else:
-            item.setCheckState(Qt.CheckState.Checked)
+            self._set_check_state(row, Qt.CheckState.Checked)
+        return True
 
     @Slot(
         QModelIndex,
@@ -225,14 +588,13 @@ class CheckableComboBox(StyledComboBox, Generic[ItemData]):
             log.debug("Unchecking other items, since single mode is active.")
             # we should never edit check state for two indexes at the same time
             assert start == end
-            for idx in range(self.model().rowCount()):
-                if idx != start.row():
-                    index = self.model().index(idx, 0, QModelIndex())
-                    self.model().setData(
-                        index,
-                        Qt.CheckState.Unchecked,
-                        Qt.ItemDataRole.CheckStateRole,
-                    )
+            for idx in self._checked_rows - {start.row()}:
+                index = self.model().index(idx, 0, QModelIndex())
+                self.model().setData(
+                    index,
+                    Qt.CheckState.Unchecked,
+                    Qt.ItemDataRole.CheckStateRole,
+                )
         self.update_text()
         self.send_current_state()
 
@@ -248,29 +610,90 @@ class CheckableComboBox(StyledComboBox, Generic[ItemData]):
         self.lineEdit().setText(elided_text)
 
     def send_current_state(self) -> None:
-        """Emit the current state via dataChanged."""
-        current_state: dict[str | int, Qt.CheckState] = {
-            self.model().item(i).data(): (self.model().item(i).checkState())
-            for i in range(self.model().rowCount())
-        }
-        self.dataChanged.emit(current_state)
+        """Emit the current state via dataChanged and selection_changed."""
+        # Building the dict of all items is only done for a listener
+        if self.isSignalConnected(QMetaMethod.fromSignal(self.dataChanged)):
+            current_state: dict[str | int, Qt.CheckState] = dict(
+                zip(  # type: ignore[arg-type]
+                    self._row_data, self._row_states, strict=True
+                )
+            )
+            self.dataChanged.emit(current_state)
+        self._schedule_selection_changed()
+
+    def _record_selection(
+        self, item_id: ItemData | None, checked: bool
+    ) -> None:
+        """Record that the item with the given id was checked/unchecked."""
+        added, removed = (
+            (self._added_ids, self._removed_ids)
+            if checked
+            else (self._removed_ids, self._added_ids)
+        )
+        # A change that reverts a pending one cancels it
+        if item_id in removed:
+            del removed[item_id]
+        else:
+            added[item_id] = None
+
+    def _schedule_selection_changed(self) -> None:
+        """Emit selection_changed now or after the debounce time."""
+        if not self._added_ids and not self._removed_ids:
+            return
+        if self._selection_debounce:
+            # Restarting the timer collects rapid toggles
+            self._selection_timer.start()
+        else:
+            self._emit_selection_changed()
+
+    @Slot(name="_emit_selection_changed")
+    def _emit_selection_changed(self) -> None:
+        """Emit the ids checked and unchecked since the last emit."""
+        self._selection_timer.stop()
+        if not self._added_ids and not self._removed_ids:
+            return
+        added, removed = list(self._added_ids), list(self._removed_ids)
+        self._added_ids, self._removed_ids = {}, {}
+        self.selection_changed.emit(added, removed)
 
     def _get_text(self) -> str:
         """Return the text that is shown at the top of the combobox."""
-        texts = [
-            str(cast(QStandardItemModel, self.model()).item(idx).data())
-            for idx in range(self.model().rowCount())
-            if cast(QStandardItemModel, self.model()).item(idx).checkState()
-            == Qt.CheckState.Checked
-        ]
-
-        text = ", ".join(texts)
+        if self._text is None:
+            self._text = ", ".join(
+                str(self._row_data[row]) for row in self._checked_item_rows()
+            )
         # set to no index otherwise the state icon is displayed from
         # the first item in the combo box text which is selected by default
         self.setCurrentIndex(-1)
-        if not text:
-            text = self._default_text
-        return text
+        return self._text or self._default_text
+
+    @staticmethod
+    def _create_item(
+        text: str, data: ItemData | None, icon: QIcon | None
+    ) -> QStandardItem:
+        """Create an unchecked item for the model."""
+        item = QStandardItem(text)
+        item.setData(data)
+        item.setFlags(
+            Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsUserCheckable
+        )
+        item.setData(Qt.CheckState.Unchecked, Qt.ItemDataRole.CheckStateRole)
+        if icon:
+            item.setData(icon, Qt.ItemDataRole.DecorationRole)
+        return item
+
+    @staticmethod
+    def _create_icon(
+        icon_path: str | None, icon_color: str | None
+    ) -> QIcon | None:
+        """Create the icon of items, None if no icon_path is given."""
+        if icon_color and not icon_path:
+            raise AssertionError(
+                "Color can only be passed together with an icon (path)"
+            )
+        if not icon_path:
+            return None
+        return QIcon(CustomIconEngine(icon_path, icon_color or "foreground"))
 
     def addItem(  # type: ignore # noqa: N802
         self,
@@ -280,57 +703,127 @@ class CheckableComboBox(StyledComboBox, Generic[ItemData]):
         icon_color: str | None = None,
     ) -> None:
         """Add an Item to the Combobox."""
-        if icon_color and not icon_path:
-            raise AssertionError(
-                "Color can only be passed together with an icon (path)"
-            )
-        item = QStandardItem(text)
-        item.setData(data)
-        item.setFlags(
-            Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsUserCheckable
-        )
-        item.setData(Qt.CheckState.Unchecked, Qt.ItemDataRole.CheckStateRole)
-        if icon_path:
-            item.setData(
-                QIcon(CustomIconEngine(icon_path, icon_color or "foreground")),
-                Qt.ItemDataRole.DecorationRole,
-            )
-        cast(QStandardItemModel, self.model()).appendRow(item)
+        icon = self._create_icon(icon_path, icon_color)
+        model = self.model()
+        if isinstance(model, CheckableListModel):
+            model.add_items([(text, data)], icon)
+        else:
+            item = self._create_item(text, data, icon)
+            cast(QStandardItemModel, model).appendRow(item)
+        self.update_text()
+
+    def add_items(
+        self,
+        items: Iterable[tuple[str, ItemData | None]],
+        icon_path: str | None = None,
+        icon_color: str | None = None,
+    ) -> None:
+        """
+        Add the items given as (text, data) to the Combobox at once.
+
+        The items are appended in a single model operation, the text is
+        updated and dataChanged is emitted once. The icon is shared by all
+        items.
+        """
+        icon = self._create_icon(icon_path, icon_color)
+        model = self.model()
+        count = model.rowCount()
+        if isinstance(model, CheckableListModel):
+            model.add_items(items, icon)
+        else:
+            new_items = [
+                self._create_item(text, data, icon) for text, data in items
+            ]
+            if new_items:
+                cast(QStandardItemModel, model).invisibleRootItem().appendRows(
+                    new_items
+                )
+        if model.rowCount() == count:
+            return
+        log.debug("Added %s items", model.rowCount() - count)
         self.update_text()
+        self.send_current_state()
 
     @property
     def item_ids(self) -> list[ItemData]:
         """Return the list of ids checked by the user."""
         return [
-            cast(QStandardItemModel, self.model()).item(i).data()
-            for i in range(self.model().rowCount())
-            if cast(QStandardItemModel, self.model()).item(i).checkState()
-            == Qt.CheckState.Checked
+            cast(ItemData, self._row_data[row])
+            for row in self._sorted_checked_rows()
         ]
 
     @item_ids.setter
     def item_ids(self, item_ids: list[ItemData]) -> None:
         """Set the ids that are selected/checked."""
-        if self.single_mode and len(item_ids) > 1:
+        self.set_item_ids(item_ids)
+
+    def set_item_ids(self, item_ids: Iterable[ItemData]) -> None:
+        """
+        Check the items with the given ids and uncheck all others at once.
+
+        The check states are changed with the model's signals blocked, the
+        text is updated and dataChanged is emitted once. The ids have to be
+        hashable.
+        """
+        ids = set(item_ids)
+        if self.single_mode and len(ids) > 1:
             raise TooManyItemsError(
                 "Passed list contains more than one "
                 "item for single mode checkbox."
             )
-        log.debug("Setting item_ids: %s", item_ids)
-        for idx in range(self.model().rowCount()):
-            data = cast(QStandardItemModel, self.model()).item(idx).data()
-            cast(QStandardItemModel, self.model()).item(idx).setCheckState(
-                Qt.CheckState.Checked
-                if data in item_ids
-                else Qt.CheckState.Unchecked
-            )
+        log.debug("Setting item_ids: %s", ids)
+        with self._signals_blocked():
+            for row in self._id_rows():
+                state = (
+                    Qt.CheckState.Checked
+                    if self._row_data[row] in ids
+                    else Qt.CheckState.Unchecked
+                )
+                # Only touch the items that change
+                if self._row_states[row] != state:
+                    self._set_check_state(row, state)
+                    self._sync_rows(row, row)
+        self._finish_bulk_change()
+
+    @contextlib.contextmanager
+    def _signals_blocked(self) -> Generator[None, None, None]:
+        """
+        Block the signals of the model and repaint the popup afterwards.
+
+        The index has to be synced for changed rows while this is active.
+        """
+        self.model().blockSignals(True)
+        try:
+            yield
+        finally:
+            self.model().blockSignals(False)
+            self.view().viewport().update()
+            if self._result_view is not None:
+                self._result_view.viewport().update()
+
+    def _id_rows(self) -> range:
+        """Return the rows that are checked and unchecked by their ids."""
+        return range(self.model().rowCount())
+
+    def _finish_bulk_change(self) -> None:
+        """Update the text and emit the state after a bulk change."""
+        self.update_text()
+        self.send_current_state()
 
 
 class SelectAllComboBox(CheckableComboBox[str | int], Generic[ItemData]):
     """CheckableComboBox that has an entry that alters the whole selection."""
 
+    # The first rows are the "select all" item and the separator
+    _FIRST_ITEM_ROW = 2
+
     def __init__(self, parent: QWidget | None = None) -> None:
         """Create a new SelectAllComboBox."""
+        if self.COMPACT_MODEL:
+            raise TypeError(
+                "SelectAllComboBox needs the tristate items of "
+                "QStandardItemModel"
+            )
         super().__init__(parent)
         self.addItem(self.tr("Alles auswählen"))
         self.model().item(0).setAutoTristate(True)
@@ -361,51 +854,77 @@ class SelectAllComboBox(CheckableComboBox[str | int], Generic[ItemData]):
         self.model().blockSignals(True)
         # handle how the select_all_item affects all other items
         if start == self.model().index(0, 0, QModelIndex()):
-            if select_all_item.checkState() == Qt.CheckState.Checked:
-                log.debug("Selecting all items.")
-                for idx in range(2, self.model().rowCount()):
-                    self.model().item(idx).setCheckState(Qt.CheckState.Checked)
-            elif select_all_item.checkState() == Qt.CheckState.Unchecked:
-                log.debug("Deselecting all items.")
-                for idx in range(2, self.model().rowCount()):
-                    self.model().item(idx).setCheckState(
-                        Qt.CheckState.Unchecked
-                    )
-            elif (
-                select_all_item.checkState() == Qt.CheckState.PartiallyChecked
-            ):
+            state = select_all_item.checkState()
+            if state == Qt.CheckState.PartiallyChecked:
+                self.model().blockSignals(False)
                 return
+            log.debug(
+                "%s all items.",
+                (
+                    "Selecting"
+                    if state == Qt.CheckState.Checked
+                    else "Deselecting"
+                ),
+            )
+            # The model's signals are blocked, update the index directly
+            for idx in self._select_all_rows():
+                if self._row_states[idx] != state:
+                    self.model().item(idx).setCheckState(state)
+                    self._sync_rows(idx, idx)
         # handle how all other items affect the select_all_item
-        elif all(
-            self.model().item(idx).checkState() == Qt.CheckState.Checked
-            for idx in range(2, self.model().rowCount())
-        ):
-            select_all_item.setCheckState(Qt.CheckState.Checked)
-        elif all(
-            self.model().item(idx).checkState() == Qt.CheckState.Unchecked
-            for idx in range(2, self.model().rowCount())
-        ):
-            select_all_item.setCheckState(Qt.CheckState.Unchecked)
         else:
-            select_all_item.setCheckState(Qt.CheckState.PartiallyChecked)
+            self._update_select_all_item()
         self.model().blockSignals(False)
         super().handle_data_change(
             self.model().index(2, 0, QModelIndex()), end, roles
         )
 
-    def _get_text(self) -> str:
-        """Return the text that is shown at the top of the combobox."""
-        texts = [
-            str(cast(QStandardItemModel, self.model()).item(idx).data())
-            for idx in range(2, self.model().rowCount())
-            if cast(QStandardItemModel, self.model()).item(idx).checkState()
-            == Qt.CheckState.Checked
-        ]
-
-        text = ", ".join(texts)
-        # set to no index otherwise the state icon is displayed from
-        # the first item in the combo box text which is selected by default
-        self.setCurrentIndex(-1)
-        if not text:
-            text = self._default_text
-        return text
+    def _select_all_rows(self) -> Sequence[int]:
+        """Return the rows of the items that "select all" applies to."""
+        rows = self._filtered_rows()
+        if rows is None:
+            return range(2, self.model().rowCount())
+        # The matches start with the "select all" item
+        return rows[1:]
+
+    def _update_select_all_item(self) -> None:
+        """Set the "select all" item's state from the other items."""
+        rows = self._select_all_rows()
+        if isinstance(rows, range):
+            checked = len(self._checked_rows) - (0 in self._checked_rows)
+        else:
+            checked = len(self._checked_rows.intersection(rows))
+        if checked == len(rows):
+            state = Qt.CheckState.Checked
+        elif checked == 0:
+            state = Qt.CheckState.Unchecked
+        else:
+            state = Qt.CheckState.PartiallyChecked
+        self.model().item(0).setCheckState(state)
+        self._sync_rows(0, 0)
+
+    def _checked_item_rows(self) -> list[int]:
+        """Return the checked rows that are shown in the text, in order."""
+        # The first rows are the "select all" item and the separator
+        rows = self._sorted_checked_rows()
+        return rows[bisect.bisect_left(rows, 2) :]
+
+    def _id_rows(self) -> range:
+        """Return the rows that are checked and unchecked by their ids."""
+        return range(2, self.model().rowCount())
+
+    def _search_rows(self, query: str) -> list[int]:
+        """Return the "select all" item and the items matching the query."""
+        rows = super()._search_rows(query)
+        return [0, *rows[bisect.bisect_left(rows, 2) :]]
+
+    def _search_changed(self) -> None:
+        """Update the "select all" item for the shown items."""
+        with self._signals_blocked():
+            self._update_select_all_item()
+
+    def _finish_bulk_change(self) -> None:
+        """Update the "select all" item, the text and emit the state."""
+        with self._signals_blocked():
+            self._update_select_all_item()
+        super()._finish_bulk_change()
@@ -2,10 +2,147 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
+from collections import OrderedDict
+from collections.abc import Iterable
 
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QFontMetrics, QStaticText
+from PySide6.QtGui import QFont, QFontMetrics, QStaticText
+
+
+class TruncationCache:
+    """
+    LRU cache of truncated texts as QStaticText.
+
+    The texts are stored per text, width bucket and font key. The width is
+    rounded down to a multiple of the width bucket and the text is elided to
+    that width. With a bucket of more than one pixel, slightly different
+    widths (e.g. during an animation) share one entry. The least recently
+    used texts are evicted when the estimated size exceeds the byte budget.
+
+    The instance returned by TruncationCache.inst() is shared by all
+    TextTruncators that don't get their own cache.
+    """
+
+    INST: TruncationCache | None = None
+
+    # Byte budget of the shared cache.
+    MAX_BYTES: int = 16 * 1024 * 1024
+    # Widths are rounded down to a multiple of this many pixels.
+    WIDTH_BUCKET: int = 1
+    # Estimated size of a QStaticText with AggressiveCaching: a fixed part
+    # and the cached glyph positions per character.
+    ENTRY_BYTES: int = 256
+    CHAR_BYTES: int = 64
+
+    def __init__(
+        self, max_bytes: int | None = None, width_bucket: int | None = None
+    ) -> None:
+        """Create a new, empty TruncationCache."""
+        self._max_bytes = self.MAX_BYTES if max_bytes is None else max_bytes
+        self._width_bucket = width_bucket or self.WIDTH_BUCKET
+        # _texts[text, width bucket, font key] = static text, size in bytes
+        self._texts: OrderedDict[
+            tuple[str, int, str], tuple[QStaticText, int]
+        ] = OrderedDict()
+        self._size = 0
+
+    @classmethod
+    def inst(cls) -> TruncationCache:
+        """Return the process-wide instance of the TruncationCache."""
+        if TruncationCache.INST is None:
+            TruncationCache.INST = TruncationCache()
+        return TruncationCache.INST
+
+    def __len__(self) -> int:
+        """Return the number of cached texts."""
+        return len(self._texts)
+
+    @property
+    def size(self) -> int:
+        """Return the estimated size of the cached texts in bytes."""
+        return self._size
+
+    def clear(self) -> None:
+        """Remove all cached texts."""
+        self._texts.clear()
+        self._size = 0
+
+    def truncate(
+        self,
+        text: str,
+        width: int,
+        font_metrics: QFontMetrics,
+        font_key: str,
+    ) -> QStaticText:
+        """Return the text elided to the width with the given font."""
+        static_text = self._truncate(text, width, font_metrics, font_key)
+        self._evict()
+        return static_text
+
+    def truncate_many(
+        self,
+        texts: Iterable[str],
+        width: int,
+        font_metrics: QFontMetrics,
+        font_key: str,
+    ) -> list[QStaticText]:
+        """
+        Return the texts elided to the same width with the given font.
+
+        This is meant for views that elide the texts of all visible rows at
+        once. Evicting is done once after all texts are truncated.
+        """
+        static_texts = [
+            self._truncate(text, width, font_metrics, font_key)
+            for text in texts
+        ]
+        self._evict()
+        return static_texts
+
+    def _truncate(
+        self,
+        text: str,
+        width: int,
+        font_metrics: QFontMetrics,
+        font_key: str,
+    ) -> QStaticText:
+        """Return the elided text from the cache or create it."""
+        bucket = max(width, 0) // self._width_bucket
+        key = (text, bucket, font_key)
+        try:
+            static_text = self._texts[key][0]
+        except KeyError:
+            elided_text = font_metrics.elidedText(
+                text, Qt.TextElideMode.ElideRight, bucket * self._width_bucket
+            )
+            static_text = _static_text(elided_text)
+            size = (
+                self.ENTRY_BYTES
+                + self.CHAR_BYTES * len(elided_text)
+                + len(text)
+            )
+            self._texts[key] = static_text, size
+            self._size += size
+        else:
+            self._texts.move_to_end(key)
+        return static_text
+
+    def _evict(self) -> None:
+        """Remove the least recently used texts until the budget is met."""
+        while self._size > self._max_bytes and self._texts:
+            _, (_, size) = self._texts.popitem(last=False)
+            self._size -= size
+
+
+def _static_text(text: str) -> QStaticText:
+    """Return a QStaticText of the plain text with AggressiveCaching."""
+    static_text = QStaticText(text)
+    # Activate AggressiveCaching (better performance, more memory)
+    static_text.setTextFormat(Qt.TextFormat.PlainText)
+    static_text.setPerformanceHint(
+        QStaticText.PerformanceHint.AggressiveCaching
+    )
+    return static_text
 
 
 class TextTruncator:  # pylint: disable=too-few-public-methods
@@ -13,43 +150,63 @@ class TextTruncator:  # pylint: disable=too-few-public-methods
     TextTruncator is a widget that is able to truncate and store texts.
 
     The class is intended to be used as a mixin for classes that will need to
-    truncate their texts and store them as a QStaticText.
+    truncate their texts and store them as a QStaticText. The texts are
+    stored in the shared TruncationCache, unless a cache is given. Texts that
+    are truncated without a font are stored by text and width in a cache of
+    the instance.
     """
 
-    def __init__(self) -> None:
+    # Byte budget of the cache of texts truncated without a font.
+    METRICS_CACHE_BYTES: int = 4 * 1024 * 1024
+
+    def __init__(self, cache: TruncationCache | None = None) -> None:
         """Create a new TextTruncator."""
-        self._text_sizes: dict[str, dict[int, QStaticText]] = defaultdict(dict)
+        self._truncation_cache = (
+            TruncationCache.inst() if cache is None else cache
+        )
+        self._metrics_cache = TruncationCache(self.METRICS_CACHE_BYTES)
         self._font_metrics: QFontMetrics | None = None
 
+    def _cache_and_key(
+        self, font: QFont | None
+    ) -> tuple[TruncationCache, str]:
+        """Return the cache and the font key for texts in the given font."""
+        if font is None:
+            # The metrics don't identify the font, so the texts are only
+            # stored by text and width for this truncator.
+            return self._metrics_cache, ""
+        return self._truncation_cache, font.key()
+
     def truncate_text(
         self,
         text: str,
         width: int,
         font_metrics: QFontMetrics | None = None,
+        font: QFont | None = None,
     ) -> QStaticText:
         """
         Truncate a text so that if fits into the text_rect.
 
-        This function uses memoization based on the given text and width.
+        This function uses memoization based on the given text, width and
+        font. Without the font, the texts are memoized based on text and
+        width for this truncator, so its metrics must not change.
 
         If no font_metrics is given, one must be set with `font_metrics`
         """
-        try:
-            return self._text_sizes[text][width]
-        except KeyError:
-            if not font_metrics:
-                font_metrics = self._font_metrics
-            assert font_metrics
-            elided_text = font_metrics.elidedText(
-                text, Qt.TextElideMode.ElideRight, width
-            )
-            self._text_sizes[text][width] = QStaticText(elided_text)
+        font_metrics = font_metrics or self._font_metrics
+        assert font_metrics
+        cache, font_key = self._cache_and_key(font)
+        return cache.truncate(text, width, font_metrics, font_key)
 
-            # Activate AggressiveCaching (better performance, more memory)
-            self._text_sizes[text][width].setTextFormat(
-                Qt.TextFormat.PlainText
-            )
-            self._text_sizes[text][width].setPerformanceHint(
-                QStaticText.PerformanceHint.AggressiveCaching
-            )
-            return self._text_sizes[text][width]
+    def truncate_many(
+        self,
+        texts: Iterable[str],
+        width: int,
+        font_metrics: QFontMetrics | None = None,
+        font: QFont | None = None,
+    ) -> list[QStaticText]:
+        """Truncate all texts to the same width, see `truncate_text`."""
+        font_metrics = font_metrics or self._font_metrics
+        assert font_metrics
+        cache, font_key = self._cache_and_key(font)
+        return cache.truncate_many(texts, width, font_metrics, font_key)
@@ -26,6 +26,11 @@ class TitleBar(QFrame):
     maximize = Signal(name="maximize")
     move_window = Signal(QPoint, name="move")
 
+    # Let the window system move the window when the title is dragged
+    # (QWindow.startSystemMove). If the platform doesn't support it or the
+    # window is maximized, move_window is emitted for every mouse move.
+    SYSTEM_MOVE: bool = True
+
     def __init__(  # noqa: PLR0913
         self,
         parent: QWidget,
@@ -114,6 +119,9 @@ class TitleBar(QFrame):
         bg_layout.addWidget(close_button)
 
         self._double_click_in_progress = False
+        self._maximized = False
+        # The window system moves the window until the mouse is released.
+        self._system_move_in_progress = False
 
     @property
     def title_bar_text(self) -> str:
@@ -138,23 +146,52 @@ class TitleBar(QFrame):
         """
         if obj is not self._title_label and not self._icon:
             return False
+        if event.type() == QEvent.Type.MouseButtonPress:
+            self._system_move_in_progress = False
+            return False
         if event.type() == QEvent.Type.MouseButtonRelease:
             self._double_click_in_progress = False
+            self._system_move_in_progress = False
             return True
         if event.type() == QEvent.Type.MouseButtonDblClick:
             self._double_click_in_progress = True
             self.maximize.emit()
             return True
         if event.type() == QEvent.Type.MouseMove:
-            if not self._double_click_in_progress:
-                self.move_window.emit(
-                    cast(QMouseEvent, event).globalPosition().toPoint()
-                )
+            mouse_event = cast(QMouseEvent, event)
+            if not (
+                self._double_click_in_progress
+                or self._system_move_in_progress
+                or self._start_system_move(mouse_event)
+            ):
+                self.move_window.emit(mouse_event.globalPosition().toPoint())
             return True
         return False
 
+    def _start_system_move(self, event: QMouseEvent) -> bool:
+        """
+        Let the window system move the window, return if it does so.
+
+        A maximized window isn't moved by the window system, as it's restored
+        and centered under the cursor by the first move_window.
+        """
+        if (
+            not self.SYSTEM_MOVE
+            or self._maximized
+            or not event.buttons() & Qt.MouseButton.LeftButton
+        ):
+            return False
+        handle = self.window().windowHandle()
+        self._system_move_in_progress = (
+            handle is not None and handle.startSystemMove()
+        )
+        if self._system_move_in_progress:
+            log.debug("System move started")
+        return self._system_move_in_progress
+
     def set_maximized(self, maximized: bool) -> None:
         """Set the _background icon depending if the app is maximized."""
+        self._maximized = maximized
         name = "fullscreen_exit" if maximized else "fullscreen"
         self.maximize_button.set_icon(f":/svg_icons/{name}.svg")
         if maximized:
@@ -13,7 +13,7 @@ from PySide6.QtCore import (
     Qt,
     Slot,
 )
-from PySide6.QtGui import QFont, QFontMetrics, QPainter, QPaintEvent
+from PySide6.QtGui import QFont, QFontMetrics, QPaintEvent
 from PySide6.QtWidgets import (
     QCheckBox,
     QSizePolicy,
@@ -22,7 +22,9 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from qute_style.animation_policy import AnimationPolicyManager
 from qute_style.qute_style import QuteStyle, ToggleOptionButton
+from qute_style.render_quality import RenderQualityManager
 
 log = logging.getLogger(
     f"qute_style.{__name__}"
@@ -58,7 +60,6 @@ class Toggle(QCheckBox):
 
         self._animation = QPropertyAnimation(self, b"position")
         self._animation.setEasingCurve(QEasingCurve.Type.OutBounce)
-        self._animation.setDuration(QuteStyle.ToggleOptions.ANIM_DURATION)
         self.stateChanged.connect(self.setup_animation)
 
     def setTristate(self, on: bool = True) -> None:  # noqa: N802
@@ -104,6 +105,9 @@ class Toggle(QCheckBox):
             # Move the circle back to its initial position
             end = QuteStyle.ToggleOptions.CIRCLE_OFFSET
         self._animation.setEndValue(end)
+        AnimationPolicyManager.inst().configure(
+            self._animation, QuteStyle.ToggleOptions.ANIM_DURATION
+        )
         self._animation.start()
 
     def hitButton(self, pos: QPoint | QPoint) -> bool:  # noqa: N802
@@ -113,7 +117,7 @@ class Toggle(QCheckBox):
     def paintEvent(self, _: QPaintEvent) -> None:  # noqa: N802
         """Draw toggle switch."""
         painter = QStylePainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        RenderQualityManager.inst().set_antialiasing(painter)
 
         option = ToggleOptionButton()
         option.initFrom(self)
@@ -1,7 +1,10 @@
 """Custom Tooltip for a TitleButton."""
 
+from __future__ import annotations
+
 import logging
 
+from PySide6.QtCore import Qt
 from PySide6.QtGui import QColor
 from PySide6.QtWidgets import QGraphicsDropShadowEffect, QLabel, QWidget
 
@@ -9,13 +12,20 @@ log = logging.getLogger("qute_style._tooltip")  # pylint: disable=invalid-name
 
 
 class ToolTip(QLabel):
-    """Custom Tooltip for a TitleButton."""
+    """
+    Custom Tooltip for a TitleButton.
+
+    The buttons of an app parent share one ToolTip, see `shared`. The button
+    that shows it is its owner.
+    """
 
-    def __init__(self, parent: QWidget, tooltip: str) -> None:
+    def __init__(self, parent: QWidget, tooltip: str = "") -> None:
         """Create a new Tooltip."""
         super().__init__(text=tooltip, parent=parent)
         self.setObjectName("label_tooltip")
         self.setMinimumHeight(34)
+        # The widget that currently shows the tooltip.
+        self.owner: QWidget | None = None
 
         shadow = QGraphicsDropShadowEffect(self)
         shadow.setBlurRadius(30)
@@ -24,9 +34,29 @@ class ToolTip(QLabel):
         shadow.setColor(QColor(0, 0, 0, 80))
         self.setGraphicsEffect(shadow)
 
+    @classmethod
+    def find(cls, parent: QWidget) -> ToolTip | None:
+        """Return the shared ToolTip of the parent, None if there's none."""
+        return parent.findChild(
+            cls, "label_tooltip", Qt.FindChildOption.FindDirectChildrenOnly
+        )
+
+    @classmethod
+    def shared(cls, parent: QWidget) -> ToolTip:
+        """Return the shared ToolTip of the parent, create it if needed."""
+        tooltip = cls.find(parent)
+        if tooltip is None:
+            log.debug("Creating the shared tooltip of %s", parent)
+            tooltip = cls(parent)
+            tooltip.hide()
+        return tooltip
+
     def show(self) -> None:
         """Show the tooltip and adjust the size before."""
         # Adjust the size. This must be done after the stylesheet was set,
         # because the font settings will change the size needed.
         self.adjustSize()
+        # The tooltip is shared and may have been created before widgets
+        # that it has to cover.
+        self.raise_()
         super().show()
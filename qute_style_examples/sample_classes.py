@@ -19,9 +19,10 @@ class TestComboBox(CheckableComboBox[int]):
         self._default_text = "No selection."
 
         # Set the data for nine test items
-        for idx in range(1, 10):
-            text = f"New Item {idx}"
-            self.addItem(text, idx, ":/svg_icons/delete_forever.svg")
+        self.add_items(
+            ((f"New Item {idx}", idx) for idx in range(1, 10)),
+            ":/svg_icons/delete_forever.svg",
+        )
 
 
 class SelectAllTestComboBox(SelectAllComboBox[int]):
@@ -33,9 +34,10 @@ class SelectAllTestComboBox(SelectAllComboBox[int]):
         self._default_text = "No selection."
 
         # Set the data for nine test items
-        for idx in range(1, 10):
-            text = f"New Item {idx}"
-            self.addItem(text, idx, ":/svg_icons/delete_forever.svg")
+        self.add_items(
+            ((f"New Item {idx}", idx) for idx in range(1, 10)),
+            ":/svg_icons/delete_forever.svg",
+        )
 
         # initialize combobox content
         self.initialize_content()
@@ -21,6 +21,7 @@ from qute_style.widgets.color_manager import ColorManager
 from qute_style.widgets.home_page import HomePage
 from qute_style.widgets.icon_button import IconButton
 from qute_style_examples.sample_widgets import (
+    ItemViewBenchmarkWidget,
     ModelViewWidget,
     SpinnerWidget,
     TestWidget,
@@ -75,6 +76,7 @@ class StyledMainWindow(QuteStyleMainWindow):
         TestWidget,
         ModelViewWidget,
         SpinnerWidget,
+        ItemViewBenchmarkWidget,
     ]
     RIGHT_WIDGET_CLASSES = [ColorManager]
     LEFT_WIDGET_CLASSES = [SettingsWidget, InfoWidget]
@@ -6,13 +6,17 @@ from pathlib import Path
 from typing import Any, cast
 
 from PySide6.QtCore import (
+    QAbstractTableModel,
+    QElapsedTimer,
     QEvent,
     QFileInfo,
     QModelIndex,
     QObject,
+    QPersistentModelIndex,
     QSize,
     QStringListModel,
     Qt,
+    QTimer,
     Slot,
 )
 from PySide6.QtGui import QDragEnterEvent, QDropEvent, QIcon
@@ -21,11 +25,15 @@ from PySide6.QtWidgets import (
     QDialogButtonBox,
     QFileIconProvider,
     QHBoxLayout,
+    QHeaderView,
     QLabel,
     QListView,
     QMenu,
+    QPushButton,
     QSizePolicy,
     QSpacerItem,
+    QStyledItemDelegate,
+    QTableView,
     QTreeWidgetItem,
     QVBoxLayout,
     QWidget,
@@ -37,6 +45,7 @@ from qute_style.helper import create_tooltip, create_waiting_spinner
 from qute_style.widgets.base_widgets import MainWidget
 from qute_style.widgets.custom_icon_engine import CustomIconEngine
 from qute_style.widgets.drop_label import DropLabel
+from qute_style.widgets.item_delegate import ThemedItemDelegate
 
 
 class TestWidget(MainWidget):
@@ -267,3 +276,151 @@ class SpinnerWidget(MainWidget):
         layout.addWidget(self._view)
         self._spinner = create_waiting_spinner(self)
         self._spinner.start()
+
+
+class LargeModel(QAbstractTableModel):
+    """Table model that generates the data of a million rows on demand."""
+
+    ROWS = 1_000_000
+    COLUMNS = 4
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        """Create a new LargeModel."""
+        super().__init__(parent)
+        # Only changed check states are stored, the rest is generated.
+        self._check_states: dict[int, Qt.CheckState] = {}
+
+    def rowCount(  # noqa: N802
+        self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()
+    ) -> int:
+        """Return the number of rows."""
+        return 0 if parent.isValid() else self.ROWS
+
+    def columnCount(  # noqa: N802
+        self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()
+    ) -> int:
+        """Return the number of columns."""
+        return 0 if parent.isValid() else self.COLUMNS
+
+    def data(
+        self,
+        index: QModelIndex | QPersistentModelIndex,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        """Return data for the given role and index."""
+        row = index.row()
+        if role == Qt.ItemDataRole.DisplayRole:
+            if index.column() == 0:
+                return f"Measurement {row}"
+            return f"{(row * 7919 + index.column()) % 10007 / 100:.2f} V"
+        if role == Qt.ItemDataRole.CheckStateRole and index.column() == 0:
+            return self._check_states.get(
+                row,
+                Qt.CheckState.Checked if row % 3 else Qt.CheckState.Unchecked,
+            )
+        return None
+
+    def setData(  # noqa: N802
+        self,
+        index: QModelIndex | QPersistentModelIndex,
+        value: Any,
+        role: int = Qt.ItemDataRole.EditRole,
+    ) -> bool:
+        """Set the check state of the first column."""
+        if role != Qt.ItemDataRole.CheckStateRole or index.column() != 0:
+            return False
+        self._check_states[index.row()] = Qt.CheckState(value)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+        return True
+
+    def flags(self, index: QModelIndex | QPersistentModelIndex) -> Qt.ItemFlag:
+        """Return the flags for the given index."""
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if index.column() == 0:
+            flags |= Qt.ItemFlag.ItemIsUserCheckable
+        return flags
+
+
+class ItemViewBenchmarkWidget(MainWidget):
+    """Widget that measures the scroll performance of a 1M row table."""
+
+    ICON = ":/svg_icons/heart_broken.svg"
+    NAME = "Benchmark-Widget"
+
+    # Number of pages scrolled per benchmark run.
+    PAGES = 200
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        """Create a new ItemViewBenchmarkWidget."""
+        super().__init__(parent)
+        layout = QVBoxLayout(self)
+        self._view = QTableView(self)
+        self._view.setModel(LargeModel(self._view))
+        self._delegate = ThemedItemDelegate(
+            self._view, uniform_row_heights=True
+        )
+        self._default_delegate = QStyledItemDelegate(self._view)
+        # Rows of a large table must not be measured one by one.
+        self._view.verticalHeader().setSectionResizeMode(
+            QHeaderView.ResizeMode.Fixed
+        )
+        self._themed_checkbox = QCheckBox(self.tr("Themed item delegate"))
+        self._themed_checkbox.toggled.connect(self.on_delegate_toggled)
+        self._themed_checkbox.setChecked(True)
+        self._start_button = QPushButton(self.tr("Scroll"))
+        self._start_button.clicked.connect(self.on_start)
+        self._result_label = QLabel()
+
+        control_layout = QHBoxLayout()
+        control_layout.addWidget(self._themed_checkbox)
+        control_layout.addWidget(self._start_button)
+        control_layout.addWidget(self._result_label, 1)
+        layout.addLayout(control_layout)
+        layout.addWidget(self._view)
+
+        self._page = 0
+        self._rows = 0
+        self._elapsed = QElapsedTimer()
+        self._timer = QTimer(self)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self.on_scroll_page)
+
+    @Slot(bool, name="on_delegate_toggled")
+    def on_delegate_toggled(self, checked: bool) -> None:
+        """Switch between the themed and the default item delegate."""
+        self._view.setItemDelegate(
+            self._delegate if checked else self._default_delegate
+        )
+
+    @Slot(name="on_start")
+    def on_start(self) -> None:
+        """Start scrolling through the table."""
+        self._start_button.setEnabled(False)
+        self._page = 0
+        self._rows = 0
+        self._elapsed.start()
+        self._timer.start()
+
+    @Slot(name="on_scroll_page")
+    def on_scroll_page(self) -> None:
+        """Scroll one page down and paint it immediately."""
+        scroll_bar = self._view.verticalScrollBar()
+        # Jump across the whole table so that no page is painted twice.
+        scroll_bar.setValue(
+            self._page * scroll_bar.maximum() // (self.PAGES - 1)
+        )
+        self._view.viewport().repaint()
+        self._rows += self._view.rowAt(
+            self._view.viewport().height() - 1
+        ) - self._view.rowAt(0)
+        self._page += 1
+        if self._page < self.PAGES:
+            return
+        self._timer.stop()
+        seconds = self._elapsed.elapsed() / 1000
+        self._result_label.setText(
+            self.tr("{} rows painted per second").format(
+                round(self._rows / seconds)
+            )
+        )
+        self._start_button.setEnabled(True)
@@ -20,10 +20,12 @@ from PySide6.QtWidgets import QStyle, QStyleOptionButton, QStyleOptionViewItem
 # ensure that the resources are loaded
 import qute_style.resources_rc  # pylint: disable=unused-import  # noqa: F401
 from qute_style import style
+from qute_style.animation_policy import AnimationPolicy, AnimationPolicyManager
 from qute_style.dev.mocks import check_call
 from qute_style.qs_application import QuteStyleApplication
 from qute_style.qs_main_window import AppData
 from qute_style.qute_style import QuteStyle, ToggleOptionButton
+from qute_style.render_quality import RenderQuality, RenderQualityManager
 from tests.test_qs_main_window import EmptyWindowStyled
 
 log = logging.getLogger(f"tests.{__name__}")  # pylint: disable=invalid-name
@@ -42,6 +44,12 @@ def pytest_runtest_teardown(item: Function) -> None:
     # Remove the settings stored with QSettings in the registry.
     QSettings().clear()
 
+    # Reset the animation policy and render quality in case a test changed
+    # them.
+    AnimationPolicyManager.inst().policy = AnimationPolicy.FULL
+    AnimationPolicyManager.inst().automatic = False
+    RenderQualityManager.inst().quality = RenderQuality.HIGH
+
     if "style" in [mark.name for mark in item.iter_markers()]:
         # Reset the stored style after a style test case.
         style.CURRENT_STYLE = "Darcula"
@@ -52,6 +60,9 @@ class QuteStyleTestApplication(QuteStyleApplication):
 
     MAIN_WINDOW_CLASS = EmptyWindowStyled
 
+    # Slow test machines must not switch off the animations of later tests.
+    AUTOMATIC_ANIMATION_POLICY = False
+
     APP_DATA = AppData(
         "Test-App",
         "2.3.4",
@@ -0,0 +1,143 @@
+"""Tests for the AnimationPolicyManager."""
+
+# pylint: disable=protected-access
+import pytest
+from PySide6.QtCore import QPropertyAnimation
+from PySide6.QtWidgets import QWidget
+from pytestqt.qtbot import QtBot
+
+from qute_style.animation_policy import (
+    AnimationPolicy,
+    AnimationPolicyManager,
+    _FrameMonitor,
+)
+from qute_style.dev.mocks import check_call
+from qute_style.qs_application import QuteStyleApplication
+
+
+@pytest.mark.parametrize(
+    "policy, duration, interval",
+    (
+        (AnimationPolicy.FULL, 500, 20),
+        (AnimationPolicy.REDUCED, 200, 40),
+        (AnimationPolicy.OFF, 0, 20),
+    ),
+)
+def test_duration(
+    policy: AnimationPolicy, duration: int, interval: int
+) -> None:
+    """Test the durations and intervals of animations per policy."""
+    manager = AnimationPolicyManager.inst()
+    manager.policy = policy
+    assert manager.duration(500) == duration
+    assert manager.interval(20) == interval
+
+
+def test_configure(qtbot: QtBot) -> None:
+    """Test that an animation gets its duration and a single monitor."""
+    widget = QWidget()
+    qtbot.addWidget(widget)
+    animation = QPropertyAnimation(widget, b"minimumWidth")
+    manager = AnimationPolicyManager.inst()
+    manager.configure(animation, 500)
+    assert animation.duration() == 500
+
+    with qtbot.waitSignal(manager.policy_changed):
+        manager.policy = AnimationPolicy.REDUCED
+    manager.configure(animation, 500)
+    assert animation.duration() == 200
+    assert len(animation.findChildren(_FrameMonitor)) == 1
+
+
+def test_frame_monitor(qtbot: QtBot) -> None:
+    """Test that the frame times of a configured animation are reported."""
+    widget = QWidget()
+    qtbot.addWidget(widget)
+    animation = QPropertyAnimation(widget, b"minimumWidth")
+    animation.setStartValue(0)
+    animation.setEndValue(100)
+    AnimationPolicyManager.inst().configure(animation, 100)
+    with (
+        check_call(
+            AnimationPolicyManager, "report_frame_times", call_count=1
+        ) as calls,
+        qtbot.waitSignal(animation.finished),
+    ):
+        animation.start()
+    assert all(frame_time > 0 for frame_time in calls[0][0][1])
+
+
+def test_report_frame_times() -> None:
+    """Test that slow frames reduce the policy if it's automatic."""
+    manager = AnimationPolicyManager.inst()
+    slow = [manager.FRAME_BUDGET + 10] * manager.MIN_FRAMES
+    manager.report_frame_times(slow)
+    assert manager.policy == AnimationPolicy.FULL
+
+    manager.automatic = True
+    manager.report_frame_times([10.0] * manager.MIN_FRAMES)
+    manager.report_frame_times(slow[1:])
+    assert manager.policy == AnimationPolicy.FULL
+    manager.report_frame_times(slow)
+    assert manager.policy == AnimationPolicy.REDUCED
+    manager.report_frame_times(slow)
+    assert manager.policy == AnimationPolicy.OFF
+    manager.report_frame_times(slow)
+    assert manager.policy == AnimationPolicy.OFF
+
+
+def test_application_policy(qapp: QuteStyleApplication) -> None:
+    """Test that the application sets the policy of the manager."""
+    assert qapp.animation_policy == AnimationPolicy.FULL
+    qapp.animation_policy = AnimationPolicy.OFF
+    assert AnimationPolicyManager.inst().policy == AnimationPolicy.OFF
+
+
+def test_recover_policy() -> None:
+    """Test that an automatically reduced policy is raised again."""
+    manager = AnimationPolicyManager.inst()
+    manager.automatic = True
+    slow = [manager.FRAME_BUDGET + 10] * manager.MIN_FRAMES
+    fast = [manager.RECOVERY_BUDGET] * manager.MIN_FRAMES
+    manager.report_frame_times(slow)
+    assert manager.policy == AnimationPolicy.REDUCED
+    for _ in range(manager.RECOVERY_ANIMATIONS - 1):
+        manager.report_frame_times(fast)
+    # Frame times between both budgets interrupt the recovery.
+    manager.report_frame_times([manager.FRAME_BUDGET] * manager.MIN_FRAMES)
+    for _ in range(manager.RECOVERY_ANIMATIONS - 1):
+        manager.report_frame_times(fast)
+    assert manager.policy == AnimationPolicy.REDUCED
+    manager.report_frame_times(fast)
+    assert manager.policy == AnimationPolicy.FULL
+    # The policy isn't raised above the one that was set.
+    for _ in range(manager.RECOVERY_ANIMATIONS):
+        manager.report_frame_times(fast)
+    assert manager.policy == AnimationPolicy.FULL
+
+    manager.policy = AnimationPolicy.REDUCED
+    for _ in range(manager.RECOVERY_ANIMATIONS):
+        manager.report_frame_times(fast)
+    assert manager.policy == AnimationPolicy.REDUCED
+
+
+def test_recover_from_off(
+    qtbot: QtBot, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that animations are tried again after the RECOVERY_INTERVAL."""
+    widget = QWidget()
+    qtbot.addWidget(widget)
+    animation = QPropertyAnimation(widget, b"minimumWidth")
+    manager = AnimationPolicyManager.inst()
+    manager.automatic = True
+    slow = [manager.FRAME_BUDGET + 10] * manager.MIN_FRAMES
+    manager.report_frame_times(slow)
+    manager.report_frame_times(slow)
+    assert manager.policy == AnimationPolicy.OFF
+    manager.configure(animation, 500)
+    assert animation.duration() == 0
+
+    monkeypatch.setattr(manager, "RECOVERY_INTERVAL", 0)
+    manager.configure(animation, 500)
+    assert manager.policy == AnimationPolicy.REDUCED
+    assert animation.duration() == 200
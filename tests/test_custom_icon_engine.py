@@ -1,8 +1,9 @@
 """Tests for CustomIconEngine and PixmapStore."""
 
+import pytest
 from _pytest.monkeypatch import MonkeyPatch
-from PySide6.QtCore import QRect, QSize
-from PySide6.QtGui import QColor, QIcon, QPainter, QPixmap
+from PySide6.QtCore import QRect, QSize, Qt
+from PySide6.QtGui import QColor, QIcon, QImage, QPainter, QPixmap
 from pytestqt.qtbot import QtBot
 
 from qute_style.qs_main_window import AppData, CustomMainWindow
@@ -73,3 +74,45 @@ def test_custom_icon_engine_paint(
 
     monkeypatch.setattr(QPainter, "drawPixmap", mock_draw)
     engine.paint(painter, rect, _=QIcon.Mode.Normal, __=QIcon.State.Off)
+
+
+@pytest.mark.parametrize("scale", (1.0, 2.0))
+def test_draw_rounded_rect(  # pylint: disable=unused-argument
+    qtbot: QtBot, scale: float
+) -> None:
+    """Test that the sprite looks the same as a drawn rounded rect."""
+    images = []
+    rect = QRect(4, 5, 100, 40)
+    for use_store in (False, True):
+        image = QImage(
+            int(110 * scale), int(50 * scale), QImage.Format.Format_ARGB32
+        )
+        image.setDevicePixelRatio(scale)
+        image.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(image)
+        if use_store:
+            PixmapStore.inst().draw_rounded_rect(painter, rect, 8, "#ff0000")
+        else:
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor("#ff0000"))
+            painter.drawRoundedRect(rect, 8, 8)
+        painter.end()
+        images.append(image)
+    assert images[0] == images[1]
+
+
+def test_get_rounded_rect(  # pylint: disable=unused-argument
+    qtbot: QtBot, monkeypatch: MonkeyPatch
+) -> None:
+    """Test that the rounded rects are stored and the store is limited."""
+    store = PixmapStore.inst()
+    store._rounded_rects.clear()  # pylint: disable=protected-access
+    monkeypatch.setattr(PixmapStore, "MAX_ROUNDED_RECTS", 2)
+    pixmap = store.get_rounded_rect(20, 10, 3, "#ff0000", 2.0)
+    assert pixmap.size() == QSize(40, 20)
+    assert pixmap.devicePixelRatio() == 2.0
+    assert store.get_rounded_rect(20, 10, 3, "#ff0000", 2.0) is pixmap
+    store.get_rounded_rect(20, 10, 3, "#00ff00", 2.0)
+    store.get_rounded_rect(20, 10, 3, "#0000ff", 2.0)
+    assert len(store._rounded_rects) == 1  # pylint: disable=protected-access
@@ -0,0 +1,41 @@
+"""Tests for the FrameThrottle."""
+
+# pylint: disable=protected-access
+from PySide6.QtWidgets import QWidget
+from pytestqt.qtbot import QtBot
+
+from qute_style.frame_throttle import FrameThrottle
+
+
+def test_frame_throttle(qtbot: QtBot) -> None:
+    """Test that only the latest value is applied once per frame."""
+    widget = QWidget()
+    qtbot.addWidget(widget)
+    applied: list[int] = []
+    throttle: FrameThrottle[int] = FrameThrottle(widget, applied.append)
+    assert throttle.pending is None
+
+    # The first value is applied at once.
+    throttle.request(1)
+    assert applied == [1]
+    assert throttle.pending is None
+
+    # The following ones wait for the next frame.
+    throttle.request(2)
+    throttle.request(3)
+    assert applied == [1]
+    assert throttle.pending == 3
+    qtbot.waitUntil(lambda: applied == [1, 3], timeout=1000)
+    assert throttle.pending is None
+
+    # After a reset, the next value is applied at once again.
+    throttle.reset()
+    throttle.request(4)
+    assert applied == [1, 3, 4]
+
+    throttle.request(5)
+    throttle.flush()
+    assert applied == [1, 3, 4, 5]
+    assert not throttle._timer.isActive()
+    throttle.flush()
+    assert applied == [1, 3, 4, 5]
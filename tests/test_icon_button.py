@@ -3,12 +3,27 @@
 # pylint: disable=protected-access
 
 from _pytest.monkeypatch import MonkeyPatch
-from PySide6.QtGui import QColor, QPaintDevice, QPainter, QPixmap
+from PySide6.QtCore import QEvent, QPointF, QRect, QSize, Qt
+from PySide6.QtGui import (
+    QColor,
+    QEnterEvent,
+    QPaintDevice,
+    QPainter,
+    QPixmap,
+    QRegion,
+    QStaticText,
+)
+from PySide6.QtWidgets import QWidget
 from pytestqt.qtbot import QtBot
 
+from qute_style.dev.mocks import check_call
 from qute_style.style import get_color
 from qute_style.widgets.custom_icon_engine import PixmapStore
 from qute_style.widgets.icon_button import IconButton
+from qute_style.widgets.left_menu_button import LeftMenuButton
+from qute_style.widgets.text_truncator import TextTruncator
+from qute_style.widgets.title_button import TitleButton
+from qute_style.widgets.tooltip import ToolTip
 
 
 # qtbot is necessary for QPixmap
@@ -45,3 +60,140 @@ def test_icon_button_paint(  # pylint: disable=unused-argument
 
     icon_button._icon_paint(paint, QColor(get_color("foreground")))
     paint.end()
+
+
+def test_icon_button_no_hover(qtbot: QtBot) -> None:
+    """Test that the style sheet doesn't enable hover tracking."""
+    widget = QWidget()
+    qtbot.addWidget(widget)
+    widget.setStyleSheet("QPushButton:hover { color: red; }")
+    icon_button = IconButton(widget)
+    widget.show()
+    assert not icon_button.testAttribute(Qt.WidgetAttribute.WA_Hover)
+
+    widget.setStyleSheet("QPushButton:hover { color: blue; }")
+    assert not icon_button.testAttribute(Qt.WidgetAttribute.WA_Hover)
+
+
+def test_icon_button_hover_update(qtbot: QtBot) -> None:
+    """Test that hovering repaints only if the colors change."""
+    icon_button = IconButton()
+    qtbot.addWidget(icon_button)
+    with check_call(IconButton, "update") as calls:
+        icon_button.enterEvent(QEvent(QEvent.Type.Enter))
+    assert calls[0][0][1] == QRegion(icon_button.rect())
+    with check_call(IconButton, "update", call_count=0):
+        icon_button.enterEvent(QEvent(QEvent.Type.Enter))
+
+
+def test_icon_button_color_region(qtbot: QtBot) -> None:
+    """Test that only the icon is repainted if the background is the same."""
+    icon_button = IconButton(text="Text")
+    qtbot.addWidget(icon_button)
+    icon_rect = QRect(0, 0, IconButton.FIXED_HEIGHT, IconButton.FIXED_HEIGHT)
+    assert icon_button._color_region(False, True, False) == QRegion(icon_rect)
+    assert icon_button._color_region(False, True, True) == QRegion(
+        icon_rect
+    ) + QRegion(icon_button._text_rect())
+    assert icon_button._color_region(False, False, False).isEmpty()
+
+
+def test_icon_button_background(qtbot: QtBot) -> None:
+    """Test that the background is drawn from the PixmapStore's sprites."""
+    icon_button = IconButton()
+    qtbot.addWidget(icon_button)
+    with check_call(PixmapStore, "draw_rounded_rect", call_count=0):
+        icon_button.grab()
+    icon_button.enterEvent(QEvent(QEvent.Type.Enter))
+    with check_call(PixmapStore, "draw_rounded_rect") as calls:
+        icon_button.grab()
+    assert calls[0][0][2:] == (
+        icon_button.rect(),
+        IconButton.RADIUS,
+        get_color("bg_elements"),
+    )
+
+
+def test_left_menu_button_active_menu(qtbot: QtBot) -> None:
+    """Test that active LeftMenuButtons share the tinted active menu."""
+    widget = QWidget()
+    qtbot.addWidget(widget)
+    buttons = []
+    for text in ("First", "Second"):
+        button = LeftMenuButton(
+            widget, text, text, ":/svg_icons/home.svg", None
+        )
+        button.set_active(True)
+        buttons.append(button)
+    store = PixmapStore.inst()
+    store._scaled_pixmaps.clear()
+    for button in buttons:
+        button.grab()
+    # Both buttons use the same pixmap, tinted once.
+    assert list(store._scaled_pixmaps) == [
+        (LeftMenuButton.ACTIVE_MENU_ICON, 5, 50, get_color("bg_one"), 1.0)
+    ]
+    assert buttons[0].active_menu is buttons[1].active_menu
+
+
+def test_active_menu_scaled() -> None:
+    """Test that the active menu is rendered at its size in device pixels."""
+    pixmap = PixmapStore.inst().get_scaled_pixmap(
+        LeftMenuButton.ACTIVE_MENU_ICON, 5, 50, get_color("bg_one"), 2.0
+    )
+    assert pixmap.size() == QSize(10, 100)
+    assert pixmap.devicePixelRatio() == 2.0
+
+
+def test_icon_button_label(qtbot: QtBot) -> None:
+    """Test that the label is elided and only created again on changes."""
+    icon_button = IconButton(text="A text that is too long for the button")
+    qtbot.addWidget(icon_button)
+    icon_button.setFixedWidth(100)
+    icon_button.grab()
+    assert icon_button._label.text().endswith("…")
+    with check_call(TextTruncator, "truncate_text", call_count=0):
+        icon_button.grab()
+    font = icon_button.font()
+    font.setPointSize(font.pointSize() + 2)
+    icon_button.setFont(font)
+    with check_call(
+        TextTruncator,
+        "truncate_text",
+        return_value=lambda _, text, *__: QStaticText(text),
+    ):
+        icon_button.grab()
+
+
+def test_shared_tooltip(qtbot: QtBot) -> None:
+    """Test that the buttons of an app parent share one lazy ToolTip."""
+    widget = QWidget()
+    qtbot.addWidget(widget)
+    first = TitleButton(widget, "First", ":/svg_icons/home.svg", widget)
+    second = TitleButton(widget, "Second", ":/svg_icons/home.svg", widget)
+    widget.show()
+    assert ToolTip.find(widget) is None
+
+    first.enterEvent(QEnterEvent(QPointF(), QPointF(), QPointF()))
+    tooltip = ToolTip.find(widget)
+    assert tooltip is not None
+    assert tooltip.isVisible()
+    assert tooltip.owner is first
+    assert tooltip.text() == "First"
+
+    # The text of the shown tooltip changes, other buttons keep theirs.
+    first.tooltip_text = "Changed"
+    second.tooltip_text = "Other"
+    assert tooltip.text() == "Changed"
+
+    second.enterEvent(QEnterEvent(QPointF(), QPointF(), QPointF()))
+    assert ToolTip.shared(widget) is tooltip
+    assert tooltip.owner is second
+    assert tooltip.text() == "Other"
+    # Leaving a button that doesn't own the tooltip doesn't hide it.
+    first.leaveEvent(QEvent(QEvent.Type.Leave))
+    assert tooltip.isVisible()
+    second.leaveEvent(QEvent(QEvent.Type.Leave))
+    assert not tooltip.isVisible()
+    assert tooltip.owner is None
+    assert len(widget.findChildren(ToolTip)) == 1
@@ -0,0 +1,114 @@
+"""Tests for the paint diagnostics."""
+
+from PySide6.QtCore import QRect
+from PySide6.QtGui import QImage
+from PySide6.QtWidgets import QLabel, QWidget
+from pytestqt.qtbot import QtBot
+
+from qute_style.dev.paint_diagnostics import (
+    PaintRecorder,
+    heatmap_color_table,
+    is_opaque,
+    show_paint_heatmap,
+)
+
+
+def create_window(qtbot: QtBot) -> tuple[QWidget, QWidget, QLabel]:
+    """Create a window with an opaque and a transparent child."""
+    window = QWidget()
+    qtbot.addWidget(window)
+    window.setFixedSize(200, 100)
+    opaque = QWidget(window)
+    opaque.setObjectName("opaque")
+    opaque.setStyleSheet("background-color: red;")
+    opaque.setGeometry(0, 0, 100, 100)
+    label = QLabel("Text", window)
+    label.setGeometry(100, 0, 100, 100)
+    window.show()
+    qtbot.waitExposed(window)
+    return window, opaque, label
+
+
+def test_record_paint_events(qtbot: QtBot) -> None:
+    """Test that the regions of paint events are recorded per widget."""
+    window, opaque, label = create_window(qtbot)
+    with PaintRecorder(window) as recorder:
+        opaque.grab(QRect(0, 0, 10, 10))
+        label.grab()
+    stats = {stat.widget: stat for stat in recorder.widget_stats()}
+    assert stats[opaque].paints == 1
+    assert stats[opaque].full_rect_paints == 0
+    assert stats[opaque].painted_pixels == 100
+    assert stats[label].full_rect_ratio == 1
+    assert stats[opaque].name == "QWidget#opaque"
+
+
+def test_prune_while_recording(qtbot: QtBot) -> None:
+    """Test that old records are removed while recording, not only on read."""
+    window, opaque, _ = create_window(qtbot)
+    with PaintRecorder(window, time_window=20) as recorder:
+        opaque.grab(QRect(0, 0, 10, 10))
+        qtbot.wait(50)
+        opaque.grab(QRect(0, 0, 10, 10))
+        # pylint: disable-next=protected-access
+        assert len(recorder._records) == 1
+
+
+def test_heatmap(qtbot: QtBot) -> None:
+    """Test that the heatmap counts how often each pixel was painted."""
+    window, opaque, _ = create_window(qtbot)
+    with PaintRecorder(window) as recorder:
+        for _ in range(3):
+            opaque.grab(QRect(0, 0, 10, 10))
+    counts = recorder.paint_counts()
+    assert counts.pixelColor(5, 5).alpha() == 3
+    assert counts.pixelColor(50, 50).alpha() == 0
+    heatmap = recorder.heatmap()
+    assert heatmap.format() == QImage.Format.Format_Indexed8
+    assert heatmap.pixelColor(50, 50).alpha() == 0
+    assert heatmap.pixelColor(5, 5).alpha() > 0
+
+
+def test_heatmap_color_table() -> None:
+    """Test that the color table goes from transparent to red."""
+    table = heatmap_color_table(10)
+    assert len(table) == 256
+    assert table[0] == 0
+    assert table[10] == table[255]
+    assert table[10] != table[1]
+
+
+def test_opaque_candidates(qtbot: QtBot) -> None:
+    """Test that opaque widgets are found."""
+    window, opaque, label = create_window(qtbot)
+    assert is_opaque(opaque)
+    assert not is_opaque(label)
+    with PaintRecorder(window) as recorder:
+        opaque.grab()
+        label.grab()
+    assert [stat.widget for stat in recorder.opaque_candidates()] == [opaque]
+
+
+def test_full_rect_repainters(qtbot: QtBot) -> None:
+    """Test that widgets repainting their full rect are found."""
+    window, opaque, label = create_window(qtbot)
+    with PaintRecorder(window) as recorder:
+        for _ in range(5):
+            opaque.grab(QRect(0, 0, 10, 10))
+            label.grab()
+    assert [stat.widget for stat in recorder.full_rect_repainters()] == [label]
+    assert "QLabel (5 paints)" in recorder.report()
+
+
+def test_paint_heatmap_overlay(qtbot: QtBot) -> None:
+    """Test that the overlay records the window but not itself."""
+    window, opaque, _ = create_window(qtbot)
+    overlay = show_paint_heatmap(window)
+    assert overlay.isVisible()
+    assert overlay.geometry() == window.geometry()
+    opaque.grab()
+    overlay.grab()
+    overlay.refresh()
+    assert {record.widget for record in overlay.recorder.records} == {opaque}
+    overlay.stop()
+    assert not overlay.isVisible()
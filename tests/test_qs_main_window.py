@@ -7,16 +7,18 @@ from typing import cast
 
 import pytest
 from PySide6 import QtWidgets
-from PySide6.QtCore import QEvent, QLocale, QPointF, Qt
+from PySide6.QtCore import QEvent, QLocale, QPoint, QPointF, Qt
 from PySide6.QtGui import QMouseEvent
 from PySide6.QtWidgets import QApplication
 from pytestqt.qtbot import QtBot
 
+from qute_style.animation_policy import AnimationPolicy, AnimationPolicyManager
 from qute_style.dev.mocks import check_call
 from qute_style.qs_main_window import AppData, QuteStyleMainWindow
 from qute_style.widgets.base_widgets import BaseWidget, MainWidget
 from qute_style.widgets.left_column import LeftColumn
 from qute_style.widgets.left_menu_button import LeftMenuButton
+from qute_style.widgets.snapshot_slide import SnapshotSlide
 from qute_style.widgets.title_button import TitleButton
 
 log = logging.getLogger(f"tests.{__name__}")  # pylint: disable=invalid-name
@@ -100,6 +102,12 @@ class StyledMainWindow(QuteStyleMainWindow):
     LEFT_WIDGET_CLASSES = [UpperLeftColumn, LowerLeftColumn]
 
 
+class SnapshotMainWindow(StyledMainWindow):
+    """StyledMainWindow with snapshot animations."""
+
+    SNAPSHOT_ANIMATIONS = True
+
+
 class ColumnVisibleWindowStyled(QuteStyleMainWindow):
     """QuteStyleMainWindow with visible and invisible columns."""
 
@@ -248,6 +256,81 @@ def test_switch_left_column(qtbot: QtBot) -> None:
     assert window._left_column._title_label.text() == UpperLeftColumn.NAME
 
 
+def visible_slides(window: QuteStyleMainWindow) -> list[SnapshotSlide]:
+    """Return the SnapshotSlides that are currently shown in the window."""
+    return [
+        slide
+        for slide in window.findChildren(SnapshotSlide)
+        if slide.isVisible()
+    ]
+
+
+def test_snapshot_animation(qtbot: QtBot) -> None:
+    """Test sliding the columns with snapshots."""
+    window = create_new_main_window(qtbot, SnapshotMainWindow)
+
+    # The frame is resized at once and only the snapshot is animated.
+    with qtbot.waitSignal(window._group.finished):
+        window.on_left_column(UpperLeftColumn)
+        assert window._left_column_frame.width() == COL_W
+        assert window._check_is_opening(window._left_column_frame) is True
+        assert window._group.animationCount() == 1
+        assert [slide.frame for slide in visible_slides(window)] == [
+            window._left_column_frame
+        ]
+    assert not visible_slides(window)
+
+    # Both columns are sliding, so that the live frames are animated.
+    with qtbot.waitSignal(window._group.finished):
+        window.on_right_column(RightColumn)
+        assert window._group.animationCount() == 2
+        assert window._check_is_opening(window._left_column_frame) is False
+        assert not visible_slides(window)
+    assert window._left_column_frame.width() == 0
+    assert window._right_column_frame.width() == COL_W
+
+    with qtbot.waitSignal(window._group.finished):
+        window.on_right_column(RightColumn)
+        assert window._right_column_frame.width() == 0
+        assert window._check_is_opening(window._right_column_frame) is False
+        assert len(visible_slides(window)) == 1
+    assert not visible_slides(window)
+
+
+@pytest.mark.parametrize("window_type", (StyledMainWindow, SnapshotMainWindow))
+def test_animations_off(
+    qtbot: QtBot, window_type: type[QuteStyleMainWindow]
+) -> None:
+    """Test that columns and the LeftMenu jump to their end state."""
+    window = create_new_main_window(qtbot, window_type)
+    AnimationPolicyManager.inst().policy = AnimationPolicy.OFF
+    with qtbot.waitSignal(window._group.finished):
+        window.on_left_column(UpperLeftColumn)
+    assert window._left_column_frame.minimumWidth() == COL_W
+    window._left_menu.toggle_animation()
+    assert window._left_menu.parent().minimumWidth() == 240
+    assert not visible_slides(window)
+
+
+def test_snapshot_left_menu(qtbot: QtBot) -> None:
+    """Test sliding the LeftMenu with snapshots."""
+    window = create_new_main_window(qtbot, SnapshotMainWindow)
+    frame = window._left_menu.parent()
+    width = frame.width()
+    assert window._left_menu.snapshot_animation
+
+    window._left_menu.toggle_animation()
+    assert frame.width() == 240
+    (slide,) = visible_slides(window)
+    assert slide.frame is frame
+    with qtbot.waitSignal(slide.animation.finished):
+        pass
+    assert not visible_slides(window)
+
+    window._left_menu.toggle_animation()
+    assert frame.width() == width
+
+
 @pytest.mark.parametrize(
     "window_type", (StyledMainWindow, RightColumnEmptyWindowStyled)
 )
@@ -422,6 +505,27 @@ def test_maximize_event_handling(qtbot: QtBot) -> None:
         assert signal.signal_triggered
 
 
+def test_move_window(qtbot: QtBot) -> None:
+    """Test that moving the window is coalesced to the frame rate."""
+    window = create_new_main_window(qtbot, StyledMainWindow)
+    window.showNormal()
+    qtbot.waitExposed(window)
+    start = window.pos()
+    moves = []
+    window._move_throttle._apply = lambda pos: (
+        moves.append(pos),
+        window.move(pos),
+    )
+    window.last_move_pos = QPoint(100, 100)
+    window._move_throttle.reset()
+    for offset in range(1, 11):
+        window.move_window(QPoint(100 + offset, 100 + offset))
+    # The first move is applied at once, the last one on the next frame.
+    assert moves == [start + QPoint(1, 1)]
+    qtbot.waitUntil(lambda: len(moves) == 2, timeout=1000)
+    assert moves[-1] == start + QPoint(10, 10)
+
+
 @pytest.mark.parametrize("visible", [True, False])
 def test_on_main_widget_settings(qtbot: QtBot, visible: bool) -> None:
     """Test that settings are display when user clicked on main widget."""
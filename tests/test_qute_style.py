@@ -12,12 +12,17 @@ from _pytest.fixtures import SubRequest
 from PySide6.QtCore import QRect, Qt
 from PySide6.QtGui import QBrush, QImage, QPainter, QPalette, QPen
 from PySide6.QtWidgets import (
+    QApplication,
     QCheckBox,
+    QDial,
+    QProgressBar,
     QProxyStyle,
     QStyle,
     QStyleOption,
     QStyleOptionButton,
+    QStyleOptionComboBox,
     QStyleOptionViewItem,
+    QVBoxLayout,
     QWidget,
 )
 from pytestqt.qtbot import QtBot
@@ -26,7 +31,7 @@ from qute_style.dev.mocks import CallList, check_call, check_call_str
 from qute_style.qute_style import QuteStyle, ToggleOptionButton
 
 # Create a QApplication for all tests as we're using QPainter objects.
-from qute_style.style import get_color
+from qute_style.style import get_color, get_style
 
 pytestmark = pytest.mark.usefixtures("qapp")
 
@@ -71,6 +76,134 @@ def test_draw_control(element: QStyle.ControlElement) -> None:
             QuteStyle().drawControl(element, QStyleOption(), QPainter(), None)
 
 
+def test_draw_control_fast_path(
+    style_option_view_item: QStyleOptionViewItem,
+) -> None:
+    """Test that items of a view marked for the fast path are drawn at once."""
+    widget = QWidget()
+    widget.setProperty(QuteStyle.FAST_PATH_PROPERTY, True)
+    with check_call(QuteStyle, "draw_item_view_item"), check_call(
+        QProxyStyle, "drawControl", call_count=0
+    ):
+        QuteStyle().drawControl(
+            QuteStyle.ControlElement.CE_ItemViewItem,
+            style_option_view_item,
+            QPainter(),
+            widget,
+        )
+
+
+@pytest.mark.parametrize(
+    "widget_class, hover", ((QProgressBar, False), (QCheckBox, True))
+)
+def test_polish_hover(widget_class: type[QWidget], hover: bool) -> None:
+    """Test that hover tracking is disabled for widgets without hover."""
+    widget = widget_class()
+    QuteStyle().polish(widget)
+    assert widget.testAttribute(Qt.WidgetAttribute.WA_Hover) is hover
+
+
+@pytest.mark.parametrize(
+    "sheet, hover",
+    (
+        ("", False),
+        ("QProgressBar:hover, QDial:hover { color: red; }", True),
+    ),
+)
+def test_polish_hover_style_sheet(
+    qtbot: QtBot, qapp: QApplication, sheet: str, hover: bool
+) -> None:
+    """Test that only hover rules of a style sheet enable hover tracking."""
+    qapp.setStyle(QuteStyle())
+    widget = QWidget()
+    qtbot.addWidget(widget)
+    widget.setStyleSheet(get_style() + sheet)
+    layout = QVBoxLayout(widget)
+    children = (QProgressBar(), QDial())
+    for child in children:
+        layout.addWidget(child)
+    widget.show()
+    for child in children:
+        assert child.testAttribute(Qt.WidgetAttribute.WA_Hover) is hover
+
+
+@pytest.mark.parametrize(
+    "state, arrow, edit_field",
+    (
+        (
+            QStyle.StateFlag.State_Enabled,
+            QRect(249, 1, 28, 28),
+            QRect(11, 6, 233, 18),
+        ),
+        (
+            QStyle.StateFlag.State_None,
+            QRect(250, 0, 28, 30),
+            QRect(10, 5, 235, 20),
+        ),
+    ),
+    ids=("enabled", "disabled"),
+)
+def test_combo_box_sub_control_rect(
+    state: QStyle.StateFlag, arrow: QRect, edit_field: QRect
+) -> None:
+    """Test that the sub controls match the style sheet's QComboBox."""
+    option = QStyleOptionComboBox()
+    option.rect = QRect(0, 0, 278, 30)
+    option.state = state
+    style = QuteStyle()
+    assert (
+        style.subControlRect(
+            QStyle.ComplexControl.CC_ComboBox,
+            option,
+            QStyle.SubControl.SC_ComboBoxArrow,
+        )
+        == arrow
+    )
+    assert (
+        style.subControlRect(
+            QStyle.ComplexControl.CC_ComboBox,
+            option,
+            QStyle.SubControl.SC_ComboBoxEditField,
+        )
+        == edit_field
+    )
+    assert style.subControlRect(
+        QStyle.ComplexControl.CC_ComboBox,
+        option,
+        QStyle.SubControl.SC_ComboBoxFrame,
+    ) == QRect(0, 0, 278, 30)
+
+
+def test_draw_complex_control() -> None:
+    """Test that combo boxes are drawn by QuteStyle."""
+    with check_call(QuteStyle, "draw_combo_box"), check_call(
+        QProxyStyle, "drawComplexControl", call_count=0
+    ):
+        QuteStyle().drawComplexControl(
+            QStyle.ComplexControl.CC_ComboBox,
+            QStyleOptionComboBox(),
+            QPainter(),
+        )
+
+
+def test_combo_box_sprites() -> None:
+    """Test that combo boxes of the same size and state share a sprite."""
+    QuteStyle._COMBO_BOX_SPRITES.clear()
+    image = QImage(100, 100, QImage.Format.Format_ARGB32)
+    painter = QPainter(image)
+    option = QStyleOptionComboBox()
+    option.state = QStyle.StateFlag.State_Enabled
+    style = QuteStyle()
+    for top in (0, 30):
+        option.rect = QRect(0, top, 100, 30)
+        style.draw_combo_box(option, painter)
+    assert len(QuteStyle._COMBO_BOX_SPRITES) == 1
+    option.state |= QStyle.StateFlag.State_MouseOver
+    style.draw_combo_box(option, painter)
+    painter.end()
+    assert len(QuteStyle._COMBO_BOX_SPRITES) == 2
+
+
 def test_draw_check_box(style_option_button: QStyleOptionButton) -> None:
     """Test that drawing a QCheckBox draws the indicator and the label."""
     with check_call(QuteStyle, "_draw_indicator_checkbox"), check_call(
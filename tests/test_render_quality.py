@@ -0,0 +1,165 @@
+"""Tests for the RenderQualityManager."""
+
+# pylint: disable=protected-access
+
+import pytest
+from PySide6.QtCore import QPropertyAnimation, QRect, Qt
+from PySide6.QtGui import QImage, QPainter, QPixmap
+from PySide6.QtWidgets import (
+    QStyle,
+    QStyleOptionComboBox,
+    QStyleOptionViewItem,
+    QWidget,
+)
+from pytestqt.qtbot import QtBot
+
+from qute_style.animation_policy import AnimationPolicyManager
+from qute_style.qs_application import QuteStyleApplication
+from qute_style.qute_style import QuteStyle
+from qute_style.render_quality import RenderQuality, RenderQualityManager
+from qute_style.widgets.custom_icon_engine import PixmapStore
+
+# Create a QApplication for all tests as we're using QPainter objects.
+pytestmark = pytest.mark.usefixtures("qapp")
+
+
+@pytest.mark.parametrize(
+    "quality, shape, small_rect, mode",
+    (
+        (
+            RenderQuality.HIGH,
+            True,
+            True,
+            Qt.TransformationMode.SmoothTransformation,
+        ),
+        (
+            RenderQuality.BALANCED,
+            True,
+            False,
+            Qt.TransformationMode.SmoothTransformation,
+        ),
+        (
+            RenderQuality.FAST,
+            False,
+            False,
+            Qt.TransformationMode.FastTransformation,
+        ),
+    ),
+)
+def test_quality(
+    quality: RenderQuality,
+    shape: bool,
+    small_rect: bool,
+    mode: Qt.TransformationMode,
+) -> None:
+    """Test the antialiasing and scaling per quality."""
+    manager = RenderQualityManager.inst()
+    manager.quality = quality
+    assert manager.antialiasing() == shape
+    assert manager.antialiasing(manager.SMALL_RADIUS + 1) == shape
+    assert manager.antialiasing(manager.SMALL_RADIUS) == small_rect
+    assert manager.transformation_mode() == mode
+
+    pixmap = QPixmap(10, 10)
+    painter = QPainter(pixmap)
+    manager.set_antialiasing(painter, manager.SMALL_RADIUS)
+    assert painter.testRenderHint(QPainter.RenderHint.Antialiasing) == (
+        small_rect
+    )
+    painter.end()
+
+
+def test_balanced_animation(qtbot: QtBot) -> None:
+    """Test that BALANCED skips antialiasing while an animation runs."""
+    manager = RenderQualityManager.inst()
+    manager.quality = RenderQuality.BALANCED
+    widget = QWidget()
+    qtbot.addWidget(widget)
+    animation = QPropertyAnimation(widget, b"minimumWidth")
+    animation.setStartValue(0)
+    animation.setEndValue(100)
+    AnimationPolicyManager.inst().configure(animation, 100)
+    animation.start()
+    assert AnimationPolicyManager.inst().animation_running
+    assert not manager.antialiasing()
+    with qtbot.waitSignal(animation.finished):
+        pass
+    assert not AnimationPolicyManager.inst().animation_running
+    assert manager.antialiasing()
+
+
+@pytest.mark.parametrize(
+    "paint_time, quality",
+    (
+        (0, RenderQuality.HIGH),
+        (RenderQualityManager.HIGH_PAINT_TIME + 1, RenderQuality.BALANCED),
+        (RenderQualityManager.BALANCED_PAINT_TIME + 1, RenderQuality.FAST),
+    ),
+)
+def test_calibrate(
+    qtbot: QtBot,
+    monkeypatch: pytest.MonkeyPatch,
+    paint_time: int,
+    quality: RenderQuality,
+) -> None:
+    """Test that the quality is picked from the paint time."""
+    times = iter([0.0, paint_time / 1000] * 3)
+    monkeypatch.setattr(
+        "qute_style.render_quality.time.perf_counter", lambda: next(times)
+    )
+    widget = QWidget()
+    qtbot.addWidget(widget)
+    manager = RenderQualityManager.inst()
+    manager.quality = RenderQuality.FAST
+    assert manager.calibrate(widget) == quality
+    assert manager.quality == quality
+
+
+def test_pixmap_store() -> None:
+    """Test that the icon pixmaps are created again for a new quality."""
+    store = PixmapStore.inst()
+    pixmap = store.get_pixmap(":/svg_icons/home.svg", 16, 16)
+    assert store.get_pixmap(":/svg_icons/home.svg", 16, 16) is pixmap
+    RenderQualityManager.inst().quality = RenderQuality.FAST
+    assert store.get_pixmap(":/svg_icons/home.svg", 16, 16) is not pixmap
+
+
+def test_style_sprites() -> None:
+    """Test that the sprites of QuteStyle are drawn again per quality."""
+    QuteStyle._COMBO_BOX_SPRITES.clear()
+    QuteStyle._CHECK_SPRITES.clear()
+    image = QImage(100, 30, QImage.Format.Format_ARGB32)
+    painter = QPainter(image)
+    combo_box_option = QStyleOptionComboBox()
+    combo_box_option.state = QStyle.StateFlag.State_Enabled
+    combo_box_option.rect = QRect(0, 0, 100, 30)
+    style = QuteStyle()
+    manager = RenderQualityManager.inst()
+    for quality in (RenderQuality.HIGH, RenderQuality.FAST):
+        manager.quality = quality
+        style.draw_combo_box(combo_box_option, painter)
+        QuteStyle.draw_item_view_item_check(
+            QStyleOptionViewItem(),
+            painter,
+            QRect(0, 0, 16, 16),
+            QStyle.StateFlag.State_Enabled.value,
+        )
+    painter.end()
+    assert len(QuteStyle._COMBO_BOX_SPRITES) == 2
+    assert len(QuteStyle._CHECK_SPRITES) == 2
+    # Without antialiasing, the border of the rounded corners is either
+    # drawn or not.
+    alphas = {
+        QuteStyle._COMBO_BOX_SPRITES[key].toImage().pixelColor(x, 2).alpha()
+        for key in QuteStyle._COMBO_BOX_SPRITES
+        if key[-1][0] == RenderQuality.FAST
+        for x in range(5)
+    }
+    assert alphas <= {0, 255}
+
+
+def test_application_quality(qapp: QuteStyleApplication) -> None:
+    """Test that the application sets the quality of the manager."""
+    assert qapp.render_quality == RenderQuality.HIGH
+    qapp.render_quality = RenderQuality.FAST
+    assert RenderQualityManager.inst().quality == RenderQuality.FAST
@@ -0,0 +1,77 @@
+"""Tests for the BackgroundFrame."""
+
+# pylint: disable=protected-access
+from PySide6.QtCore import QEvent, Qt
+from PySide6.QtGui import QColor, QImage
+from PySide6.QtWidgets import QLabel, QVBoxLayout, QWidget
+from pytestqt.qtbot import QtBot
+
+from qute_style.dev.benchmark import EventCounter
+from qute_style.style import get_color, get_style
+from qute_style.widgets.background_frame import BackgroundFrame
+
+
+def _render(widget: QWidget) -> QImage:
+    """Render the widget without its background onto a transparent image."""
+    image = QImage(widget.size(), QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(Qt.GlobalColor.transparent)
+    widget.render(image, renderFlags=QWidget.RenderFlag.DrawChildren)
+    return image
+
+
+def test_shadow(qtbot: QtBot) -> None:
+    """Test that the shadow is drawn around the frame onto its parent."""
+    widget = QWidget()
+    qtbot.addWidget(widget)
+    layout = QVBoxLayout(widget)
+    layout.setContentsMargins(10, 10, 10, 10)
+    frame = BackgroundFrame()
+    # The frame follows the parent it's added to.
+    layout.addWidget(frame)
+    assert frame._shadow_parent is widget
+    widget.resize(300, 200)
+    widget.show()
+
+    image = _render(widget)
+    alphas = [image.pixelColor(x, 100).alpha() for x in range(10)]
+    # The shadow gets darker towards the frame.
+    assert alphas == sorted(alphas)
+    assert 0 < alphas[0] < alphas[-1]
+    # All edges are drawn from the same (nearly symmetric) shadow
+    assert abs(image.pixelColor(299, 100).alpha() - alphas[0]) <= 2
+    assert abs(image.pixelColor(150, 0).alpha() - alphas[0]) <= 2
+    assert image.pixelColor(0, 0).alpha() < alphas[0]
+    assert len(BackgroundFrame._SHADOWS) >= 1
+
+    frame.shadow_visible = False
+    assert _render(widget).pixelColor(0, 100).alpha() == 0
+    frame.shadow_visible = True
+    assert _render(widget).pixelColor(0, 100) == image.pixelColor(0, 100)
+
+
+def test_maximized(qtbot: QtBot) -> None:
+    """Test that the maximized look is set without restyling the children."""
+    widget = QWidget()
+    qtbot.addWidget(widget)
+    widget.setStyleSheet(get_style())
+    layout = QVBoxLayout(widget)
+    layout.setContentsMargins(10, 10, 10, 10)
+    frame = BackgroundFrame()
+    layout.addWidget(frame)
+    frame.layout().addWidget(QLabel("Content"))
+    widget.resize(300, 200)
+    widget.show()
+    assert not frame.window_maximized
+    # The corners are rounded
+    assert _render(frame).pixelColor(0, 0).alpha() == 0
+
+    with EventCounter(QEvent.Type.StyleChange) as counter:
+        frame.window_maximized = True
+    assert not counter.total
+    assert frame.window_maximized
+    assert not frame.shadow_visible
+    assert _render(frame).pixelColor(0, 0) == QColor(get_color("bg_one"))
+
+    frame.window_maximized = False
+    assert frame.shadow_visible
+    assert _render(frame).pixelColor(0, 0).alpha() == 0
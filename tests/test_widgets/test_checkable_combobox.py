@@ -1,8 +1,17 @@
 """Tests for the Checkable Combobox."""
 
+# pylint: disable=protected-access
+import pytest
 from PySide6.QtCore import Qt
+from PySide6.QtGui import QStandardItemModel
 from pytestqt.qtbot import QtBot
 
+from qute_style.dev.mocks import check_call
+from qute_style.widgets.item_search import ItemSearchIndex
+from qute_style.widgets.styled_combobox import (
+    CheckableComboBox,
+    TooManyItemsError,
+)
 from qute_style_examples.sample_classes import (
     SelectAllTestComboBox,
     TestComboBox,
@@ -135,3 +144,254 @@ def test_select_all(qtbot: QtBot) -> None:
         )
 
     assert not exceptions
+
+
+def test_index(qtbot: QtBot) -> None:
+    """Test that the index of checked items follows the model."""
+    combobox = create_show_test_combobox(qtbot)
+    model = combobox.model()
+    model.item(4).setCheckState(Qt.CheckState.Checked)
+    model.item(1).setCheckState(Qt.CheckState.Checked)
+
+    # The checked items are answered without scanning the model.
+    with check_call(QStandardItemModel, "item", call_count=0):
+        assert combobox.item_ids == [2, 5]
+        assert combobox._get_text() == "2, 5"
+
+    combobox.removeItem(0)
+    combobox.insertItem(0, "New Item 0")
+    model.item(0).setData(0)
+    model.item(0).setCheckState(Qt.CheckState.Checked)
+    model.item(1).setData(20)
+    assert combobox.item_ids == [0, 20, 5]
+    assert combobox._get_text() == "0, 20, 5"
+
+    model.item(1).setCheckState(Qt.CheckState.Unchecked)
+    assert combobox._row_data == [0, 20, *range(3, 10)]
+    assert combobox._row_states[:3] == [
+        Qt.CheckState.Checked,
+        Qt.CheckState.Unchecked,
+        Qt.CheckState.Unchecked,
+    ]
+
+    combobox.clear()
+    assert not combobox.item_ids
+    assert combobox._get_text() == "No selection."
+
+
+def test_sorted_checked_rows(qtbot: QtBot) -> None:
+    """Test that the checked rows are only sorted again after a change."""
+    combobox = create_show_test_combobox(qtbot)
+    model = combobox.model()
+    model.item(4).setCheckState(Qt.CheckState.Checked)
+    model.item(1).setCheckState(Qt.CheckState.Checked)
+    rows = combobox._sorted_checked_rows()
+    assert rows == [1, 4]
+    assert combobox.item_ids == [2, 5]
+    assert combobox._sorted_checked_rows() is rows
+
+    model.item(2).setCheckState(Qt.CheckState.Checked)
+    assert combobox._sorted_checked_rows() == [1, 2, 4]
+    combobox.insertItem(0, "New Item 0")
+    assert combobox._sorted_checked_rows() == [2, 3, 5]
+    combobox.removeItem(3)
+    assert combobox._sorted_checked_rows() == [2, 4]
+    assert combobox.item_ids == [2, 5]
+
+
+def test_select_all_index(qtbot: QtBot) -> None:
+    """Test the "select all" item and text with the index."""
+    combobox = create_show_select_all_combobox(qtbot)
+    model = combobox.model()
+    assert combobox._get_text() == "1, 2, 3, 4, 5, 6, 7, 8, 9"
+    for idx in range(2, 10):
+        model.item(idx).setCheckState(Qt.CheckState.Unchecked)
+    assert model.item(0).checkState() == Qt.CheckState.PartiallyChecked
+    model.item(10).setCheckState(Qt.CheckState.Unchecked)
+    assert model.item(0).checkState() == Qt.CheckState.Unchecked
+    assert combobox._get_text() == "No selection."
+    model.item(0).setCheckState(Qt.CheckState.Checked)
+    assert combobox.item_ids == [None, *range(1, 10)]
+
+
+def test_add_items(qtbot: QtBot) -> None:
+    """Test that items are added in one model operation."""
+    combobox = create_show_test_combobox(qtbot)
+    inserted: list[tuple[int, int]] = []
+    combobox.model().rowsInserted.connect(
+        lambda _, first, last: inserted.append((first, last))
+    )
+    with check_call(CheckableComboBox, "send_current_state", call_count=1):
+        combobox.add_items(
+            ((f"Item {idx}", idx) for idx in range(10, 20)),
+            ":/svg_icons/delete_forever.svg",
+        )
+    assert inserted == [(9, 18)]
+    assert combobox.model().item(18).data() == 19
+    assert combobox._row_data[18] == 19
+
+    with check_call(CheckableComboBox, "send_current_state", call_count=0):
+        combobox.add_items([])
+
+
+def test_set_item_ids(qtbot: QtBot) -> None:
+    """Test that the check states are set at once."""
+    combobox = create_show_test_combobox(qtbot)
+    with (
+        check_call(CheckableComboBox, "handle_data_change", call_count=0),
+        check_call(CheckableComboBox, "send_current_state", call_count=1),
+    ):
+        combobox.set_item_ids([3, 1])
+    assert combobox.item_ids == [1, 3]
+    assert combobox._get_text() == "1, 3"
+    assert combobox.model().item(2).checkState() == Qt.CheckState.Checked
+
+    combobox.single_mode = True
+    with pytest.raises(TooManyItemsError):
+        combobox.set_item_ids([1, 2])
+
+
+def test_select_all_set_item_ids(qtbot: QtBot) -> None:
+    """Test that the "select all" item follows set_item_ids."""
+    combobox = create_show_select_all_combobox(qtbot)
+    combobox.set_item_ids([2])
+    assert combobox.model().item(0).checkState() == (
+        Qt.CheckState.PartiallyChecked
+    )
+    assert combobox.item_ids == [2]
+    combobox.set_item_ids([])
+    assert combobox.model().item(0).checkState() == Qt.CheckState.Unchecked
+    combobox.item_ids = list(range(1, 10))
+    assert combobox.model().item(0).checkState() == Qt.CheckState.Checked
+
+
+class SearchTestComboBox(TestComboBox):
+    """TestComboBox with a search field."""
+
+    SEARCHABLE = True
+
+
+class SearchSelectAllTestComboBox(SelectAllTestComboBox):
+    """SelectAllTestComboBox with a search field."""
+
+    SEARCHABLE = True
+
+
+def test_search(qtbot: QtBot) -> None:
+    """Test that the popup shows the items matching the search."""
+    combobox = SearchTestComboBox()
+    qtbot.addWidget(combobox)
+    combobox.show()
+    combobox.showPopup()
+    assert combobox._search_field is not None
+    assert combobox._result_view is not None
+    combobox._search_field.setText("item 1")
+    assert combobox._filtered_rows() == [0]
+    assert not combobox._result_view.isHidden()
+    assert combobox.view().isHidden()
+
+    # Items that are added are found with the next search
+    combobox.add_items([("New Item 10", 10), ("Other", 11)])
+    assert combobox._filtered_rows() == [0, 9]
+
+    # Toggle an item by clicking it in the view of the matches
+    pos = combobox._result_view.visualRect(
+        combobox._result_view.model().index(1, 0)
+    ).center()
+    qtbot.mouseClick(
+        combobox._result_view.viewport(), Qt.MouseButton.LeftButton, pos=pos
+    )
+    assert combobox.item_ids == [10]
+
+    # Changed rows update the index instead of rebuilding it
+    with check_call(ItemSearchIndex, "clear", call_count=0):
+        combobox.model().item(0).setText("Renamed")
+        assert combobox._filtered_rows() == [9]
+        combobox.removeItem(0)
+        assert combobox._filtered_rows() == [8]
+        combobox.insertItem(0, "Item 1")
+        assert combobox._filtered_rows() == [0, 9]
+
+    combobox.hidePopup()
+    assert combobox._filtered_rows() is None
+    assert not combobox._search_field.text()
+    assert combobox._result_view.isHidden()
+    assert not combobox.view().isHidden()
+
+
+def test_select_all_search(qtbot: QtBot) -> None:
+    """Test that "select all" only applies to the matching items."""
+    combobox = SearchSelectAllTestComboBox()
+    qtbot.addWidget(combobox)
+    combobox.show()
+    combobox.showPopup()
+    model = combobox.model()
+    model.item(0).setCheckState(Qt.CheckState.Unchecked)
+    combobox.add_items([("Other 10", 10), ("Other 11", 11)])
+
+    assert combobox._search_field is not None
+    combobox._search_field.setText("other")
+    assert combobox._filtered_rows() == [0, 11, 12]
+    model.item(0).setCheckState(Qt.CheckState.Checked)
+    assert combobox.item_ids == [None, 10, 11]
+    model.item(12).setCheckState(Qt.CheckState.Unchecked)
+    assert model.item(0).checkState() == Qt.CheckState.PartiallyChecked
+
+    # Without the search, the state reflects all items again
+    combobox._search_field.setText("item 5")
+    assert model.item(0).checkState() == Qt.CheckState.Unchecked
+    combobox.hidePopup()
+    assert model.item(0).checkState() == Qt.CheckState.PartiallyChecked
+    assert combobox.item_ids == [10]
+
+
+def test_selection_changed(qtbot: QtBot) -> None:
+    """Test that selection_changed carries the checked and unchecked ids."""
+    combobox = create_show_test_combobox(qtbot)
+    model = combobox.model()
+    with qtbot.waitSignal(combobox.selection_changed) as blocker:
+        model.item(2).setCheckState(Qt.CheckState.Checked)
+    assert blocker.args == [[3], []]
+    with qtbot.waitSignal(combobox.selection_changed) as blocker:
+        combobox.set_item_ids([1, 2])
+    assert blocker.args == [[1, 2], [3]]
+    with qtbot.assertNotEmitted(combobox.selection_changed):
+        combobox.set_item_ids([1, 2])
+        combobox.add_items([("New Item 10", 10)])
+    with qtbot.waitSignal(combobox.selection_changed) as blocker:
+        combobox.removeItem(0)
+    assert blocker.args == [[], [1]]
+
+    combobox.single_mode = True
+    with qtbot.waitSignal(combobox.selection_changed) as blocker:
+        model.item(4).setCheckState(Qt.CheckState.Checked)
+    assert blocker.args == [[6], [2]]
+
+
+def test_selection_changed_debounce(qtbot: QtBot) -> None:
+    """Test that rapid toggles are emitted in one selection_changed."""
+    combobox = create_show_select_all_combobox(qtbot)
+    model = combobox.model()
+    combobox.selection_debounce = 20
+    emitted: list[tuple[list[int], list[int]]] = []
+    combobox.selection_changed.connect(
+        lambda added, removed: emitted.append((added, removed))
+    )
+    model.item(2).setCheckState(Qt.CheckState.Unchecked)
+    model.item(3).setCheckState(Qt.CheckState.Unchecked)
+    model.item(2).setCheckState(Qt.CheckState.Checked)
+    assert not emitted
+    qtbot.waitUntil(lambda: bool(emitted))
+    assert emitted == [([], [2])]
+
+    # "select all" is not reported as an item
+    model.item(0).setCheckState(Qt.CheckState.Unchecked)
+    qtbot.waitUntil(lambda: len(emitted) == 2)
+    assert emitted[1] == ([], [1, 3, 4, 5, 6, 7, 8, 9])
+
+
+def test_data_changed(qtbot: QtBot) -> None:
+    """Test that dataChanged is emitted if it's connected."""
+    combobox = create_show_test_combobox(qtbot)
+    with qtbot.waitSignal(combobox.dataChanged):
+        combobox.model().item(2).setCheckState(Qt.CheckState.Checked)
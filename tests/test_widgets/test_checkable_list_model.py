@@ -0,0 +1,159 @@
+"""Tests for the CheckableListModel."""
+
+# pylint: disable=protected-access
+import pytest
+from PySide6.QtCore import QModelIndex, Qt
+from PySide6.QtGui import QIcon
+from pytestqt.qtbot import QtBot
+
+from qute_style.widgets.checkable_list_model import CheckableListModel
+from qute_style.widgets.styled_combobox import (
+    CheckableComboBox,
+    SelectAllComboBox,
+)
+
+
+class CompactComboBox(CheckableComboBox[int]):
+    """CheckableComboBox with a CheckableListModel."""
+
+    COMPACT_MODEL = True
+
+
+class CompactSelectAllComboBox(SelectAllComboBox[int]):
+    """SelectAllComboBox with a CheckableListModel, which is unsupported."""
+
+    COMPACT_MODEL = True
+
+
+def create_model(count: int) -> CheckableListModel:
+    """Create a model with count items."""
+    model = CheckableListModel()
+    model.add_items((f"Item {idx}", idx) for idx in range(count))
+    return model
+
+
+def checked_rows(model: CheckableListModel) -> list[int]:
+    """Return the checked rows of the model."""
+    return [
+        row
+        for row in range(model.rowCount())
+        if model.check_state(row) == Qt.CheckState.Checked
+    ]
+
+
+def test_data() -> None:
+    """Test the data and flags of the items."""
+    model = create_model(3)
+    icon = QIcon(":/svg_icons/home.svg")
+    model.add_items([("Icon", 3)], icon)
+    index = model.index(3, 0)
+    assert model.rowCount() == 4
+    assert model.rowCount(index) == 0
+    assert index.data() == "Icon"
+    assert index.data(CheckableListModel.DATA_ROLE) == 3
+    assert (
+        index.data(Qt.ItemDataRole.DecorationRole).cacheKey()
+        == icon.cacheKey()
+    )
+    assert (
+        model.data(model.index(0, 0), Qt.ItemDataRole.DecorationRole) is None
+    )
+    assert (
+        index.data(Qt.ItemDataRole.CheckStateRole) == Qt.CheckState.Unchecked
+    )
+    assert model.flags(index) == (
+        Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsUserCheckable
+    )
+
+    assert model.setData(index, "Text")
+    assert model.setData(index, 30, CheckableListModel.DATA_ROLE)
+    assert not model.setData(index, "Tip", Qt.ItemDataRole.ToolTipRole)
+    assert not model.setData(QModelIndex(), "Text")
+    assert index.data() == "Text"
+    assert model.item_data(3) == 30
+
+
+def test_check_state(qtbot: QtBot) -> None:
+    """Test that check states are stored and signaled per item."""
+    model = create_model(20)
+    with qtbot.waitSignal(model.dataChanged) as blocker:
+        model.setData(
+            model.index(9, 0),
+            Qt.CheckState.Checked.value,
+            Qt.ItemDataRole.CheckStateRole,
+        )
+    assert blocker.args[0].row() == 9
+    assert blocker.args[2] == [Qt.ItemDataRole.CheckStateRole]
+    model.set_check_state(0, Qt.CheckState.Checked)
+    model.set_check_state(19, Qt.CheckState.Checked)
+    assert checked_rows(model) == [0, 9, 19]
+
+    with qtbot.assertNotEmitted(model.dataChanged):
+        model.set_check_state(9, Qt.CheckState.Checked)
+    model.set_check_state(9, Qt.CheckState.Unchecked)
+    assert checked_rows(model) == [0, 19]
+    assert len(model._checked) == 3
+
+
+def test_insert_remove() -> None:
+    """Test that the check states move with inserted and removed rows."""
+    model = create_model(10)
+    for row in (0, 5, 9):
+        model.set_check_state(row, Qt.CheckState.Checked)
+
+    assert model.insertRows(3, 10)
+    assert model.rowCount() == 20
+    assert checked_rows(model) == [0, 15, 19]
+    assert model.data(model.index(3, 0)) == ""
+    assert model.item_data(15) == 5
+
+    assert model.removeRows(1, 14)
+    assert checked_rows(model) == [0, 1, 5]
+    assert [model.item_data(row) for row in range(6)] == [0, 5, 6, 7, 8, 9]
+    assert len(model._checked) == 1
+
+    assert not model.insertRows(7, 1)
+    assert not model.removeRows(5, 2)
+    assert not model.removeRows(0, 0)
+
+
+def test_combobox(qtbot: QtBot) -> None:
+    """Test a CheckableComboBox that uses the CheckableListModel."""
+    combobox = CompactComboBox()
+    qtbot.addWidget(combobox)
+    assert isinstance(combobox.model(), CheckableListModel)
+    combobox.add_items((f"Item {idx}", idx) for idx in range(1, 10))
+    combobox.addItem("Item 10", 10, ":/svg_icons/home.svg")
+    combobox.show()
+
+    combobox.item_ids = [2, 10]
+    assert combobox.item_ids == [2, 10]
+    assert combobox._get_text() == "2, 10"
+    assert combobox.model().check_state(9) == Qt.CheckState.Checked
+
+    # Toggle an item by clicking it in the popup
+    combobox.showPopup()
+    pos = combobox.view().visualRect(combobox.model().index(2, 0)).center()
+    qtbot.mouseClick(
+        combobox.view().viewport(), Qt.MouseButton.LeftButton, pos=pos
+    )
+    assert combobox.item_ids == [2, 3, 10]
+    combobox.hidePopup()
+
+    # The QComboBox API works on the model as well
+    combobox.removeItem(0)
+    combobox.insertItem(0, "Item 0")
+    assert combobox.model().data(combobox.model().index(0, 0)) == "Item 0"
+    assert combobox.item_ids == [2, 3, 10]
+    combobox.single_mode = True
+    combobox.model().set_check_state(0, Qt.CheckState.Checked)
+    assert combobox.item_ids == [None]
+    combobox.clear()
+    assert combobox.model().rowCount() == 0
+    assert not combobox.item_ids
+
+
+def test_select_all_compact() -> None:
+    """Test that the SelectAllComboBox rejects the compact model."""
+    with pytest.raises(TypeError, match="tristate"):
+        CompactSelectAllComboBox()
@@ -1,11 +1,18 @@
 """Tests for grips."""
 
+# pylint: disable=protected-access
 import pytest
-from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QWidget
+from PySide6.QtCore import QEvent, QPointF, QRect, Qt
+from PySide6.QtGui import QMouseEvent
+from PySide6.QtWidgets import QApplication, QWidget
 from pytestqt.qtbot import QtBot
 
-from qute_style.widgets.grips import CornerGrip, EdgeGrip
+from qute_style.widgets.grips import (
+    CornerGrip,
+    EdgeGrip,
+    GripResizer,
+    ResizeMode,
+)
 
 
 @pytest.mark.parametrize(
@@ -52,3 +59,108 @@ def test_edge_grip_adapt(
     grip.adapt()
 
     assert (grip.x(), grip.y(), grip.width(), grip.height()) == expected
+
+
+@pytest.mark.parametrize("mode", [ResizeMode.COALESCED, ResizeMode.SYSTEM])
+def test_coalesced(qtbot: QtBot, mode: ResizeMode) -> None:
+    """Test that only the latest geometry is applied once per frame."""
+    grip = QWidget()
+    qtbot.addWidget(grip)
+    applied: list[QRect] = []
+    resizer = GripResizer(grip, mode, Qt.Edge.RightEdge, applied.append)
+    # The offscreen platform doesn't support system resizing.
+    assert not resizer.start()
+    for width in (100, 101, 102):
+        resizer.request(QRect(0, 0, width, 100))
+    assert applied == [QRect(0, 0, 100, 100)]
+    qtbot.waitUntil(lambda: len(applied) == 2)
+    assert applied[-1] == QRect(0, 0, 102, 100)
+
+    # The last geometry is applied on release at once.
+    resizer.request(QRect(0, 0, 103, 100))
+    resizer.finish()
+    assert applied[-1] == QRect(0, 0, 103, 100)
+    assert len(applied) == 3
+
+
+def test_live(qtbot: QtBot) -> None:
+    """Test that every geometry is applied with ResizeMode.LIVE."""
+    grip = QWidget()
+    qtbot.addWidget(grip)
+    applied: list[QRect] = []
+    resizer = GripResizer(
+        grip, ResizeMode.LIVE, Qt.Edge.RightEdge, applied.append
+    )
+    resizer.start()
+    for width in (100, 101, 102):
+        resizer.request(QRect(0, 0, width, 100))
+    resizer.finish()
+    assert [rect.width() for rect in applied] == [100, 101, 102]
+
+
+def test_outline(qtbot: QtBot) -> None:
+    """Test that the geometry is shown as outline and applied on release."""
+    grip = QWidget()
+    qtbot.addWidget(grip)
+    applied: list[QRect] = []
+    resizer = GripResizer(
+        grip, ResizeMode.OUTLINE, Qt.Edge.RightEdge, applied.append
+    )
+    resizer.start()
+    for width in (100, 101, 102):
+        resizer.request(QRect(0, 0, width, 100))
+    assert not applied
+    assert resizer._outline is not None
+    assert resizer._outline.isVisible()
+    assert resizer._outline.geometry() == QRect(0, 0, 102, 100)
+    outline = resizer._outline
+    resizer.finish()
+    assert applied == [QRect(0, 0, 102, 100)]
+    assert not outline.isVisible()
+    assert resizer._outline is None
+    with qtbot.waitSignal(outline.destroyed):
+        pass
+
+
+def test_corner_grip_resize(qtbot: QtBot) -> None:
+    """Test that dragging a CornerGrip requests the new window geometry."""
+    parent = QWidget()
+    qtbot.addWidget(parent)
+    parent.setGeometry(100, 100, 300, 200)
+    grip = CornerGrip(parent, Qt.Corner.BottomRightCorner, ResizeMode.LIVE)
+    grip.adapt()
+    parent.show()
+
+    def send(kind: QEvent.Type, pos: QPointF) -> None:
+        QApplication.sendEvent(
+            grip,
+            QMouseEvent(
+                kind,
+                pos,
+                grip.mapToGlobal(pos),
+                Qt.MouseButton.LeftButton,
+                Qt.MouseButton.LeftButton,
+                Qt.KeyboardModifier.NoModifier,
+            ),
+        )
+
+    with qtbot.waitSignal(grip.window_geometry_changed) as blocker:
+        send(QEvent.Type.MouseButtonPress, QPointF(0, 0))
+        send(QEvent.Type.MouseMove, QPointF(20, 10))
+    assert blocker.args == [QRect(100, 100, 320, 210)]
+    send(QEvent.Type.MouseButtonRelease, QPointF(20, 10))
+
+
+def test_outline_deleted_with_grip(qtbot: QtBot) -> None:
+    """Test that an outline is deleted with the grip if not finished."""
+    grip = QWidget()
+    resizer = GripResizer(
+        grip, ResizeMode.OUTLINE, Qt.Edge.RightEdge, lambda _: None
+    )
+    resizer.start()
+    resizer.request(QRect(0, 0, 100, 100))
+    assert resizer._outline is not None
+    outline = resizer._outline
+    grip.deleteLater()
+    with qtbot.waitSignal(outline.destroyed):
+        pass
@@ -5,11 +5,14 @@ from collections.abc import Iterator
 from random import randint
 
 import pytest
-from PySide6.QtCore import QRect
+from PySide6.QtCore import QEvent, QRect
 from PySide6.QtGui import QPainter, QPaintEvent, QPixmap
+from PySide6.QtWidgets import QApplication
 from pytestqt.qtbot import QtBot
 
 from qute_style.dev.mocks import CallList, check_call
+from qute_style.style import get_color
+from qute_style.widgets.custom_icon_engine import PixmapStore
 from qute_style.widgets.icon import Icon
 
 
@@ -125,3 +128,36 @@ class TestDraw:
         assert draw_pixmap_call[0][0][3].width() == pixmap.width()
         assert draw_pixmap_call[0][0][3].height() == pixmap.height()
         assert draw_pixmap_call[0][0][3].toImage() == pixmap.toImage()
+
+
+def test_pixmap_cache(qtbot: QtBot, icon_path: str) -> None:
+    """Test that the pixmap is only taken again after changes."""
+    icon = Icon(20)
+    qtbot.addWidget(icon)
+    icon.grab()
+    with check_call(Icon, "_get_pixmap", call_count=0):
+        icon.grab()
+    icon.set_icon(icon_path)
+    assert icon._pixmap is None
+    icon.grab()
+    assert icon._pixmap is not None
+
+    # A new theme is applied with a new style sheet
+    icon.setStyleSheet("background: transparent;")
+    assert icon._pixmap is None
+    icon.grab()
+    QApplication.sendEvent(icon, QEvent(QEvent.Type.DevicePixelRatioChange))
+    assert icon._pixmap is None
+
+
+def test_store_pixmap_scale(qtbot: QtBot) -> None:
+    """Test that the scale of the stored pixmap is not changed."""
+    icon = Icon(20)
+    qtbot.addWidget(icon)
+    with check_call(Icon, "scale", 2.0, as_property=True, call_count=-1):
+        pixmap = icon._get_pixmap()
+    assert pixmap.devicePixelRatio() == 2.0
+    stored = PixmapStore.inst().get_pixmap(
+        Icon.DEFAULT_ICON_PATH, 40, 40, get_color("foreground")
+    )
+    assert stored.devicePixelRatio() == 1.0
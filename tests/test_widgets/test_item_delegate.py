@@ -0,0 +1,203 @@
+"""Tests for the item delegates rendering through QuteStyle."""
+
+# pylint: disable=protected-access
+from typing import cast
+
+import pytest
+from PySide6.QtCore import QSize, Qt
+from PySide6.QtGui import (
+    QColor,
+    QFont,
+    QIcon,
+    QStandardItem,
+    QStandardItemModel,
+)
+from PySide6.QtWidgets import (
+    QApplication,
+    QItemDelegate,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
+    QTableView,
+)
+from pytestqt.qtbot import QtBot
+
+from qute_style.dev.mocks import check_call
+from qute_style.qute_style import QuteStyle
+from qute_style.widgets.item_delegate import (
+    FastPathItemDelegate,
+    ThemedItemDelegate,
+    set_fast_path,
+)
+from qute_style.widgets.text_truncator import TruncationCache
+
+
+@pytest.fixture(autouse=True, name="qute_style")
+def fixture_qute_style(qapp: QApplication) -> None:
+    """Use QuteStyle as application style like QuteStyleMainWindow does."""
+    qapp.setStyle(QuteStyle())
+
+
+def create_view(qtbot: QtBot) -> QTableView:
+    """Create a QTableView with a few checkable items."""
+    view = QTableView()
+    qtbot.addWidget(view)
+    model = QStandardItemModel(view)
+    for row in range(5):
+        item = QStandardItem(f"Item {row}")
+        item.setCheckable(True)
+        item.setCheckState(Qt.CheckState.Checked)
+        model.appendRow([item, QStandardItem(f"Text {row}")])
+    view.setModel(model)
+    return view
+
+
+def test_set_fast_path(qtbot: QtBot) -> None:
+    """Test that the fast path marks the view and sets the delegate."""
+    view = create_view(qtbot)
+    set_fast_path(view)
+    assert view.property(QuteStyle.FAST_PATH_PROPERTY) is True
+    assert isinstance(view.itemDelegate(), FastPathItemDelegate)
+
+    set_fast_path(view, False)
+    assert view.property(QuteStyle.FAST_PATH_PROPERTY) is False
+    assert type(view.itemDelegate()) is QStyledItemDelegate
+
+
+def test_set_fast_path_custom_delegate(qtbot: QtBot) -> None:
+    """Test that a custom delegate is not replaced by the fast path."""
+    view = create_view(qtbot)
+    delegate = QItemDelegate(view)
+    view.setItemDelegate(delegate)
+    set_fast_path(view)
+    assert view.itemDelegate() is delegate
+
+
+def test_fast_path_painting(qtbot: QtBot) -> None:
+    """Test that the items of a marked view are drawn by QuteStyle."""
+    view = create_view(qtbot)
+    set_fast_path(view)
+    view.show()
+    qtbot.waitExposed(view)
+    with check_call(QuteStyle, "draw_item_view_item", call_count=10) as calls:
+        view.grab()
+    assert calls[0][0][3] is view
+
+
+def test_check_sprites(qtbot: QtBot) -> None:
+    """Test that the check indicators of a view are drawn from sprites."""
+    view = create_view(qtbot)
+    set_fast_path(view)
+    QuteStyle._CHECK_SPRITES.clear()
+    view.show()
+    qtbot.waitExposed(view)
+    view.grab()
+    # All items share the same state and therefore the same sprite.
+    assert len(QuteStyle._CHECK_SPRITES) == 1
+
+
+def test_themed_delegate_painting(qtbot: QtBot) -> None:
+    """Test that the themed delegate draws checks and cached texts."""
+    view = create_view(qtbot)
+    delegate = ThemedItemDelegate(view)
+    view.setItemDelegate(delegate)
+    QuteStyle._CHECK_SPRITES.clear()
+    view.show()
+    qtbot.waitExposed(view)
+    view.grab()
+    assert len(QuteStyle._CHECK_SPRITES) == 1
+    texts = {text for text, _, _ in TruncationCache.inst()._texts}
+    assert "Item 0" in texts
+    assert "Text 4" in texts
+
+    delegate.clear_cache()
+    assert not delegate._size_hints
+
+
+def test_themed_delegate_fallback(qtbot: QtBot, qapp: QApplication) -> None:
+    """Test that the themed delegate falls back without QuteStyle."""
+    qapp.setStyle("Fusion")
+    view = create_view(qtbot)
+    delegate = ThemedItemDelegate(view)
+    view.setItemDelegate(delegate)
+    view.show()
+    qtbot.waitExposed(view)
+    TruncationCache.inst().clear()
+    with check_call(FastPathItemDelegate, "paint", call_count=10):
+        view.grab()
+    assert not len(TruncationCache.inst())
+
+
+@pytest.mark.parametrize(
+    "role, value",
+    (
+        (Qt.ItemDataRole.BackgroundRole, QColor("red")),
+        (Qt.ItemDataRole.ForegroundRole, QColor("red")),
+        (Qt.ItemDataRole.FontRole, QFont("Segoe UI", 20)),
+        (Qt.ItemDataRole.TextAlignmentRole, Qt.AlignmentFlag.AlignRight),
+    ),
+)
+def test_themed_delegate_style_roles(
+    qtbot: QtBot, role: Qt.ItemDataRole, value: object
+) -> None:
+    """Test that items with a look of their own are painted by the style."""
+    view = create_view(qtbot)
+    view.setItemDelegate(ThemedItemDelegate(view))
+    cast(QStandardItemModel, view.model()).item(2, 1).setData(value, role)
+    view.show()
+    qtbot.waitExposed(view)
+    with check_call(FastPathItemDelegate, "paint", call_count=1):
+        view.grab()
+
+
+def test_themed_delegate_icon_mode() -> None:
+    """Test that the icons of disabled items are drawn disabled."""
+    enabled = QStyle.StateFlag.State_Enabled.value
+    selected = QStyle.StateFlag.State_Selected.value
+    assert ThemedItemDelegate._icon_mode(enabled) == QIcon.Mode.Normal
+    assert (
+        ThemedItemDelegate._icon_mode(enabled | selected)
+        == QIcon.Mode.Selected
+    )
+    assert ThemedItemDelegate._icon_mode(selected) == QIcon.Mode.Disabled
+
+
+@pytest.mark.parametrize("uniform", [True, False])
+def test_themed_delegate_size_hint(qtbot: QtBot, uniform: bool) -> None:
+    """Test that the size hints are cached and optionally uniform."""
+    view = create_view(qtbot)
+    delegate = ThemedItemDelegate(view, uniform_row_heights=uniform)
+    option = QStyleOptionViewItem()
+    sizes = iter([QSize(50, 20), QSize(50, 40)])
+    with check_call(
+        FastPathItemDelegate,
+        "sizeHint",
+        return_value=lambda *_: next(sizes),
+        call_count=2,
+    ):
+        size = delegate.sizeHint(option, view.model().index(0, 1))
+        assert delegate.sizeHint(option, view.model().index(0, 1)) is size
+        other = delegate.sizeHint(option, view.model().index(1, 1))
+    assert size == QSize(50, 20)
+    assert other == QSize(50, 20 if uniform else 40)
+    assert delegate.row_height == (20 if uniform else None)
+
+
+def test_themed_delegate_size_hint_roles(qtbot: QtBot) -> None:
+    """Test that icons and explicit size hints aren't mixed up in the cache."""
+    view = QTableView()
+    qtbot.addWidget(view)
+    model = QStandardItemModel(view)
+    icon = QIcon(":/svg_icons/no_icon.svg")
+    with_icon = QStandardItem(icon, "Same")
+    explicit = QStandardItem("Same")
+    explicit.setSizeHint(QSize(200, 80))
+    model.appendColumn([QStandardItem("Same"), with_icon, explicit])
+    view.setModel(model)
+    delegate = ThemedItemDelegate(view)
+    option = QStyleOptionViewItem()
+    option.decorationSize = QSize(16, 16)
+    plain = delegate.sizeHint(option, model.index(0, 0))
+    assert delegate.sizeHint(option, model.index(1, 0)).width() > plain.width()
+    assert delegate.sizeHint(option, model.index(2, 0)) == QSize(200, 80)
+    assert delegate.sizeHint(option, model.index(0, 0)) is plain
@@ -0,0 +1,91 @@
+"""Tests for the ItemSearchIndex and the SearchResultModel."""
+
+# pylint: disable=protected-access
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QStandardItem, QStandardItemModel
+from pytestqt.qtbot import QtBot
+
+from qute_style.widgets.item_search import ItemSearchIndex, SearchResultModel
+
+
+def test_search() -> None:
+    """Test that the rows containing the query are found in order."""
+    index = ItemSearchIndex()
+    index.append(["Apple", "Banana", "Pineapple", "Grape"])
+    assert len(index) == 4
+    assert index.search("apple") == [0, 2]
+    assert index.search("APP") == [0, 2]
+    assert index.search("ana") == [1]
+    assert index.search("ap") == [0, 2, 3]
+    assert index.search("") == [0, 1, 2, 3]
+    assert index.search("pear") == []
+    # All trigrams of the query exist, but not in sequence
+    assert index.search("anan") == [1]
+    assert index.search("nanab") == []
+    # Repeated trigrams are stored once per row
+    assert index._postings["ana"] == [1]
+    # Queries shorter than a trigram are answered by their posting list
+    assert index._postings["ap"] == [0, 2, 3]
+    assert index.search("N") == [1, 2]
+
+    index.append(["Apple pie"])
+    assert index.search("apple") == [0, 2, 4]
+    index.clear()
+    assert not len(index)
+    assert index.search("apple") == []
+
+
+def test_change_rows() -> None:
+    """Test that inserted, changed and removed rows update the index."""
+    index = ItemSearchIndex()
+    index.append(["Apple", "Banana", "Pineapple", "Grape"])
+    index.insert(1, ["Cherry", "Apricot"])
+    assert index.search("ap") == [0, 2, 4, 5]
+    assert index.search("ch") == [1]
+
+    index.replace(4, ["Peach"])
+    assert index.search("apple") == [0]
+    assert index.search("each") == [4]
+
+    # Removing rows only records the shift of the following rows
+    postings = dict(index._postings)
+    index.remove(0, 1)
+    assert index._postings == postings
+    assert index._shifts == [(1, 2), (0, -2)]
+    assert index.search("ap") == [0, 3]
+    assert index._postings["ap"] == [0, 3]
+    assert index.search("an") == [1]
+    assert len(index) == 4
+
+    # Appending applies the recorded shifts to all posting lists
+    index.append(["Ananas"])
+    assert not index._shifts
+    assert index._postings["e"] == [2, 3]
+    assert index.search("anas") == [4]
+    assert index.search("c") == [0, 2]
+
+
+def test_result_model(qtbot: QtBot) -> None:
+    """Test that the result model shows and edits the source rows."""
+    source = QStandardItemModel()
+    for text in ("Apple", "Banana", "Pineapple"):
+        item = QStandardItem(text)
+        item.setCheckable(True)
+        source.appendRow(item)
+    model = SearchResultModel(source)
+    assert model.rowCount() == 0
+    model.set_rows([0, 2])
+    assert model.rowCount() == 2
+    assert model.rowCount(model.index(0, 0)) == 0
+    assert model.source_rows == [0, 2]
+    assert model.source_row(1) == 2
+    assert model.index(1, 0).data() == "Pineapple"
+    assert model.flags(model.index(1, 0)) == source.flags(source.index(2, 0))
+
+    with qtbot.waitSignal(model.dataChanged):
+        assert model.setData(
+            model.index(1, 0),
+            Qt.CheckState.Checked.value,
+            Qt.ItemDataRole.CheckStateRole,
+        )
+    assert source.item(2).checkState() == Qt.CheckState.Checked
@@ -0,0 +1,74 @@
+"""Tests for the SnapshotSlide."""
+
+import pytest
+from PySide6.QtCore import QRect, Qt
+from PySide6.QtGui import QColor
+from PySide6.QtWidgets import QFrame, QHBoxLayout, QWidget
+from pytestqt.qtbot import QtBot
+
+from qute_style.widgets.snapshot_slide import SnapshotSlide
+
+
+def create_row(qtbot: QtBot, moving_edge: Qt.Edge) -> tuple[QWidget, QFrame]:
+    """Create a red frame next to a blue neighbor (on the moving edge)."""
+    window = QWidget()
+    qtbot.addWidget(window)
+    window.setFixedSize(300, 100)
+    layout = QHBoxLayout(window)
+    layout.setContentsMargins(0, 0, 0, 0)
+    layout.setSpacing(0)
+    frame = QFrame()
+    frame.setStyleSheet("background-color: red;")
+    frame.setFixedWidth(0)
+    neighbor = QFrame()
+    neighbor.setStyleSheet("background-color: blue;")
+    layout.addWidget(neighbor)
+    layout.insertWidget(1 if moving_edge == Qt.Edge.LeftEdge else 0, frame)
+    window.show()
+    qtbot.waitExposed(window)
+    return window, frame
+
+
+@pytest.mark.parametrize("moving_edge", (Qt.Edge.LeftEdge, Qt.Edge.RightEdge))
+def test_slide(qtbot: QtBot, moving_edge: Qt.Edge) -> None:
+    """Test that the frame is resized at once and the overlay animated."""
+    window, frame = create_row(qtbot, moving_edge)
+    slide = SnapshotSlide(frame, 0, 100, moving_edge)
+    assert frame.width() == 100
+    assert slide.isVisible()
+    assert slide.geometry() == QRect(0, 0, 300, 100)
+    assert slide.animation.startValue() == 0
+    assert slide.animation.endValue() == 100
+
+    slide.slide_width = 50
+    image = slide.grab().toImage()
+    frame_x, neighbor_x = (
+        (25, 275) if moving_edge == Qt.Edge.RightEdge else (275, 25)
+    )
+    assert image.pixelColor(frame_x, 50) == QColor("red")
+    assert image.pixelColor(neighbor_x, 50) == QColor("blue")
+    assert image.pixelColor(150, 50) == QColor("blue")
+
+    with qtbot.waitSignal(slide.animation.finished):
+        slide.animation.start()
+    assert slide.isHidden()
+    assert window.grab().toImage().pixelColor(frame_x, 50) == QColor("red")
+
+
+def test_stop(qtbot: QtBot) -> None:
+    """Test that a running slide is removed and its width returned."""
+    _, frame = create_row(qtbot, Qt.Edge.RightEdge)
+    assert SnapshotSlide.stop(frame) == 0
+    slide = SnapshotSlide(frame, 0, 100)
+    slide.slide_width = 30
+    assert SnapshotSlide.stop(frame) == 30
+    assert slide.isHidden()
+    assert SnapshotSlide.stop(frame) == 100
+
+    # A new slide continues the running slide and closes the frame.
+    slide = SnapshotSlide(frame, 100, 0)
+    assert frame.width() == 0
+    other = SnapshotSlide(frame, slide.slide_width, 100)
+    assert slide.isHidden()
+    assert other.isVisible()
+    assert frame.width() == 100
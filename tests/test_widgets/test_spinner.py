@@ -1,10 +1,14 @@
 """Test for spinner widget."""
 
+# pylint: disable=protected-access
+from PySide6.QtCore import QSize
 from PySide6.QtGui import QColor
 from PySide6.QtWidgets import QWidget
 from pytestqt.qtbot import QtBot
 
-from qute_style.widgets.spinner import WaitingSpinner
+from qute_style.animation_policy import AnimationPolicy, AnimationPolicyManager
+from qute_style.dev.mocks import check_call
+from qute_style.widgets.spinner import SpinnerClock, WaitingSpinner
 
 
 def test_spinner_properties(qtbot: QtBot) -> None:
@@ -48,3 +52,84 @@ def test_spinning(qtbot: QtBot) -> None:
     assert spinner.is_spinning is True
     spinner.stop()
     assert spinner.is_spinning is False
+
+
+def test_animation_policy(qtbot: QtBot) -> None:
+    """Check that the spinners follow the AnimationPolicy."""
+    widget = QWidget()
+    qtbot.addWidget(widget)
+    widget.show()
+    spinner = WaitingSpinner(widget)
+    clock = SpinnerClock.inst()
+    manager = AnimationPolicyManager.inst()
+
+    manager.policy = AnimationPolicy.OFF
+    spinner.start()
+    assert not clock.is_ticking
+
+    manager.policy = AnimationPolicy.REDUCED
+    assert clock.is_ticking
+    assert clock._timer.interval() == 2 * spinner._interval
+
+    manager.policy = AnimationPolicy.FULL
+    assert clock._timer.interval() == spinner._interval
+    spinner.stop()
+    assert not clock.is_ticking
+    manager.policy = AnimationPolicy.REDUCED
+    assert not clock.is_ticking
+
+
+def test_clock(qtbot: QtBot) -> None:
+    """Check that the clock only advances visible spinners."""
+    widget = QWidget()
+    qtbot.addWidget(widget)
+    widget.show()
+    qtbot.waitExposed(widget)
+    visible = WaitingSpinner(widget, lines=10, speed=10)
+    hidden = WaitingSpinner(widget, lines=10, speed=1)
+    clock = SpinnerClock.inst()
+    visible.start()
+    hidden.start()
+    hidden.hide()
+    assert clock._timer.interval() == visible._interval
+
+    # The frame follows the time since the spinner was started.
+    visible._advance(visible._start_time + 3 * visible._interval)
+    assert visible._current_counter == 3
+    visible._advance(visible._start_time + 13 * visible._interval)
+    assert visible._current_counter == 3
+
+    with check_call(WaitingSpinner, "_advance", call_count=1) as calls:
+        clock._tick()
+    assert calls[0][0][0] is visible
+    assert clock.is_ticking
+
+    # The clock stops without visible spinners and is woken by a paint.
+    visible.hide()
+    clock._tick()
+    assert not clock.is_ticking
+    hidden.show()
+    qtbot.waitUntil(lambda: clock.is_ticking)
+
+    hidden.stop()
+    visible.stop()
+    assert not clock.is_ticking
+
+
+def test_strip(qtbot: QtBot) -> None:
+    """Check that the frames are cached in a strip shared by spinners."""
+    widget = QWidget()
+    qtbot.addWidget(widget)
+    WaitingSpinner._strips.clear()
+    spinner = WaitingSpinner(widget, roundness=0, lines=4, color=QColor("red"))
+    other = WaitingSpinner(widget, roundness=0, lines=4, color=QColor("red"))
+    strip = spinner._strip()
+    size = spinner.width()
+    assert strip.size() == QSize(4 * size, size) * strip.devicePixelRatio()
+    assert other._strip() is strip
+    image = spinner.grab().toImage()
+    assert image.pixelColor(size - 6, size // 2) == QColor("red")
+
+    other.color = QColor("blue")
+    assert other._strip() is not strip
+    assert len(WaitingSpinner._strips) == 2
@@ -0,0 +1,78 @@
+"""Tests for the StyledComboBox painting."""
+
+from collections.abc import Callable
+
+import pytest
+from PySide6.QtWidgets import QApplication, QComboBox, QTableView, QWidget
+from pytestqt.qtbot import QtBot
+
+from qute_style.dev.mocks import check_call
+from qute_style.qute_style import QuteStyle
+from qute_style.style import get_style
+from qute_style.widgets.styled_combobox import StyledComboBox
+
+
+def create_combo_box(qtbot: QtBot) -> StyledComboBox:
+    """Create a visible StyledComboBox."""
+    combo_box = StyledComboBox()
+    qtbot.addWidget(combo_box)
+    combo_box.addItems(["First", "Second"])
+    combo_box.show()
+    qtbot.waitExposed(combo_box)
+    return combo_box
+
+
+def test_paint(qtbot: QtBot, qapp: QApplication) -> None:
+    """Test that QuteStyle paints the combo box in a single pass."""
+    qapp.setStyle(QuteStyle())
+    combo_box = create_combo_box(qtbot)
+    with check_call(QuteStyle, "draw_combo_box"), check_call(
+        QuteStyle, "draw_combo_box_label"
+    ) as calls, check_call(QComboBox, "paintEvent", call_count=0):
+        combo_box.grab()
+    assert calls[0][0][1].currentText == "First"
+
+
+def test_paint_fallback(qtbot: QtBot, qapp: QApplication) -> None:
+    """Test that the combo box is painted by Qt without QuteStyle."""
+    qapp.setStyle("Fusion")
+    combo_box = create_combo_box(qtbot)
+    with check_call(QuteStyle, "draw_combo_box", call_count=0), check_call(
+        QComboBox, "paintEvent"
+    ):
+        combo_box.grab()
+
+
+@pytest.mark.parametrize(
+    "setup",
+    (
+        lambda combo_box: combo_box.setProperty("cssClass", "transparent"),
+        lambda combo_box: combo_box.setStyleSheet("color: red;"),
+        lambda combo_box: combo_box.parentWidget().setStyleSheet(
+            "QComboBox { border-radius: 0px; }"
+        ),
+        lambda combo_box: combo_box.setParent(
+            QTableView(combo_box.parentWidget())
+        ),
+    ),
+    ids=("css class", "own style sheet", "parent style sheet", "item view"),
+)
+def test_paint_style_sheet(
+    qtbot: QtBot, qapp: QApplication, setup: Callable[[QComboBox], None]
+) -> None:
+    """Test that other style sheet rules are drawn by the style sheet."""
+    qapp.setStyle(QuteStyle())
+    widget = QWidget()
+    qtbot.addWidget(widget)
+    widget.setStyleSheet(get_style())
+    combo_box = StyledComboBox(widget)
+    combo_box.addItems(["First", "Second"])
+    widget.show()
+    with check_call(QuteStyle, "draw_combo_box"):
+        combo_box.grab()
+
+    setup(combo_box)
+    with check_call(QuteStyle, "draw_combo_box", call_count=0), check_call(
+        QComboBox, "paintEvent"
+    ):
+        combo_box.grab()
@@ -2,8 +2,9 @@
 
 import pytest
 from PySide6.QtGui import QFont, QFontMetrics
+from PySide6.QtWidgets import QApplication
 
-from qute_style.widgets.text_truncator import TextTruncator
+from qute_style.widgets.text_truncator import TextTruncator, TruncationCache
 
 
 @pytest.mark.parametrize(
@@ -27,3 +28,69 @@ def test_truncate_text(text: str, width: int, expected: str) -> None:
 
     # Assert
     assert result.text() == expected
+
+
+def test_truncation_cache(qapp: QApplication) -> None:
+    """Test that texts are cached by width bucket and font."""
+    # pylint: disable=unused-argument
+    cache = TruncationCache(width_bucket=4)
+    truncator = TextTruncator(cache)
+    font = QFont("Segoe UI", 9)
+    bold_font = QFont("Segoe UI", 9, QFont.Weight.Bold)
+    text = truncator.truncate_text("Text", 101, QFontMetrics(font), font)
+    # Widths within a bucket share the text
+    assert truncator.truncate_text("Text", 102, QFontMetrics(font), font) is (
+        text
+    )
+    assert len(cache) == 1
+    truncator.truncate_text("Text", 96, QFontMetrics(font), font)
+    truncator.truncate_text("Text", 101, QFontMetrics(bold_font), bold_font)
+    assert len(cache) == 3
+    assert {key[1:] for key in cache._texts} == {
+        (25, font.key()),
+        (24, font.key()),
+        (25, bold_font.key()),
+    }
+
+    # Without a font, the texts are cached by text and width per truncator
+    truncator._font_metrics = QFontMetrics(font)
+    text = truncator.truncate_text("Text", 101)
+    assert text.text() == "Text"
+    assert truncator.truncate_text("Text", 101) is text
+    texts = truncator.truncate_many(["A", "Text"], 101)
+    assert [text.text() for text in texts] == ["A", "Text"]
+    assert texts[1] is text
+    assert set(truncator._metrics_cache._texts) == {
+        ("Text", 101, ""),
+        ("A", 101, ""),
+    }
+    assert len(cache) == 3
+    cache.clear()
+    assert not len(cache)
+    assert not cache.size
+
+
+def test_truncation_cache_eviction(qapp: QApplication) -> None:
+    """Test that the least recently used texts are evicted."""
+    # pylint: disable=unused-argument
+    cache = TruncationCache(max_bytes=1000)
+    metrics = QFontMetrics(QFont("Segoe UI", 9))
+    texts = cache.truncate_many(["A", "B", "C"], 100, metrics, "font")
+    assert [text.text() for text in texts] == ["A", "B", "C"]
+    entry_size = cache.size // 3
+    assert cache.size == 3 * entry_size
+
+    # "A" is used again, "B" is evicted first
+    assert cache.truncate("A", 100, metrics, "font") is texts[0]
+    cache.truncate_many(["D", "E", "F"], 100, metrics, "font")
+    assert cache.size <= 1000
+    assert [key[0] for key in cache._texts] == ["A", "C", "D", "E", "F"][
+        -len(cache) :
+    ]
+    assert ("B", 25, "font") not in cache._texts
+
+
+def test_shared_cache() -> None:
+    """Test that TextTruncators share the process-wide cache by default."""
+    assert TextTruncator()._truncation_cache is TruncationCache.inst()
+    assert TruncationCache.inst() is TruncationCache.inst()
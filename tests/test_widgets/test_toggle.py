@@ -1,11 +1,13 @@
 """Tests for homepage."""
 
 # pylint: disable=protected-access
+import pytest
 from PySide6.QtCore import QSize, Qt
 from PySide6.QtGui import QFontMetrics
 from PySide6.QtWidgets import QStyleOption
 from pytestqt.qtbot import QtBot
 
+from qute_style.animation_policy import AnimationPolicy, AnimationPolicyManager
 from qute_style.qute_style import QuteStyle
 from qute_style.widgets.toggle import Toggle
 
@@ -54,3 +56,24 @@ def test_size_hint(qtbot: QtBot) -> None:
             QuteStyle.ToggleOptions.BOX_HEIGHT,
         )
     assert not exceptions
+
+
+@pytest.mark.parametrize(
+    "policy, duration",
+    (
+        (AnimationPolicy.FULL, QuteStyle.ToggleOptions.ANIM_DURATION),
+        (AnimationPolicy.OFF, 0),
+    ),
+)
+def test_animation_policy(
+    qtbot: QtBot, policy: AnimationPolicy, duration: int
+) -> None:
+    """Test that the toggle animation follows the AnimationPolicy."""
+    toggle = Toggle()
+    qtbot.addWidget(toggle)
+    AnimationPolicyManager.inst().policy = policy
+    toggle.setChecked(True)
+    assert toggle._animation.duration() == duration
+    if policy == AnimationPolicy.OFF:
+        # The circle jumps to its end position.
+        assert toggle.position == toggle._animation.endValue()